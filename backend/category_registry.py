@@ -0,0 +1,138 @@
+"""직군 마스터 데이터 레지스트리
+
+job_categories.json 을 프로세스당 한 번만 읽고, 파일 mtime 이 바뀌면 다시 읽는다.
+필터링에 필요한 파생 데이터(허용 키워드 집합, 제목 키워드, 매칭기)도 함께 보관해
+warm Lambda 컨테이너에서는 직군 조회 비용이 거의 들지 않는다.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    from keyword_matcher import KeywordMatcher
+except ImportError:
+    from backend.keyword_matcher import KeywordMatcher
+
+DATA_PATH = Path(__file__).parent / "data" / "job_categories.json"
+
+# mtime 확인 간격(초) - 매 호출마다 stat 하지 않도록
+CHECK_INTERVAL = 5.0
+
+# 직군별로 보관할 사용자 지정 허용 키워드 매칭기 수
+MATCHER_CACHE_SIZE = 64
+
+
+@dataclass
+class CategoryEntry:
+    """직군 하나와 파생 데이터"""
+    id: str
+    data: dict
+    base_allowed: frozenset[str]      # 직군명 + 별칭 (항상 허용)
+    default_allowed: frozenset[str]   # 직군명 + 별칭 + 핵심 + 보조
+    title_keywords: tuple[str, ...]   # 제목 필터용 (소문자)
+    default_matcher: KeywordMatcher
+    _matchers: dict = field(default_factory=dict, repr=False)
+    # FastAPI 스레드 풀에서 동시에 호출되므로 _matchers 조회/제거/추가는 락 안에서
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def allowed_for(self, allowed_keywords: list[str] | None) -> frozenset[str]:
+        """허용 키워드 집합 (None이면 직군 기본값)"""
+        if allowed_keywords is None:
+            return self.default_allowed
+        return self.base_allowed | {kw.lower() for kw in allowed_keywords}
+
+    def matcher_for(self, allowed_keywords: list[str] | None) -> KeywordMatcher:
+        """허용 키워드 조합별 매칭기 (조합마다 한 번만 컴파일)"""
+        if allowed_keywords is None:
+            return self.default_matcher
+        allowed = self.allowed_for(allowed_keywords)
+        with self._lock:
+            matcher = self._matchers.get(allowed)
+        if matcher is not None:
+            return matcher
+        # 컴파일은 락 밖에서 (동시에 같은 조합을 만들면 먼저 넣은 것을 사용)
+        matcher = KeywordMatcher(allowed)
+        with self._lock:
+            if allowed not in self._matchers and len(self._matchers) >= MATCHER_CACHE_SIZE:
+                # 가장 오래된 조합부터 제거
+                self._matchers.pop(next(iter(self._matchers)))
+            return self._matchers.setdefault(allowed, matcher)
+
+
+def _build_entry(category_id: str, data: dict) -> CategoryEntry:
+    base = frozenset(
+        kw.lower() for kw in [data["name"]] + data.get("aliases", [])
+    )
+    default = base | {
+        kw.lower() for kw in data["core_keywords"] + data["auxiliary_keywords"]
+    }
+    return CategoryEntry(
+        id=category_id,
+        data=data,
+        base_allowed=base,
+        default_allowed=default,
+        title_keywords=tuple(kw.lower() for kw in data.get("title_keywords", [data["name"]])),
+        default_matcher=KeywordMatcher(default),
+    )
+
+
+class CategoryRegistry:
+    """job_categories.json 캐시 (mtime 변경 시 자동 재로드)"""
+
+    def __init__(self, path: Path = DATA_PATH, check_interval: float = CHECK_INTERVAL):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime_ns: int | None = None
+        self._checked_at = 0.0
+        self._categories: dict = {}
+        self._entries: dict[str, CategoryEntry] = {}
+
+    def _ensure_loaded(self) -> None:
+        now = time.monotonic()
+        if self._mtime_ns is not None and now - self._checked_at < self.check_interval:
+            return
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        self._checked_at = now
+        if mtime_ns == self._mtime_ns:
+            return
+        with self._lock:
+            if mtime_ns == self._mtime_ns:
+                return
+            with open(self.path, encoding="utf-8") as f:
+                categories = json.load(f)["job_categories"]
+            self._entries = {k: _build_entry(k, v) for k, v in categories.items()}
+            self._categories = categories
+            self._mtime_ns = mtime_ns
+
+    @property
+    def categories(self) -> dict:
+        """직군 원본 데이터 (공유 객체이므로 수정 금지)"""
+        self._ensure_loaded()
+        return self._categories
+
+    def get(self, category_id: str) -> CategoryEntry:
+        """직군 조회 (없으면 KeyError)"""
+        self._ensure_loaded()
+        return self._entries[category_id]
+
+    def __contains__(self, category_id: str) -> bool:
+        self._ensure_loaded()
+        return category_id in self._entries
+
+
+registry = CategoryRegistry()
+
+
+def get_categories() -> dict:
+    """전체 직군 원본 데이터"""
+    return registry.categories
+
+
+def get_category(category_id: str) -> CategoryEntry:
+    """직군 하나와 파생 데이터"""
+    return registry.get(category_id)
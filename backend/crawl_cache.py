@@ -0,0 +1,283 @@
+"""크롤링 결과 캐시 - (사이트, 키워드, 페이지, tag_id) 단위 TTL + LRU
+
+같은 직군을 연달아 검색하거나 페이지를 넘길 때 사이트를 다시 크롤링하지 않도록
+각 크롤러의 crawl_page() 결과를 페이지 단위로 저장한다.
+
+백엔드
+    memory: 프로세스 메모리 (warm Lambda 컨테이너 내에서 재사용)
+    sqlite: 로컬 파일 (여러 워커/프로세스가 공유, 로컬 개발 서버나 Lambda /tmp)
+
+환경 변수
+    CRAWL_CACHE_BACKEND      memory | sqlite | off (기본 memory)
+    CRAWL_CACHE_TTL          초 단위 TTL (기본 300)
+    CRAWL_CACHE_MAX_ENTRIES  최대 항목 수, 초과 시 가장 오래 안 쓴 항목부터 제거 (기본 1024)
+    CRAWL_CACHE_PATH         sqlite 파일 경로 (기본 /tmp/job-finder-crawl-cache.sqlite3)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+
+try:
+    from crawlers.http_client import fetch
+    from crawlers.saramin import JobPosting
+    from metrics import span
+    from source_health import source_health
+except ImportError:
+    from backend.crawlers.http_client import fetch
+    from backend.crawlers.saramin import JobPosting
+    from backend.metrics import span
+    from backend.source_health import source_health
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_SQLITE_PATH = "/tmp/job-finder-crawl-cache.sqlite3"
+
+
+def make_key(source: str, keyword: str, page: int, tag_id: int | None = None) -> str:
+    """캐시 키 (키워드는 대소문자/앞뒤 공백 무시)"""
+    return f"{source}|{keyword.strip().lower()}|{page}|{tag_id if tag_id is not None else ''}"
+
+
+class MemoryBackend:
+    """프로세스 메모리 캐시 (OrderedDict 기반 LRU)"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, tuple | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bool, list[JobPosting] | None]:
+        """(hit 여부, 값) 반환"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return False, None
+            expires_at, value = item
+            if expires_at < time.time():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+        return True, (list(value) if value is not None else None)
+
+    def set(self, key: str, value: list[JobPosting] | None) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + self.ttl, tuple(value) if value is not None else None)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteBackend:
+    """로컬 SQLite 파일 캐시 (프로세스 간 공유, accessed_at 기반 LRU)"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS crawl_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS crawl_cache_accessed ON crawl_cache (accessed_at)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않음
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> tuple[bool, list[JobPosting] | None]:
+        conn = self._conn()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires_at FROM crawl_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        value, expires_at = row
+        with conn:
+            if expires_at < now:
+                conn.execute("DELETE FROM crawl_cache WHERE key = ?", (key,))
+                return False, None
+            conn.execute("UPDATE crawl_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        items = json.loads(value)
+        if items is None:
+            return True, None
+        return True, [JobPosting(**p) for p in items]
+
+    def set(self, key: str, value: list[JobPosting] | None) -> None:
+        payload = json.dumps(
+            [asdict(p) for p in value] if value is not None else None,
+            ensure_ascii=False,
+        )
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO crawl_cache (key, value, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, payload, now + self.ttl, now),
+            )
+            conn.execute("DELETE FROM crawl_cache WHERE expires_at < ?", (now,))
+            conn.execute(
+                "DELETE FROM crawl_cache WHERE key IN ("
+                " SELECT key FROM crawl_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM crawl_cache")
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM crawl_cache").fetchone()[0]
+
+
+class CrawlCache:
+    """크롤러 페이지 결과 캐시 + hit/miss 통계"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def lookup(self, source: str, keyword: str, page: int, tag_id: int | None = None):
+        """(hit 여부, 값) - 값이 None이면 마지막 페이지 이후"""
+        if self.backend is None:
+            return False, None
+        hit, value = self.backend.get(make_key(source, keyword, page, tag_id))
+        self._count(hit)
+        return hit, value
+
+    def store(self, source: str, keyword: str, page: int, value, tag_id: int | None = None) -> None:
+        if self.backend is not None:
+            self.backend.set(make_key(source, keyword, page, tag_id), value)
+
+    def crawl(self, crawler, source: str, keyword: str, pages: int = 1, until=None, **kwargs) -> list[JobPosting]:
+        """crawler.crawl()과 같은 결과를 페이지 단위 캐시를 거쳐 반환
+
+        crawler 모듈은 page_request(keyword, page, **kwargs)와 parse_page(text, keyword)를 제공해야 한다
+        (HTTP 요청이 아닌 크롤러는 fetch_page(req)도 제공).
+        until(postings)가 참인 페이지에서 멈춘다 (증분 크롤링 - 이미 본 공고만 나온 페이지 등).
+        """
+        results = []
+        for page in range(1, pages + 1):
+            postings = self.crawl_page(crawler, source, keyword, page, **kwargs)
+            if postings is None:
+                break
+            results.extend(postings)
+            if until is not None and until(postings):
+                break
+        return results
+
+    def crawl_page(self, crawler, source: str, keyword: str, page: int, **kwargs) -> list[JobPosting] | None:
+        """한 페이지 결과 (None이면 마지막 페이지 이후)"""
+        tag_id = kwargs.get("tag_id")
+        hit, postings = self.lookup(source, keyword, page, tag_id)
+        if not hit:
+            # crawler.crawl_page()와 같지만 요청/파싱 시간을 따로 기록
+            # 브라우저로 렌더링하는 크롤러(잡코리아)는 자체 fetch_page 사용
+            fetch_page = getattr(crawler, "fetch_page", fetch)
+            with span("fetch", source), source_health.track(source):
+                text = fetch_page(crawler.page_request(keyword, page, **kwargs))
+            with span("parse", source):
+                postings = crawler.parse_page(text, keyword)
+            self.store(source, keyword, page, postings, tag_id)
+        return postings
+
+    async def crawl_page_async(
+        self, engine, crawler, source: str, keyword: str, page: int, **kwargs,
+    ) -> list[JobPosting] | None:
+        """crawl_page()의 비동기 버전"""
+        tag_id = kwargs.get("tag_id")
+        hit, postings = self.lookup(source, keyword, page, tag_id)
+        if not hit:
+            postings = await engine.crawl_page(crawler, keyword, page, **kwargs)
+            self.store(source, keyword, page, postings, tag_id)
+        return postings
+
+    async def crawl_async(
+        self, engine, crawler, source: str, keyword: str, pages: int = 1, until=None, **kwargs,
+    ) -> list[JobPosting]:
+        """crawl()의 비동기 버전 - 캐시에 없는 페이지만 engine으로 동시에 요청"""
+        tag_id = kwargs.get("tag_id")
+        known = {}
+        for page in range(1, pages + 1):
+            hit, postings = self.lookup(source, keyword, page, tag_id)
+            if hit:
+                known[page] = postings
+
+        def _store(page, postings):
+            self.store(source, keyword, page, postings, tag_id)
+
+        return await engine.crawl(crawler, keyword, pages, known=known, on_fetched=_store, until=until, **kwargs)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else "off",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "entries": len(self.backend) if self.backend is not None else 0,
+            "ttl": self.backend.ttl if self.backend is not None else 0,
+        }
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+def _backend_from_env():
+    kind = os.environ.get("CRAWL_CACHE_BACKEND", "memory").lower()
+    ttl = float(os.environ.get("CRAWL_CACHE_TTL", DEFAULT_TTL))
+    max_entries = int(os.environ.get("CRAWL_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    if kind == "off" or ttl <= 0:
+        return None
+    if kind == "sqlite":
+        path = os.environ.get("CRAWL_CACHE_PATH", DEFAULT_SQLITE_PATH)
+        return SQLiteBackend(path, ttl=ttl, max_entries=max_entries)
+    return MemoryBackend(ttl=ttl, max_entries=max_entries)
+
+
+crawl_cache = CrawlCache(_backend_from_env())
@@ -1,8 +1,43 @@
-"""크롤러 Lambda 핸들러 - Step Functions에서 호출"""
+"""크롤러 Lambda 핸들러 - Step Functions에서 호출
 
-from dataclasses import asdict
-from crawlers import saramin, wanted, incruit, remember, rallit, jumpit
-from crawlers.wanted import TAG_MAP as WANTED_TAG_MAP
+API Lambda가 crawl_plan()으로 만든 (사이트, 페이지) 작업 목록을 상태 머신의 Map 상태가
+최대 CRAWL_MAX_CONCURRENCY개씩 동시에 이 핸들러로 실행한다. 로컬 스레드 경로(main._run_plan_threads)도
+같은 작업 목록을 같은 핸들러로 실행한다. 서킷이 열린 사이트(source_health)는 크롤링하지 않고
+마지막으로 성공한 결과(stale)나 빈 결과로 바로 응답한다.
+
+환경 변수
+    CRAWL_MAX_CONCURRENCY  동시에 실행할 작업 수 (기본 10, Map 상태 MaxConcurrency로 전달)
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+try:
+    from crawlers import saramin, wanted, incruit, remember, rallit, jumpit, jobkorea
+    from crawlers.wanted import TAG_MAP as WANTED_TAG_MAP
+    from crawl_cache import crawl_cache
+    from result_transport import result_transport
+    import metrics
+    from source_health import source_health
+except ImportError:
+    from backend.crawlers import saramin, wanted, incruit, remember, rallit, jumpit, jobkorea
+    from backend.crawlers.wanted import TAG_MAP as WANTED_TAG_MAP
+    from backend.crawl_cache import crawl_cache
+    from backend.result_transport import result_transport
+    from backend import metrics
+    from backend.source_health import source_health
+
+try:
+    from crawlers.async_engine import engine as crawl_engine
+except ImportError:
+    try:
+        from backend.crawlers.async_engine import engine as crawl_engine
+    except ImportError:
+        crawl_engine = None
+
+MAX_CONCURRENCY = int(os.environ.get("CRAWL_MAX_CONCURRENCY", 10))
 
 CRAWLERS = {
     "saramin": saramin,
@@ -12,27 +47,139 @@ CRAWLERS = {
     "rallit": rallit,
     "jumpit": jumpit,
 }
+# 잡코리아는 Playwright가 설치된 환경(로컬, 컨테이너 이미지)에서만 (crawlers/browser_pool.py)
+if jobkorea.available():
+    CRAWLERS["jobkorea"] = jobkorea
+
+
+def crawl_plan(
+    keyword: str, category: str | None, pages: int, deadline_at: float | None = None, crawlers=None,
+) -> list[dict]:
+    """(사이트, 페이지) 작업 목록 - Step Functions Map 상태와 로컬 스레드 경로가 같은 목록을 실행
+
+    작업 순서(사이트 → 페이지)가 결과 공고 순서다. deadline_at(unix time 초)은 작업마다 남은 예산을
+    계산하는 기준이라 동시 실행 수 제한으로 늦게 시작한 작업도 전체 예산을 넘기지 않는다.
+    """
+    return [
+        {
+            "crawler": name, "keyword": keyword, "category": category, "page": page,
+            "deadline_at": deadline_at,
+        }
+        for name in (crawlers or CRAWLERS)
+        for page in range(1, pages + 1)
+    ]
+
+
+def crawler_kwargs(crawler_name: str, category: str | None) -> dict:
+    """사이트별 crawl kwargs (원티드는 직군 태그)"""
+    if crawler_name == "wanted" and category:
+        return {"tag_id": WANTED_TAG_MAP.get(category)}
+    return {}
+
+
+def last_good_key(event: dict) -> tuple:
+    """작업의 last good 결과 키 (사이트, 검색어, 직군, 페이지 또는 전체 페이지 수)"""
+    page = event.get("page")
+    return (
+        event["crawler"], event["keyword"].strip().lower(), event.get("category"),
+        page, event.get("pages", 1) if page is None else None,
+    )
+
+
+def circuit_open_result(event: dict) -> dict:
+    """서킷이 열린 사이트의 작업 결과 - 크롤링하지 않고 last good 결과(있으면 stale)로 응답"""
+    meta = {"crawler": event["crawler"], "circuit": "open"}
+    if event.get("page") is not None:
+        meta.update(keyword=event["keyword"], category=event.get("category"), page=event["page"])
+    postings = source_health.last_good(last_good_key(event))
+    if postings is None:
+        return {**meta, "postings": []}
+    return {**meta, **result_transport.pack(postings), "stale": True}
+
+
+def output_status(output: dict) -> str:
+    """작업 결과의 사이트 상태 - ok는 실제로 크롤링에 성공한 결과만
+
+    late: 응답 시간 예산 초과, error: 실패, stale/skipped: 서킷이 열려 last good 결과로 대신함/결과 없음
+    """
+    if output.get("late"):
+        return "late"
+    if "error" in output:
+        return "error"
+    if "circuit" in output:
+        return "stale" if output.get("stale") else "skipped"
+    return "ok"
 
 
 def handler(event, context):
-    """개별 크롤러 실행 후 결과 반환"""
+    """크롤러 실행 후 결과 반환
+
+    event에 page가 있으면 그 한 페이지만 (crawl_plan 작업), 없으면 1 ~ pages 페이지 전체를 크롤링한다.
+    결과의 timings는 이 작업의 단계별 소요 시간(ms) - Step Functions 경로에서 API 응답의 Server-Timing에 합친다.
+    """
+    with metrics.collect() as timings:
+        result = _handle(event)
+    result["timings"] = timings.as_dict()
+    return result
+
+
+def _handle(event) -> dict:
     crawler_name = event["crawler"]
     keyword = event["keyword"]
+    page = event.get("page")
     pages = event.get("pages", 1)
     category = event.get("category")
+    # 남은 응답 시간 예산 - 넘기면 이 사이트(페이지)는 late로 빈 결과 반환
+    deadline_ms = event.get("deadline_ms")
+    if event.get("deadline_at"):
+        deadline_ms = max(0, int((event["deadline_at"] - time.time()) * 1000))
+    meta = {"crawler": crawler_name}
+    if page is not None:
+        meta.update(keyword=keyword, category=category, page=page)
 
     crawler = CRAWLERS.get(crawler_name)
     if not crawler:
-        return {"postings": [], "error": f"알 수 없는 크롤러: {crawler_name}"}
+        return {**meta, "postings": [], "error": f"알 수 없는 크롤러: {crawler_name}"}
+    # 최근 실패가 잦은 사이트는 냉각 시간 동안 호출하지 않음 (source_health)
+    if not source_health.allow(crawler_name):
+        return circuit_open_result(event)
 
     try:
-        if crawler_name == "wanted" and category:
-            tag_id = WANTED_TAG_MAP.get(category)
-            postings = crawler.crawl(keyword, pages=pages, tag_id=tag_id)
+        kwargs = crawler_kwargs(crawler_name, category)
+
+        # warm 컨테이너에서는 같은 (키워드, 페이지) 결과를 캐시에서 재사용,
+        # 캐시에 없는 페이지는 공유 커넥션 풀로 동시에 요청
+        timeout = deadline_ms / 1000 if deadline_ms is not None else None
+        if timeout == 0:
+            raise TimeoutError
+        if crawl_engine is not None:
+            if page is None:
+                coro = crawl_cache.crawl_async(crawl_engine, crawler, crawler_name, keyword, pages=pages, **kwargs)
+            else:
+                coro = crawl_cache.crawl_page_async(crawl_engine, crawler, crawler_name, keyword, page, **kwargs)
+            postings = crawl_engine.run(coro, timeout=timeout)
         else:
-            postings = crawler.crawl(keyword, pages=pages)
+            if page is None:
+                call = partial(crawl_cache.crawl, crawler, crawler_name, keyword, pages=pages, **kwargs)
+            else:
+                call = partial(crawl_cache.crawl_page, crawler, crawler_name, keyword, page, **kwargs)
+            pool = ThreadPoolExecutor(max_workers=1)
+            try:
+                postings = pool.submit(metrics.bind(call)).result(timeout)
+            finally:
+                # 예산 초과 시 기다리지 않고 반환 (진행 중인 크롤링 결과는 캐시에 남음)
+                pool.shutdown(wait=False)
 
-        return {"postings": [asdict(p) for p in postings]}
+        if postings is None:
+            # 한 페이지 작업에서 None은 마지막 페이지 이후 - 이 사이트의 다음 페이지 결과는 버림
+            meta["end"] = True
+        else:
+            source_health.remember(last_good_key(event), postings)
+        # 공고는 압축/열 단위로 인라인 전달하거나, 크면 블롭 저장소에 쓰고 키만 전달 (result_transport)
+        return {**meta, **result_transport.pack(postings or []), "cache": crawl_cache.stats()}
+    except TimeoutError:
+        print(f"[{crawler_name}] 응답 시간 예산({deadline_ms}ms) 초과")
+        return {**meta, "postings": [], "late": True}
     except Exception as e:
         print(f"[{crawler_name}] 크롤링 실패: {e}")
-        return {"postings": [], "error": str(e)}
+        return {**meta, "postings": [], "error": str(e)}
@@ -0,0 +1,261 @@
+"""asyncio 크롤링 엔진 - 모든 사이트가 공유하는 keep-alive 커넥션 풀
+
+전용 이벤트 루프 스레드에서 httpx.AsyncClient 하나를 유지하고, 모든 사이트/페이지 요청을
+동시에 보낸다. 호스트별 동시 요청 수는 세마포어로, 요청 속도는 토큰 버킷(rate_limit)으로 제한한다.
+동기 코드(FastAPI sync 엔드포인트, Lambda 핸들러)는 run()으로, 다른 이벤트 루프의
+async 코드는 submit() + asyncio.wrap_future()로 사용한다.
+
+헤지 요청(선택): 요청이 그 호스트의 최근 p90 응답 시간을 넘기면 같은 요청을 한 번 더 보내고
+먼저 성공한 응답을 쓴다. 두 번째 요청도 토큰 버킷을 거치므로 사이트별 요청 속도 제한은 유지된다.
+
+환경 변수
+    CRAWL_PER_HOST_LIMIT  호스트별 최대 동시 요청 수 (기본 4)
+    CRAWL_HEDGE           1이면 헤지 요청 사용 (기본 0)
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+
+import httpx
+
+try:
+    from crawlers.saramin import JobPosting
+    from crawlers.http_client import DEFAULT_TIMEOUT, POOL_SIZE, PageRequest
+    from crawlers.rate_limit import bucket_for
+    from crawlers.transport import transport
+    from metrics import span
+    from source_health import source_health
+except ImportError:
+    from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.http_client import DEFAULT_TIMEOUT, POOL_SIZE, PageRequest
+    from backend.crawlers.rate_limit import bucket_for
+    from backend.crawlers.transport import transport
+    from backend.metrics import span
+    from backend.source_health import source_health
+
+PER_HOST_LIMIT = int(os.environ.get("CRAWL_PER_HOST_LIMIT", 4))
+HEDGE = os.environ.get("CRAWL_HEDGE", "0") == "1"
+
+
+class LatencyWindow:
+    """최근 응답 시간(초) 슬라이딩 윈도우"""
+
+    def __init__(self, size: int = 100, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """q 분위 응답 시간 (표본이 min_samples보다 적으면 None)"""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _in_context(context: contextvars.Context, coro):
+    """context의 변수 값을 설정한 뒤 coro 실행 (엔진 루프 작업은 루프 스레드의 컨텍스트로 시작하므로)"""
+    for var, value in context.items():
+        var.set(value)
+    return await coro
+
+
+class AsyncCrawlEngine:
+    """공유 httpx 클라이언트 + 호스트별 동시성 제한"""
+
+    def __init__(self, per_host_limit: int = PER_HOST_LIMIT, hedge: bool = HEDGE):
+        self.per_host_limit = per_host_limit
+        self.hedge = hedge
+        self.hedged = 0   # 보낸 헤지 요청 수
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._latency: dict[str, LatencyWindow] = {}
+        self._start_lock = threading.Lock()
+
+    # --- 이벤트 루프 관리 ---
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="crawl-engine", daemon=True)
+                thread.start()
+                self._loop = loop
+        return self._loop
+
+    def submit(self, coro) -> Future:
+        """엔진 루프에서 코루틴 실행 (concurrent.futures.Future 반환)
+
+        호출한 쪽의 contextvars(요청별 타이밍 등)를 엔진 루프 작업에 이어 준다.
+        """
+        return asyncio.run_coroutine_threadsafe(_in_context(contextvars.copy_context(), coro), self._ensure_started())
+
+    def run(self, coro, timeout: float | None = None):
+        """동기 코드에서 코루틴 실행 후 결과 대기"""
+        return self.submit(coro).result(timeout)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # 엔진 루프 안에서만 호출됨
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=DEFAULT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=POOL_SIZE * 4,
+                    max_keepalive_connections=POOL_SIZE * 2,
+                ),
+                follow_redirects=True,
+            )
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        sem = self._host_limits.get(host)
+        if sem is None:
+            sem = self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return sem
+
+    def latency(self, url: str) -> LatencyWindow:
+        host = urlsplit(url).netloc
+        window = self._latency.get(host)
+        if window is None:
+            window = self._latency[host] = LatencyWindow()
+        return window
+
+    # --- 요청 / 크롤링 ---
+
+    async def fetch(self, req: PageRequest) -> str:
+        """비동기 요청 후 응답 본문 반환 (4xx/5xx는 예외)
+
+        hedge가 켜져 있고 호스트의 p90을 알면, p90 안에 끝나지 않은 요청을 한 번 더 보낸다.
+        """
+        hedge_after = self.latency(req.url).percentile(0.9) if self.hedge else None
+        if hedge_after is None:
+            return await self._fetch_once(req)
+
+        primary = asyncio.ensure_future(self._fetch_once(req))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                self.hedged += 1
+                tasks.add(asyncio.ensure_future(self._fetch_once(req)))
+            # 먼저 성공한 응답 사용, 둘 다 실패하면 마지막 예외
+            while True:
+                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    return done.pop().result()
+                tasks = pending
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_once(self, req: PageRequest) -> str:
+        if transport.replaying:
+            # 재생 모드 - 토큰 버킷 없이 호스트 동시성 제한과 응답 시간 기록만 실제와 같게
+            async with self._host_limit(req.url):
+                start = time.perf_counter()
+                await asyncio.sleep(transport.delay())
+                text = transport.replay(req)
+            self.latency(req.url).add(time.perf_counter() - start)
+            return text
+        if not transport.upstream:
+            await bucket_for(req.url).acquire_async()
+        async with self._host_limit(req.url):
+            start = time.perf_counter()
+            resp = await self._get_client().request(
+                req.method, transport.url_for(req.url),
+                params=req.params, json=req.json, headers=req.headers, timeout=req.timeout,
+            )
+        resp.raise_for_status()
+        self.latency(req.url).add(time.perf_counter() - start)
+        transport.record(req, resp.text)
+        return resp.text
+
+    async def crawl_page(self, crawler, keyword: str, page: int, **kwargs) -> list[JobPosting] | None:
+        """crawler.crawl_page()의 비동기 버전"""
+        source = crawler.__name__.rsplit(".", 1)[-1]
+        # 브라우저로 렌더링하는 크롤러(잡코리아)는 자체 fetch_page_async 사용
+        fetch = getattr(crawler, "fetch_page_async", self.fetch)
+        with span("fetch", source), source_health.track(source):
+            text = await fetch(crawler.page_request(keyword, page, **kwargs))
+        with span("parse", source):
+            return crawler.parse_page(text, keyword)
+
+    async def crawl(
+        self,
+        crawler,
+        keyword: str,
+        pages: int = 1,
+        known: dict[int, list[JobPosting] | None] | None = None,
+        on_fetched=None,
+        until=None,
+        **kwargs,
+    ) -> list[JobPosting]:
+        """crawler.crawl()의 비동기 버전 - 모든 페이지를 동시에 요청
+
+        결과는 페이지 순서대로 합치고, 빈 페이지(None)를 만나면 남은 페이지 요청을 취소한다.
+
+        Args:
+            known: 이미 알고 있는 페이지 결과 (캐시 hit) - 요청하지 않음
+            on_fetched: 새로 가져온 페이지마다 on_fetched(page, postings) 호출
+            until: until(postings)가 참인 페이지 다음부터는 요청하지 않음 (증분 크롤링).
+                   다음 페이지가 필요한지 알아야 하므로 페이지를 하나씩 순서대로 요청한다.
+        """
+        known = known or {}
+        if until is not None:
+            return await self._crawl_until(crawler, keyword, pages, known, on_fetched, until, **kwargs)
+        tasks = {
+            page: asyncio.ensure_future(self.crawl_page(crawler, keyword, page, **kwargs))
+            for page in range(1, pages + 1)
+            if page not in known
+        }
+        results = []
+        try:
+            for page in range(1, pages + 1):
+                if page in known:
+                    postings = known[page]
+                else:
+                    postings = await tasks.pop(page)
+                    if on_fetched:
+                        on_fetched(page, postings)
+                if postings is None:
+                    break
+                results.extend(postings)
+        finally:
+            # 빈 페이지 이후 또는 실패 시 남은 요청 취소
+            for task in tasks.values():
+                task.cancel()
+        return results
+
+    async def _crawl_until(self, crawler, keyword, pages, known, on_fetched, until, **kwargs) -> list[JobPosting]:
+        results = []
+        for page in range(1, pages + 1):
+            if page in known:
+                postings = known[page]
+            else:
+                postings = await self.crawl_page(crawler, keyword, page, **kwargs)
+                if on_fetched:
+                    on_fetched(page, postings)
+            if postings is None:
+                break
+            results.extend(postings)
+            if until(postings):
+                break
+        return results
+
+
+engine = AsyncCrawlEngine()
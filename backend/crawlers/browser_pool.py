@@ -0,0 +1,165 @@
+"""헤드리스 Chromium 풀 - 클라이언트 렌더링 사이트(잡코리아)용
+
+호출마다 브라우저를 띄우고 고정 시간 기다리는 대신
+    - 전용 이벤트 루프 스레드에서 Chromium과 브라우저 컨텍스트를 프로세스 수명 동안 유지 (warm Lambda에서 재사용)
+    - 이미지/폰트/CSS/미디어 요청은 컨텍스트 라우트에서 차단
+    - 결과 선택자(wait_for)가 나타날 때까지만 기다림 (결과 없는 페이지는 선택자 대기 시간 후 그대로 반환)
+    - 최대 BROWSER_MAX_TABS개 탭에서 동시에 렌더링하고, 다 쓴 탭은 닫지 않고 다음 요청에 재사용
+브라우저가 죽으면 다음 요청에서 다시 띄운다. 동기 코드는 render(), 다른 이벤트 루프의 async 코드는
+render_async()를 쓴다 (Playwright 객체는 풀의 루프 밖에서 쓰지 않음).
+
+Playwright가 없으면 available()이 False이고 잡코리아 크롤러는 크롤러 목록에서 빠진다.
+
+환경 변수
+    BROWSER_MAX_TABS         동시에 렌더링할 탭 수 (기본 4)
+    BROWSER_NAV_TIMEOUT_MS   페이지 이동 제한 시간 (기본 15000)
+    BROWSER_WAIT_TIMEOUT_MS  결과 선택자 대기 제한 시간 (기본 5000)
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+
+try:
+    from playwright.async_api import Error as PlaywrightError
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+    PlaywrightError = Exception
+
+MAX_TABS = int(os.environ.get("BROWSER_MAX_TABS", 4))
+NAV_TIMEOUT_MS = int(os.environ.get("BROWSER_NAV_TIMEOUT_MS", 15000))
+WAIT_TIMEOUT_MS = int(os.environ.get("BROWSER_WAIT_TIMEOUT_MS", 5000))
+
+BLOCKED_RESOURCES = {"image", "font", "stylesheet", "media"}
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def available() -> bool:
+    return async_playwright is not None
+
+
+class BrowserPool:
+    """Chromium 하나 + 컨텍스트 하나 + 재사용 탭 (전용 이벤트 루프에서만 접근)"""
+
+    def __init__(self, max_tabs: int = MAX_TABS):
+        self.max_tabs = max_tabs
+        self.launches = 0   # 브라우저를 띄운 횟수 (재시작 포함)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._start_lock = threading.Lock()
+        # 아래는 풀 루프 안에서만 사용
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle: list = []
+        self._tabs: asyncio.Semaphore | None = None
+        self._launch_lock: asyncio.Lock | None = None
+
+    # --- 이벤트 루프 관리 ---
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+                thread.start()
+                self._loop = loop
+        return self._loop
+
+    def render(self, url: str, wait_for: str | None = None, timeout: float | None = None) -> str:
+        """동기 코드에서 렌더링한 HTML 반환"""
+        future = asyncio.run_coroutine_threadsafe(self._render(url, wait_for), self._ensure_started())
+        return future.result(timeout)
+
+    async def render_async(self, url: str, wait_for: str | None = None) -> str:
+        """다른 이벤트 루프(크롤링 엔진 등)에서 렌더링한 HTML 반환"""
+        future = asyncio.run_coroutine_threadsafe(self._render(url, wait_for), self._ensure_started())
+        return await asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(10)
+        except Exception as e:
+            print(f"브라우저 풀 종료 실패: {e}")
+
+    # --- 풀 루프 안 ---
+
+    async def _ensure_browser(self):
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+            self._tabs = asyncio.Semaphore(self.max_tabs)
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._context
+            await self._shutdown()
+            if async_playwright is None:
+                raise RuntimeError("Playwright가 설치되어 있지 않습니다")
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._context = await self._browser.new_context(user_agent=USER_AGENT)
+            self._context.set_default_navigation_timeout(NAV_TIMEOUT_MS)
+            await self._context.route("**/*", _block_heavy_resources)
+            self.launches += 1
+            return self._context
+
+    async def _render(self, url: str, wait_for: str | None) -> str:
+        context = await self._ensure_browser()
+        async with self._tabs:
+            page = self._idle.pop() if self._idle else await context.new_page()
+            reusable = False
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+                if wait_for:
+                    try:
+                        await page.wait_for_selector(wait_for, timeout=WAIT_TIMEOUT_MS)
+                    except PlaywrightError:
+                        # 결과가 없는 페이지 - 선택자 없이 렌더링된 그대로 반환
+                        pass
+                html = await page.content()
+                reusable = True
+                return html
+            finally:
+                if reusable and page.context is self._context and not page.is_closed():
+                    self._idle.append(page)
+                else:
+                    await _close_quietly(page)
+
+    async def _shutdown(self) -> None:
+        self._idle.clear()
+        for resource in (self._context, self._browser):
+            await _close_quietly(resource)
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+        self._playwright = self._browser = self._context = None
+
+
+async def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _close_quietly(resource) -> None:
+    if resource is None:
+        return
+    try:
+        await resource.close()
+    except Exception:
+        pass
+
+
+# 프로세스 전체에서 공유하는 브라우저 풀
+browser_pool = BrowserPool()
+atexit.register(browser_pool.close)
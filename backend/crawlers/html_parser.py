@@ -0,0 +1,121 @@
+"""HTML 파서 백엔드 선택 계층
+
+HTML 크롤러(saramin, incruit, linkedin, jobkorea)는 이 모듈의 parse_html()로 만든 노드만
+사용한다. C 기반 파서(selectolax/lexbor)가 있으면 그것을 쓰고, 없으면 BeautifulSoup
+(html.parser)로 대체한다. 어떤 백엔드든 같은 JobPosting이 나오도록 텍스트 추출 규칙을
+BeautifulSoup 기준에 맞춘다.
+    text(strip=True)  == Tag.get_text(strip=True)   (텍스트 노드별 strip 후 이어 붙임)
+    text()            == Tag.get_text()
+    attr(name)        == Tag.get(name, "")
+
+환경 변수
+    HTML_PARSER  selectolax | bs4 (기본: selectolax가 설치돼 있으면 selectolax)
+"""
+
+import os
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+class SoupNode:
+    """BeautifulSoup Tag 래퍼"""
+
+    __slots__ = ("_el",)
+
+    def __init__(self, el):
+        self._el = el
+
+    def select(self, css: str) -> list["SoupNode"]:
+        return [SoupNode(el) for el in self._el.select(css)]
+
+    def select_one(self, css: str) -> "SoupNode | None":
+        el = self._el.select_one(css)
+        return SoupNode(el) if el is not None else None
+
+    def text(self, strip: bool = False) -> str:
+        return self._el.get_text(strip=strip)
+
+    def attr(self, name: str, default: str = "") -> str:
+        return self._el.get(name, default)
+
+    @property
+    def classes(self) -> list[str]:
+        return self._el.get("class", [])
+
+    @property
+    def parent(self) -> "SoupNode | None":
+        el = self._el.parent
+        return SoupNode(el) if el is not None else None
+
+    def __eq__(self, other):
+        return isinstance(other, SoupNode) and self._el is other._el
+
+    def __hash__(self):
+        return id(self._el)
+
+
+class LexborNode:
+    """selectolax(lexbor) Node 래퍼"""
+
+    __slots__ = ("_el",)
+
+    def __init__(self, el):
+        self._el = el
+
+    def select(self, css: str) -> list["LexborNode"]:
+        return [LexborNode(el) for el in self._el.css(css)]
+
+    def select_one(self, css: str) -> "LexborNode | None":
+        el = self._el.css_first(css)
+        return LexborNode(el) if el is not None else None
+
+    def text(self, strip: bool = False) -> str:
+        return self._el.text(deep=True, separator="", strip=strip)
+
+    def attr(self, name: str, default: str = "") -> str:
+        attrs = self._el.attributes
+        if name not in attrs:
+            return default
+        # 값 없는 속성(<a href>)은 bs4처럼 빈 문자열
+        return attrs[name] or ""
+
+    @property
+    def classes(self) -> list[str]:
+        return (self._el.attributes.get("class") or "").split()
+
+    @property
+    def parent(self) -> "LexborNode | None":
+        el = self._el.parent
+        return LexborNode(el) if el is not None else None
+
+    def __eq__(self, other):
+        return isinstance(other, LexborNode) and self._el == other._el
+
+    def __hash__(self):
+        return hash(self._el.mem_id)
+
+
+BACKENDS = {}
+if LexborHTMLParser is not None:
+    BACKENDS["selectolax"] = lambda html: LexborNode(LexborHTMLParser(html).root)
+BACKENDS["bs4"] = lambda html: SoupNode(BeautifulSoup(html, "html.parser"))
+
+
+def _default_backend() -> str:
+    name = os.environ.get("HTML_PARSER")
+    if name in BACKENDS:
+        return name
+    return next(iter(BACKENDS))
+
+
+BACKEND = _default_backend()
+
+
+def parse_html(html: str, backend: str | None = None):
+    """HTML 문서를 파싱해 루트 노드 반환 (backend를 지정하지 않으면 BACKEND)"""
+    return BACKENDS[backend or BACKEND](html)
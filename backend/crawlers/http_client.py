@@ -0,0 +1,88 @@
+"""크롤러 공통 HTTP 계층
+
+각 크롤러는 page_request()로 요청 명세(PageRequest)를 만들고 parse_page()로 응답 본문을
+파싱한다. 실제 전송은 여기서 담당하므로 동기(requests)와 비동기(httpx) 경로가 같은
+요청/파싱 코드를 공유한다. 동기 crawl()의 페이지들은 crawl_pages()로 동시에 요청한다. 녹화/재생 모드(CRAWL_TRANSPORT)는 transport 모듈 참고.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from crawlers.rate_limit import bucket_for
+    from crawlers.transport import transport
+except ImportError:
+    from backend.crawlers.rate_limit import bucket_for
+    from backend.crawlers.transport import transport
+
+DEFAULT_TIMEOUT = 10
+POOL_SIZE = 16
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """크롤러 한 페이지 요청 명세"""
+    method: str
+    url: str
+    params: dict | None = None
+    json: dict | None = None
+    headers: dict = field(default_factory=dict)
+    timeout: float = DEFAULT_TIMEOUT
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 프로세스 전체에서 공유하는 keep-alive 세션 (warm Lambda 에서 연결 재사용)
+session = _build_session()
+
+
+def fetch(req: PageRequest) -> str:
+    """동기 요청 후 응답 본문 반환 (4xx/5xx는 예외)"""
+    if transport.replaying:
+        time.sleep(transport.delay())
+        return transport.replay(req)
+    if not transport.upstream:
+        bucket_for(req.url).acquire()
+    resp = session.request(
+        req.method, transport.url_for(req.url),
+        params=req.params, json=req.json, headers=req.headers, timeout=req.timeout,
+    )
+    resp.raise_for_status()
+    transport.record(req, resp.text)
+    return resp.text
+
+
+def crawl_pages(crawl_page, pages: int, max_workers: int = POOL_SIZE) -> list:
+    """1 ~ pages 페이지를 동시에 요청해 페이지 순서대로 합친 결과 (크롤러 동기 crawl()용)
+
+    AsyncCrawlEngine.crawl과 같은 규칙으로, crawl_page(page)가 None을 반환한 페이지(마지막 페이지 이후)를
+    만나면 남은 요청을 취소하고 그 뒤 페이지의 결과/예외는 버린다.
+    같은 호스트 요청 간격은 토큰 버킷이 조절하므로 동시에 보내도 사이트 요청 속도는 같다.
+    """
+    if pages <= 1:
+        postings = crawl_page(1) if pages == 1 else None
+        return list(postings or [])
+
+    pool = ThreadPoolExecutor(max_workers=min(pages, max_workers))
+    futures = [pool.submit(crawl_page, page) for page in range(1, pages + 1)]
+    results = []
+    try:
+        for future in futures:
+            postings = future.result()
+            if postings is None:
+                break
+            results.extend(postings)
+    finally:
+        # 빈 페이지 이후 또는 실패 시 남은 요청 취소 (이미 진행 중인 요청은 기다리지 않음)
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
@@ -1,11 +1,13 @@
 """인크루트 채용 공고 크롤러"""
 
-import requests
-from bs4 import BeautifulSoup
 try:
     from crawlers.saramin import JobPosting
+    from crawlers.http_client import PageRequest, crawl_pages, fetch
+    from crawlers.html_parser import parse_html
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.http_client import PageRequest, crawl_pages, fetch
+    from backend.crawlers.html_parser import parse_html
 
 BASE_URL = "https://search.incruit.com/list/search.asp"
 HEADERS = {
@@ -16,19 +18,27 @@ HEADERS = {
 
 def crawl(keyword: str, pages: int = 1) -> list[JobPosting]:
     """인크루트에서 키워드로 채용 공고를 검색하여 반환"""
-    results = []
+    return crawl_pages(lambda page: crawl_page(keyword, page), pages)
+
+
+def crawl_page(keyword: str, page: int) -> list[JobPosting]:
+    """인크루트 검색 결과 한 페이지 (page는 1부터)"""
+    return parse_page(fetch(page_request(keyword, page)), keyword)
 
-    for page in range(1, pages + 1):
-        params = {"col": "job", "kw": keyword, "page": page}
-        resp = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=10)
-        resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        for item in soup.select(".c_col"):
-            posting = _parse_item(item)
-            if posting:
-                results.append(posting)
+def page_request(keyword: str, page: int) -> PageRequest:
+    """한 페이지 요청 명세"""
+    params = {"col": "job", "kw": keyword, "page": page}
+    return PageRequest("GET", BASE_URL, params=params, headers=HEADERS)
 
+
+def parse_page(text: str, keyword: str) -> list[JobPosting]:
+    """검색 결과 HTML 파싱"""
+    results = []
+    for item in parse_html(text).select(".c_col"):
+        posting = _parse_item(item)
+        if posting:
+            results.append(posting)
     return results
 
 
@@ -38,11 +48,11 @@ def _parse_item(item) -> JobPosting | None:
     if not title_el:
         return None
 
-    title = title_el.get_text(strip=True)
-    company = company_el.get_text(strip=True) if company_el else "N/A"
-    link = title_el.get("href", "")
+    title = title_el.text(strip=True)
+    company = company_el.text(strip=True) if company_el else "N/A"
+    link = title_el.attr("href")
     conditions = [
-        el.get_text(strip=True)
+        el.text(strip=True)
         for el in item.select(".cell_mid .cl_md span")
     ]
 
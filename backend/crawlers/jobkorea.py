@@ -1,54 +1,97 @@
-"""잡코리아 채용 공고 크롤러 (Playwright 기반)"""
+"""잡코리아 채용 공고 크롤러 (Playwright 기반)
+
+검색 결과가 클라이언트에서 렌더링되므로 HTTP 요청 대신 공유 브라우저 풀(browser_pool)의 탭에서 렌더링한다.
+다른 크롤러와 같은 page_request() / parse_page() 인터페이스를 쓰고, 요청 전송만 fetch_page()(동기)와
+fetch_page_async()(크롤링 엔진)가 대신한다 (crawl_cache, async_engine이 이 함수를 우선 사용).
+"""
+
+from urllib.parse import urlencode
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
 try:
     from crawlers.saramin import JobPosting
+    from crawlers.html_parser import parse_html
+    from crawlers.http_client import PageRequest, crawl_pages
+    from crawlers.browser_pool import available, browser_pool
+    from crawlers.rate_limit import bucket_for
+    from crawlers.transport import transport
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.html_parser import parse_html
+    from backend.crawlers.http_client import PageRequest, crawl_pages
+    from backend.crawlers.browser_pool import available, browser_pool
+    from backend.crawlers.rate_limit import bucket_for
+    from backend.crawlers.transport import transport
 
 
 BASE_URL = "https://www.jobkorea.co.kr/Search/"
+# 공고 링크가 나타나면 렌더링 완료로 봄
+RESULT_SELECTOR = 'a[href*="/Recruit/GI_Read/"]'
 
 
 def crawl(keyword: str, pages: int = 1) -> list[JobPosting]:
-    """잡코리아에서 키워드로 채용 공고를 검색하여 반환"""
-    results = []
+    """잡코리아에서 키워드로 채용 공고를 검색하여 반환 (페이지들은 브라우저 풀의 탭에서 동시에 렌더링)"""
+    return crawl_pages(lambda page: crawl_page(keyword, page), pages, max_workers=browser_pool.max_tabs)
+
+
+def crawl_page(keyword: str, page: int) -> list[JobPosting] | None:
+    """잡코리아 검색 결과 한 페이지 (page는 1부터, 결과가 없으면 None)"""
+    return parse_page(fetch_page(page_request(keyword, page)), keyword)
+
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.set_extra_http_headers({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                          "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        })
+def page_request(keyword: str, page: int) -> PageRequest:
+    """한 페이지 요청 명세 (브라우저로 여는 URL)"""
+    params = {"stext": keyword, "tabType": "recruit", "Page_No": page}
+    return PageRequest("GET", BASE_URL, params=params)
 
-        for pg in range(1, pages + 1):
-            url = f"{BASE_URL}?stext={keyword}&tabType=recruit&Page_No={pg}"
-            page.goto(url, timeout=15000)
-            page.wait_for_timeout(5000)
 
-            html = page.content()
-            postings = _parse_page(html)
-            results.extend(postings)
+def _url(req: PageRequest) -> str:
+    return transport.url_for(req.url) + "?" + urlencode(req.params or {})
 
-        browser.close()
 
-    return results
+def fetch_page(req: PageRequest) -> str:
+    """브라우저 풀에서 렌더링한 HTML (녹화/재생 모드는 transport를 따름)"""
+    if transport.replaying:
+        return transport.replay(req)
+    if not transport.upstream:
+        bucket_for(req.url).acquire()
+    html = browser_pool.render(_url(req), RESULT_SELECTOR)
+    transport.record(req, html)
+    return html
+
+
+async def fetch_page_async(req: PageRequest) -> str:
+    """fetch_page()의 비동기 버전"""
+    if transport.replaying:
+        return transport.replay(req)
+    if not transport.upstream:
+        await bucket_for(req.url).acquire_async()
+    html = await browser_pool.render_async(_url(req), RESULT_SELECTOR)
+    transport.record(req, html)
+    return html
+
+
+def parse_page(text: str, keyword: str) -> list[JobPosting] | None:
+    """렌더링된 검색 결과 HTML 파싱 (공고가 없으면 None - 마지막 페이지 이후)"""
+    return _parse_page(text) or None
 
 
 def _parse_page(html: str) -> list[JobPosting]:
     """페이지 HTML에서 공고 파싱"""
-    soup = BeautifulSoup(html, "html.parser")
+    root = parse_html(html)
     postings = []
 
+    # href별 링크 목록 (회사명 링크 조회용)
+    links_by_href = {}
+    for a in root.select("a[href]"):
+        links_by_href.setdefault(a.attr("href"), []).append(a)
+
     # 공고 링크 수집 (중복 제거)
     seen_urls = set()
-    job_links = soup.find_all("a", href=lambda h: h and "/Recruit/GI_Read/" in h)
+    job_links = root.select('a[href*="/Recruit/GI_Read/"]')
 
     for link in job_links:
-        href = link["href"]
-        text = link.get_text(strip=True)
+        href = link.attr("href")
+        text = link.text(strip=True)
 
         # URL 기준 중복 제거
         base_url = href.split("?")[0]
@@ -56,12 +99,12 @@ def _parse_page(html: str) -> list[JobPosting]:
             continue
 
         # 제목이 있는 링크 (회사명 링크는 짧은 경우가 많음)
-        parent_class = " ".join(link.parent.get("class", []))
+        parent_class = " ".join(link.parent.classes)
 
         if "mb_space" in parent_class:
             # 제목 링크
             title = text
-            company = _find_company(link, href, soup)
+            company = _find_company(link, links_by_href.get(href, []))
             keywords = _find_keywords(link)
 
             seen_urls.add(base_url)
@@ -77,12 +120,12 @@ def _parse_page(html: str) -> list[JobPosting]:
     return postings
 
 
-def _find_company(title_link, href: str, soup) -> str:
+def _find_company(title_link, same_href_links: list) -> str:
     """제목 링크 근처에서 회사명 찾기"""
     # 같은 href를 가진 다른 링크 중 회사명 찾기
-    for a in soup.find_all("a", href=href):
+    for a in same_href_links:
         if a != title_link:
-            text = a.get_text(strip=True)
+            text = a.text(strip=True)
             if text and len(text) < 50:
                 return text
     return "N/A"
@@ -100,8 +143,8 @@ def _find_keywords(title_link) -> list[str]:
     noise = {"스크랩", "즉시 지원", "•", "합격축하금", "경력", "신입", "신입·경력"}
 
     keywords = []
-    for span in container.find_all("span"):
-        text = span.get_text(strip=True)
+    for span in container.select("span"):
+        text = span.text(strip=True)
         if not text or len(text) > 30:
             continue
         if "등록" in text or "마감" in text or "만원" in text:
@@ -1,11 +1,13 @@
 """점핏 채용 공고 크롤러 (REST API)"""
 
+import json
 import re
-import requests
 try:
     from crawlers.saramin import JobPosting
+    from crawlers.http_client import PageRequest, crawl_pages, fetch
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.http_client import PageRequest, crawl_pages, fetch
 
 API_URL = "https://jumpit-api.saramin.co.kr/api/positions"
 
@@ -20,36 +22,46 @@ LOCATION_TAG = {
 
 def crawl(keyword: str, pages: int = 1, location: str | None = None) -> list[JobPosting]:
     """점핏에서 키워드로 채용 공고 검색"""
-    results = []
+    return crawl_pages(lambda page: crawl_page(keyword, page, location=location), pages)
+
+
+def crawl_page(keyword: str, page: int, location: str | None = None) -> list[JobPosting]:
+    """점핏 검색 결과 한 페이지 (page는 1부터)"""
+    return parse_page(fetch(page_request(keyword, page, location=location)), keyword)
+
 
-    for page in range(1, pages + 1):
-        params = {"keyword": keyword, "sort": "relation", "page": page}
-        if location and location in LOCATION_TAG:
-            params["locationTag"] = LOCATION_TAG[location]
-
-        resp = requests.get(API_URL, params=params, timeout=10)
-        data = resp.json().get("result", {})
-
-        for p in data.get("positions", []):
-            # 제목에서 <span> 태그 제거
-            title = re.sub(r"<[^>]+>", "", p.get("title", ""))
-            conditions = p.get("locations", [])
-            # 경력
-            min_c = p.get("minCareer")
-            max_c = p.get("maxCareer")
-            if min_c is not None and max_c and max_c > min_c:
-                conditions.append(f"경력 {min_c}~{max_c}년")
-            elif min_c == 0 and max_c == 0:
-                conditions.append("신입")
-            elif min_c:
-                conditions.append(f"경력 {min_c}년↑")
-            results.append(JobPosting(
-                company=p.get("companyName", ""),
-                title=title,
-                link=f"https://www.jumpit.co.kr/position/{p['id']}",
-                conditions=conditions,
-                keywords=p.get("techStacks", []),
-                source="jumpit",
-            ))
+def page_request(keyword: str, page: int, location: str | None = None) -> PageRequest:
+    """한 페이지 요청 명세"""
+    params = {"keyword": keyword, "sort": "relation", "page": page}
+    if location and location in LOCATION_TAG:
+        params["locationTag"] = LOCATION_TAG[location]
+    return PageRequest("GET", API_URL, params=params)
 
+
+def parse_page(text: str, keyword: str) -> list[JobPosting]:
+    """API 응답 파싱"""
+    data = json.loads(text).get("result", {})
+
+    results = []
+    for p in data.get("positions", []):
+        # 제목에서 <span> 태그 제거
+        title = re.sub(r"<[^>]+>", "", p.get("title", ""))
+        conditions = p.get("locations", [])
+        # 경력
+        min_c = p.get("minCareer")
+        max_c = p.get("maxCareer")
+        if min_c is not None and max_c and max_c > min_c:
+            conditions.append(f"경력 {min_c}~{max_c}년")
+        elif min_c == 0 and max_c == 0:
+            conditions.append("신입")
+        elif min_c:
+            conditions.append(f"경력 {min_c}년↑")
+        results.append(JobPosting(
+            company=p.get("companyName", ""),
+            title=title,
+            link=f"https://www.jumpit.co.kr/position/{p['id']}",
+            conditions=conditions,
+            keywords=p.get("techStacks", []),
+            source="jumpit",
+        ))
     return results
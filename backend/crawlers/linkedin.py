@@ -1,11 +1,13 @@
 """링크드인 채용 공고 크롤러"""
 
-import requests
-from bs4 import BeautifulSoup
 try:
     from crawlers.saramin import JobPosting
+    from crawlers.http_client import PageRequest, crawl_pages, fetch
+    from crawlers.html_parser import parse_html
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.http_client import PageRequest, crawl_pages, fetch
+    from backend.crawlers.html_parser import parse_html
 
 BASE_URL = "https://www.linkedin.com/jobs/search"
 HEADERS = {
@@ -19,23 +21,31 @@ def crawl(keyword: str, pages: int = 1) -> list[JobPosting]:
 
     참고: 비로그인 시 공고 수가 제한됨 (약 3개)
     """
-    results = []
+    return crawl_pages(lambda page: crawl_page(keyword, page), pages)
+
+
+def crawl_page(keyword: str, page: int) -> list[JobPosting]:
+    """링크드인 검색 결과 한 페이지 (page는 1부터, 페이지당 25개)"""
+    return parse_page(fetch(page_request(keyword, page)), keyword)
 
-    for page in range(pages):
-        params = {
-            "keywords": keyword,
-            "location": "South Korea",
-            "start": page * 25,
-        }
-        resp = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=10)
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        for card in soup.select(".base-card"):
-            posting = _parse_card(card)
-            if posting:
-                results.append(posting)
 
+def page_request(keyword: str, page: int) -> PageRequest:
+    """한 페이지 요청 명세"""
+    params = {
+        "keywords": keyword,
+        "location": "South Korea",
+        "start": (page - 1) * 25,
+    }
+    return PageRequest("GET", BASE_URL, params=params, headers=HEADERS)
+
+
+def parse_page(text: str, keyword: str) -> list[JobPosting]:
+    """검색 결과 HTML 파싱"""
+    results = []
+    for card in parse_html(text).select(".base-card"):
+        posting = _parse_card(card)
+        if posting:
+            results.append(posting)
     return results
 
 
@@ -48,10 +58,10 @@ def _parse_card(card) -> JobPosting | None:
     if not title_el:
         return None
 
-    title = title_el.get_text(strip=True)
-    company = company_el.get_text(strip=True) if company_el else "N/A"
-    location = location_el.get_text(strip=True) if location_el else ""
-    link = link_el.get("href", "") if link_el else ""
+    title = title_el.text(strip=True)
+    company = company_el.text(strip=True) if company_el else "N/A"
+    location = location_el.text(strip=True) if location_el else ""
+    link = link_el.attr("href") if link_el else ""
     # kr.linkedin.com → www.linkedin.com (앱 딥링크 지원)
     link = link.replace("://kr.linkedin.com/", "://www.linkedin.com/")
 
@@ -1,10 +1,12 @@
 """랠릿 채용 공고 크롤러 (API 기반)"""
 
-import requests
+import json
 try:
     from crawlers.saramin import JobPosting
+    from crawlers.http_client import PageRequest, crawl_pages, fetch
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.http_client import PageRequest, crawl_pages, fetch
 
 BASE_URL = "https://b2c-api.rallit.com/client/api/v1/position"
 HEADERS = {
@@ -24,26 +26,31 @@ REGION_MAP = {
 
 def crawl(keyword: str, pages: int = 1) -> list[JobPosting]:
     """랠릿에서 키워드로 채용 공고를 검색하여 반환"""
-    results = []
-
-    for page in range(1, pages + 1):
-        params = {
-            "keyword": keyword,
-            "pageNumber": page,
-            "pageSize": 20,
-            "isPublic": "false",
-        }
-        resp = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=10)
-        resp.raise_for_status()
-
-        items = resp.json().get("data", {}).get("items", [])
-        if not items:
-            break
-
-        for item in items:
-            results.append(_parse_item(item))
-
-    return results
+    return crawl_pages(lambda page: crawl_page(keyword, page), pages)
+
+
+def crawl_page(keyword: str, page: int) -> list[JobPosting] | None:
+    """랠릿 검색 결과 한 페이지 (page는 1부터, 결과가 없으면 None)"""
+    return parse_page(fetch(page_request(keyword, page)), keyword)
+
+
+def page_request(keyword: str, page: int) -> PageRequest:
+    """한 페이지 요청 명세"""
+    params = {
+        "keyword": keyword,
+        "pageNumber": page,
+        "pageSize": 20,
+        "isPublic": "false",
+    }
+    return PageRequest("GET", BASE_URL, params=params, headers=HEADERS)
+
+
+def parse_page(text: str, keyword: str) -> list[JobPosting] | None:
+    """API 응답 파싱 (결과가 없으면 None)"""
+    items = json.loads(text).get("data", {}).get("items", [])
+    if not items:
+        return None
+    return [_parse_item(item) for item in items]
 
 
 def _parse_item(item: dict) -> JobPosting:
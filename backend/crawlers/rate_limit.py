@@ -0,0 +1,81 @@
+"""호스트별 요청 속도 제한 (토큰 버킷)
+
+페이지 간 고정 sleep 대신 호스트마다 초당 요청 수(rate)와 순간 허용량(burst)을 둔다.
+동기 경로(http_client.fetch)와 비동기 경로(async_engine)가 같은 버킷을 공유한다.
+
+환경 변수
+    CRAWL_HOST_RATE   호스트별 기본 초당 요청 수 (기본 5)
+    CRAWL_HOST_BURST  호스트별 기본 버스트 (기본 5)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = float(os.environ.get("CRAWL_HOST_RATE", 5))
+DEFAULT_BURST = float(os.environ.get("CRAWL_HOST_BURST", 5))
+
+# 호스트별 (초당 요청 수, 버스트) - 기본값보다 보수적으로 다룰 사이트
+HOST_LIMITS = {
+    "www.saramin.co.kr": (1.0, 3),
+}
+
+
+class TokenBucket:
+    """예약 방식 토큰 버킷 - 토큰이 모자라면 채워질 때까지의 대기 시간을 돌려준다"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 대기해야 할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def refund(self) -> None:
+        """취소된 예약 반환"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    def acquire(self) -> None:
+        """동기 대기"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """비동기 대기 (취소되면 예약 반환)"""
+        wait = self.reserve()
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(url: str) -> TokenBucket:
+    """URL 호스트의 토큰 버킷 (프로세스 내 공유)"""
+    host = urlsplit(url).netloc
+    bucket = _buckets.get(host)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(host)
+            if bucket is None:
+                rate, burst = HOST_LIMITS.get(host, (DEFAULT_RATE, DEFAULT_BURST))
+                bucket = _buckets[host] = TokenBucket(rate, burst)
+    return bucket
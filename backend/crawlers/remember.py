@@ -1,10 +1,12 @@
 """리멤버 채용 공고 크롤러 (API 기반)"""
 
-import requests
+import json
 try:
     from crawlers.saramin import JobPosting
+    from crawlers.http_client import PageRequest, crawl_pages, fetch
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.http_client import PageRequest, crawl_pages, fetch
 
 BASE_URL = "https://career-api.rememberapp.co.kr/job_postings/search"
 HEADERS = {
@@ -17,35 +19,44 @@ HEADERS = {
 
 def crawl(keyword: str, pages: int = 1) -> list[JobPosting]:
     """리멤버에서 키워드로 채용 공고를 검색하여 반환"""
-    results = []
-
-    for page in range(1, pages + 1):
-        body = {
-            "search": {
-                "include_applied_job_posting": False,
-                "leader_position": False,
-                "organization_type": "all",
-                "application_type": "all",
-                "keywords": [keyword],
-            },
-            "sort": "starts_at_desc",
-            "ai_new_model": False,
-            "page": page,
-            "per": 30,
-            "new_function_score": False,
-        }
-        resp = requests.post(BASE_URL, json=body, headers=HEADERS, timeout=10)
-        resp.raise_for_status()
-
-        data = resp.json().get("data", [])
-        if not data:
-            break
-
-        for job in data:
-            posting = _parse_job(job)
-            if posting:
-                results.append(posting)
+    return crawl_pages(lambda page: crawl_page(keyword, page), pages)
+
+
+def crawl_page(keyword: str, page: int) -> list[JobPosting] | None:
+    """리멤버 검색 결과 한 페이지 (page는 1부터, 결과가 없으면 None)"""
+    return parse_page(fetch(page_request(keyword, page)), keyword)
+
+
+def page_request(keyword: str, page: int) -> PageRequest:
+    """한 페이지 요청 명세"""
+    body = {
+        "search": {
+            "include_applied_job_posting": False,
+            "leader_position": False,
+            "organization_type": "all",
+            "application_type": "all",
+            "keywords": [keyword],
+        },
+        "sort": "starts_at_desc",
+        "ai_new_model": False,
+        "page": page,
+        "per": 30,
+        "new_function_score": False,
+    }
+    return PageRequest("POST", BASE_URL, json=body, headers=HEADERS)
+
+
+def parse_page(text: str, keyword: str) -> list[JobPosting] | None:
+    """API 응답 파싱 (결과가 없으면 None)"""
+    data = json.loads(text).get("data", [])
+    if not data:
+        return None
 
+    results = []
+    for job in data:
+        posting = _parse_job(job)
+        if posting:
+            results.append(posting)
     return results
 
 
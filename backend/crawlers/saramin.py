@@ -1,20 +1,44 @@
 """사람인 채용 공고 크롤러"""
 
-import time
-import requests
-from bs4 import BeautifulSoup
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+try:
+    from crawlers.http_client import PageRequest, crawl_pages, fetch
+    from crawlers.html_parser import parse_html
+except ImportError:
+    from backend.crawlers.http_client import PageRequest, crawl_pages, fetch
+    from backend.crawlers.html_parser import parse_html
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPosting:
-    """채용 공고 데이터"""
+    """채용 공고 데이터
+
+    스냅샷/사전 계산 결과처럼 공고 수만 건을 메모리에 들고 있는 경우를 위해 __slots__를 쓰고,
+    여러 공고에 반복되는 회사명/사이트명/조건/키워드 문자열은 공유 어휘(_VOCAB)의 같은 객체로 바꿔 저장한다.
+    conditions/keywords는 리스트로 넘겨도 튜플로 저장된다.
+    """
     company: str
     title: str
     link: str
-    conditions: list[str]  # 지역, 경력, 학력, 고용형태
-    keywords: list[str]    # 직무 키워드
+    conditions: tuple[str, ...]  # 지역, 경력, 학력, 고용형태
+    keywords: tuple[str, ...]    # 직무 키워드
     source: str = "saramin"
+    links: dict[str, str] | None = None  # 사이트 간 중복 병합 시 사이트별 링크 (병합된 공고만)
+
+    def __post_init__(self):
+        if len(_VOCAB) > _VOCAB_MAX:
+            _VOCAB.clear()
+        shared = _VOCAB.setdefault
+        self.company = shared(self.company, self.company)
+        self.source = shared(self.source, self.source)
+        self.conditions = tuple(map(shared, self.conditions, self.conditions))
+        self.keywords = tuple(map(shared, self.keywords, self.keywords))
+
+
+# 공고 간 공유 문자열 (JSON 복원/파싱할 때마다 새로 만들어지는 같은 문자열을 하나로)
+# 실제 크롤링 결과 기준 수천 개 수준이라 상한을 넘으면 비우고 다시 채운다 (기존 공고는 영향 없음)
+_VOCAB: dict[str, str] = {}
+_VOCAB_MAX = 100_000
 
 
 BASE_URL = "https://www.saramin.co.kr/zf_user/search/recruit"
@@ -37,33 +61,36 @@ def crawl(keyword: str, pages: int = 1) -> list[JobPosting]:
     Returns:
         JobPosting 리스트
     """
-    results = []
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    # 페이지들은 동시에 요청 (간격은 http_client의 호스트별 토큰 버킷이 조절)
+    return crawl_pages(lambda page: crawl_page(keyword, page), pages)
+
 
-    for page in range(1, pages + 1):
-        if page > 1:
-            time.sleep(1)  # 페이지 간 딜레이
+def crawl_page(keyword: str, page: int) -> list[JobPosting]:
+    """사람인 검색 결과 한 페이지 (page는 1부터)"""
+    return parse_page(fetch(page_request(keyword, page)), keyword)
 
-        params = {
-            "searchType": "search",
-            "searchword": keyword,
-            "recruitPage": page,
-            "recruitSort": "relation",
-            "recruitPageCount": 40,
-        }
 
-        resp = session.get(BASE_URL, params=params, timeout=10)
-        resp.raise_for_status()
+def page_request(keyword: str, page: int) -> PageRequest:
+    """한 페이지 요청 명세"""
+    params = {
+        "searchType": "search",
+        "searchword": keyword,
+        "recruitPage": page,
+        "recruitSort": "relation",
+        "recruitPageCount": 40,
+    }
+    return PageRequest("GET", BASE_URL, params=params, headers=HEADERS)
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        items = soup.select(".item_recruit")
 
-        for item in items:
-            posting = _parse_item(item)
-            if posting:
-                results.append(posting)
+def parse_page(text: str, keyword: str) -> list[JobPosting]:
+    """검색 결과 HTML 파싱"""
+    items = parse_html(text).select(".item_recruit")
 
+    results = []
+    for item in items:
+        posting = _parse_item(item)
+        if posting:
+            results.append(posting)
     return results
 
 
@@ -73,27 +100,30 @@ def _parse_item(item) -> JobPosting | None:
     company_el = item.select_one(".corp_name a")
     if not company_el:
         return None
-    company = company_el.get_text(strip=True)
+    company = company_el.text(strip=True)
 
     # 제목 & 링크
     title_el = item.select_one(".job_tit a")
     if not title_el:
         return None
-    title = title_el.get_text(strip=True)
-    link = "https://www.saramin.co.kr" + title_el.get("href", "")
+    title = title_el.text(strip=True)
+    link = "https://www.saramin.co.kr" + title_el.attr("href")
 
     # 조건 (지역, 경력, 학력, 고용형태)
     conditions = [
-        el.get_text(strip=True)
+        el.text(strip=True)
         for el in item.select(".job_condition span")
     ]
 
-    # 직무 키워드
-    keywords = [
-        el.get_text(strip=True)
-        for el in item.select(".job_sector a, .job_sector span")
-        if el.get_text(strip=True) and "등록일" not in el.get_text() and "수정일" not in el.get_text()
-    ]
+    # 직무 키워드 (등록일/수정일 표시는 제외)
+    keywords = []
+    for el in item.select(".job_sector a, .job_sector span"):
+        text = el.text(strip=True)
+        if not text:
+            continue
+        raw = el.text()
+        if "등록일" not in raw and "수정일" not in raw:
+            keywords.append(text)
 
     return JobPosting(
         company=company,
@@ -0,0 +1,160 @@
+"""크롤러 HTTP 전송 모드 - 실제 요청(live) / 녹화(record) / 재생(replay)
+
+모든 크롤러 요청은 http_client.fetch(동기)와 async_engine(비동기)을 거치므로 여기서 모드를 바꾸면
+크롤러 코드 수정 없이 네트워크 없이 크롤링 경로를 실행할 수 있다 (벤치마크, 동시성/부하 테스트).
+
+    live    실제 사이트에 요청
+    record  실제 요청 후 성공한 응답 본문을 카세트 파일에 추가
+    replay  카세트에서 응답을 돌려줌 (네트워크/토큰 버킷 없음, 카세트에 없는 요청은 CassetteMiss)
+            CRAWL_REPLAY_LATENCY_MS ± CRAWL_REPLAY_JITTER_MS 만큼 지연해 실제 응답 시간을 흉내 낸다
+
+카세트는 gzip 압축 JSON Lines 파일 ({"k": 요청 키, "b": 응답 본문}) 한 개다. 요청 키는
+메서드 + URL + 정렬한 쿼리 파라미터 + JSON 본문이라 헤더(User-Agent 등)가 바뀌어도 같은 요청으로 본다.
+녹화는 줄마다 gzip 멤버를 이어 붙이고, 같은 키가 여러 번 있으면 마지막 응답을 쓴다.
+
+CRAWL_UPSTREAM을 주면 live/record 요청을 실제 사이트 대신 그 서버의 /{원래 호스트}{경로}로 보낸다
+(bench/mock_sites.py 모의 서버로 부하 테스트). 모의 서버가 자체 속도 제한(429)을 흉내 내므로 토큰 버킷은 건너뛴다.
+
+환경 변수
+    CRAWL_TRANSPORT          live | record | replay (기본 live)
+    CRAWL_CASSETTE           카세트 파일 경로 (기본 /tmp/job-finder-cassette.jsonl.gz)
+    CRAWL_REPLAY_LATENCY_MS  재생 시 응답 지연 (기본 0)
+    CRAWL_REPLAY_JITTER_MS   재생 시 지연 흔들림 폭 (기본 0, 지연 ± 이 값에서 균등 분포)
+    CRAWL_UPSTREAM           요청을 대신 받을 서버 (예: http://127.0.0.1:9000, 기본 없음)
+"""
+
+import gzip
+import json
+import os
+import random
+import threading
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+MODES = ("live", "record", "replay")
+DEFAULT_CASSETTE = "/tmp/job-finder-cassette.jsonl.gz"
+
+
+class CassetteMiss(LookupError):
+    """재생 모드에서 카세트에 없는 요청"""
+
+
+def request_key(req) -> str:
+    """카세트 키 - 메서드 + URL + 정렬한 쿼리 파라미터 + JSON 본문"""
+    key = f"{req.method.upper()} {req.url}"
+    if req.params:
+        key += "?" + urlencode(sorted((k, v) for k, v in req.params.items() if v is not None))
+    if req.json is not None:
+        key += " " + json.dumps(req.json, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return key
+
+
+class Cassette:
+    """녹화한 응답 본문 (요청 키 → 본문)"""
+
+    def __init__(self, path: str = DEFAULT_CASSETTE):
+        self.path = Path(path)
+        self._entries: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, str]:
+        if self._entries is None:
+            entries = {}
+            if self.path.exists():
+                with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            entries[entry["k"]] = entry["b"]
+            self._entries = entries
+        return self._entries
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, body: str) -> None:
+        line = json.dumps({"k": key, "b": body}, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._load()[key] = body
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+
+class Transport:
+    """전송 모드 + 카세트 + 재생 지연"""
+
+    def __init__(
+        self,
+        mode: str = "live",
+        cassette: Cassette | None = None,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        seed: int | None = None,
+        upstream: str | None = None,
+    ):
+        self.configure(mode, cassette, latency_ms, jitter_ms, seed, upstream)
+
+    def configure(
+        self,
+        mode: str = "live",
+        cassette: Cassette | None = None,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        seed: int | None = None,
+        upstream: str | None = None,
+    ) -> None:
+        """모드 변경 (벤치마크/테스트에서 프로세스 안에서 바꿀 때)"""
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 전송 모드: {mode} (live | record | replay)")
+        self.mode = mode
+        self.cassette = cassette if cassette is not None else Cassette()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self.upstream = upstream.rstrip("/") if upstream else None
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def url_for(self, url: str) -> str:
+        """실제로 요청할 URL (CRAWL_UPSTREAM이 있으면 {upstream}/{호스트}{경로})"""
+        if not self.upstream:
+            return url
+        parts = urlsplit(url)
+        return f"{self.upstream}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+    def delay(self) -> float:
+        """재생 응답 지연(초)"""
+        ms = self.latency_ms
+        if self.jitter_ms:
+            ms += self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, ms) / 1000
+
+    def replay(self, req) -> str:
+        """카세트의 응답 본문 (없으면 CassetteMiss)"""
+        key = request_key(req)
+        body = self.cassette.get(key)
+        if body is None:
+            raise CassetteMiss(f"카세트에 없는 요청: {key}")
+        return body
+
+    def record(self, req, body: str) -> None:
+        """녹화 모드면 응답 본문 저장 (다른 모드는 무시)"""
+        if self.mode == "record":
+            self.cassette.put(request_key(req), body)
+
+
+transport = Transport(
+    os.environ.get("CRAWL_TRANSPORT", "live").lower(),
+    Cassette(os.environ.get("CRAWL_CASSETTE", DEFAULT_CASSETTE)),
+    latency_ms=float(os.environ.get("CRAWL_REPLAY_LATENCY_MS", 0)),
+    jitter_ms=float(os.environ.get("CRAWL_REPLAY_JITTER_MS", 0)),
+    upstream=os.environ.get("CRAWL_UPSTREAM") or None,
+)
@@ -1,12 +1,15 @@
 """원티드 채용 공고 크롤러 (API 기반)"""
 
-import requests
+import json
 try:
     from crawlers.saramin import JobPosting
+    from crawlers.http_client import PageRequest, crawl_pages, fetch
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.crawlers.http_client import PageRequest, crawl_pages, fetch
 
 BASE_URL = "https://www.wanted.co.kr/api/v4/jobs"
+PAGE_LIMIT = 20
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                   "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -32,34 +35,41 @@ def crawl(keyword: str, pages: int = 1, tag_id: int | None = None) -> list[JobPo
         pages: 페이지 수 (1페이지 = 20개)
         tag_id: 원티드 직군 태그 ID (없으면 전체)
     """
-    results = []
-    limit = 20
-
-    for pg in range(pages):
-        params = {
-            "country": "kr",
-            "locations": "all",
-            "years": -1,
-            "limit": limit,
-            "offset": pg * limit,
-        }
-        if tag_id:
-            params["tag_type_ids"] = tag_id
-
-        resp = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=10)
-        resp.raise_for_status()
-
-        jobs = resp.json().get("data", [])
-        if not jobs:
-            break
-
-        for job in jobs:
-            posting = _parse_job(job)
-            # 키워드가 제목에 포함된 것만 필터
-            if keyword and keyword.lower() not in posting.title.lower():
-                continue
-            results.append(posting)
+    return crawl_pages(lambda page: crawl_page(keyword, page, tag_id=tag_id), pages)
+
+
+def crawl_page(keyword: str, page: int, tag_id: int | None = None) -> list[JobPosting] | None:
+    """원티드 공고 한 페이지 (page는 1부터, 1페이지 = 20개, 결과가 없으면 None)"""
+    return parse_page(fetch(page_request(keyword, page, tag_id=tag_id)), keyword)
+
 
+def page_request(keyword: str, page: int, tag_id: int | None = None) -> PageRequest:
+    """한 페이지 요청 명세"""
+    params = {
+        "country": "kr",
+        "locations": "all",
+        "years": -1,
+        "limit": PAGE_LIMIT,
+        "offset": (page - 1) * PAGE_LIMIT,
+    }
+    if tag_id:
+        params["tag_type_ids"] = tag_id
+    return PageRequest("GET", BASE_URL, params=params, headers=HEADERS)
+
+
+def parse_page(text: str, keyword: str) -> list[JobPosting] | None:
+    """API 응답 파싱 (결과가 없으면 None)"""
+    jobs = json.loads(text).get("data", [])
+    if not jobs:
+        return None
+
+    results = []
+    for job in jobs:
+        posting = _parse_job(job)
+        # 키워드가 제목에 포함된 것만 필터
+        if keyword and keyword.lower() not in posting.title.lower():
+            continue
+        results.append(posting)
     return results
 
 
@@ -0,0 +1,134 @@
+"""사이트 간 중복 공고 병합 - 크롤링과 필터링 사이 단계
+
+같은 공고가 사람인/점핏(사람인 운영), 리멤버, 원티드 등에 함께 올라오는 경우가 많다.
+회사명과 제목을 정규화한 키 두 개로 색인해
+    1. (회사, 제목에서 공백/문장부호를 뺀 문자열)이 같거나
+    2. (회사, 제목 단어 집합)이 같으면 (단어 순서만 다른 제목)
+같은 공고로 보고 하나로 합친다. 공고당 dict 조회 두 번이라 공고 수에 선형이다. 같은 사이트의 공고끼리는 (링크가 같은 경우를 빼면) 합치지 않는다
+- 한 사이트에 지역만 다른 같은 제목 공고가 여러 개 올라오는 경우가 있기 때문.
+
+합친 공고는 키워드가 가장 많은 공고를 대표로 하고 conditions/keywords는 합집합,
+links에 사이트별 링크를 모두 남긴다. 원본 JobPosting(크롤링 캐시가 들고 있음)은 바꾸지 않는다.
+
+환경 변수
+    DEDUP  0이면 중복 병합 안 함 (기본 1)
+"""
+
+import os
+import re
+from dataclasses import replace
+from functools import lru_cache
+
+try:
+    from crawlers.saramin import JobPosting
+except ImportError:
+    from backend.crawlers.saramin import JobPosting
+
+ENABLED = os.environ.get("DEDUP", "1") != "0"
+
+_COMPANY_NOISE = re.compile(r"\(주\)|\(유\)|\(사\)|㈜|주식회사|유한회사|\b(?:inc|corp|co|ltd|llc)\b\.?", re.IGNORECASE)
+# 말머리([신입/경력], 【급구】 등)와 상투어
+_TITLE_NOISE = re.compile(r"\[[^\]]*\]|【[^】]*】|<[^>]*>|채용|모집|구인|공고")
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_company(company: str) -> str:
+    """법인 표기/공백/문장부호를 뺀 회사명 (예: "(주)코드랩" → "코드랩")"""
+    return _NON_WORD.sub("", _COMPANY_NOISE.sub("", company)).lower()
+
+
+def normalize_title(title: str) -> str:
+    """말머리([신입/경력] 등)와 채용/모집 같은 상투어, 공백/문장부호를 뺀 제목"""
+    return "".join(_title_words(title))
+
+
+def _title_words(title: str) -> list[str]:
+    title = _TITLE_NOISE.sub("", title).lower()
+    return [w for w in _NON_WORD.split(title) if w]
+
+
+def _keys(posting: JobPosting) -> tuple:
+    """(회사, 정규화 제목), (회사, 제목 단어 집합) - 회사명이나 제목이 비면 키 없음"""
+    company = normalize_company(posting.company)
+    words = _title_words(posting.title)
+    if not company or not words:
+        return ()
+    return (company, "".join(words)), (company, frozenset(words))
+
+
+def _merge(group: list[JobPosting]) -> JobPosting:
+    """같은 공고 묶음을 하나로 (키워드가 가장 많은 공고가 대표)"""
+    if len(group) == 1:
+        return group[0]
+    primary = max(group, key=lambda p: len(p.keywords))
+    others = [p for p in group if p is not primary]
+    links = {primary.source: primary.link}
+    for p in others:
+        links.setdefault(p.source, p.link)
+    return replace(
+        primary,
+        conditions=_union(primary.conditions, *(p.conditions for p in others)),
+        keywords=_union(primary.keywords, *(p.keywords for p in others)),
+        links=links,
+    )
+
+
+def _union(*lists: list[str]) -> list[str]:
+    """순서를 유지한 합집합 (대소문자/공백만 다른 값은 하나로)"""
+    seen = set()
+    result = []
+    for values in lists:
+        for v in values:
+            key = v.strip().lower()
+            if key not in seen:
+                seen.add(key)
+                result.append(v)
+    return result
+
+
+class Deduplicator:
+    """공고를 순서대로 받아 중복을 묶는다 (스트리밍 응답처럼 사이트별로 나눠 넣어도 됨)"""
+
+    def __init__(self, enabled: bool | None = None):
+        self.enabled = ENABLED if enabled is None else enabled
+        # 묶음은 사이트 수 이하의 작은 리스트라 set 대신 순회로 확인
+        self._groups: list[list[JobPosting]] = []
+        self._by_key: dict[tuple, list[JobPosting]] = {}
+        self._by_link: dict[str, list[JobPosting]] = {}
+
+    def add(self, postings: list[JobPosting]) -> list[JobPosting]:
+        """공고 추가 후 새 공고(기존 묶음에 합쳐지지 않은 것)만 반환"""
+        fresh = []
+        by_key, by_link = self._by_key, self._by_link
+        for posting in postings:
+            if posting.link in by_link:
+                continue
+            keys = _keys(posting) if self.enabled else ()
+            group = None
+            for key in keys:
+                candidate = by_key.get(key)
+                # 같은 사이트의 공고끼리는 합치지 않음
+                if candidate is not None and all(p.source != posting.source for p in candidate):
+                    group = candidate
+                    break
+            if group is None:
+                group = []
+                self._groups.append(group)
+                for key in keys:
+                    by_key.setdefault(key, group)
+                fresh.append(posting)
+            group.append(posting)
+            by_link[posting.link] = group
+        return fresh
+
+    def postings(self) -> list[JobPosting]:
+        """병합된 공고 목록 (처음 등장한 순서)"""
+        return [_merge(group) for group in self._groups]
+
+
+def dedupe(postings: list[JobPosting]) -> list[JobPosting]:
+    """사이트 간 중복 공고를 합친 목록"""
+    dedup = Deduplicator()
+    dedup.add(postings)
+    return dedup.postings()
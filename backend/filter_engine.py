@@ -1,32 +1,27 @@
 """직군별 공고 필터링 엔진"""
 
-import json
-import re
-from pathlib import Path
 from dataclasses import dataclass
 
 try:
     from crawlers.saramin import JobPosting
+    from category_registry import get_categories, get_category
 except ImportError:
     from backend.crawlers.saramin import JobPosting
+    from backend.category_registry import get_categories, get_category
 
-# 마스터 데이터 로드
-DATA_PATH = Path(__file__).parent / "data" / "job_categories.json"
 
-
-@dataclass
+@dataclass(slots=True)
 class FilterResult:
-    """필터링 결과"""
+    """필터링 결과 (키워드는 posting.keywords의 문자열 객체를 그대로 공유)"""
     posting: JobPosting
     matched: bool          # 직군에 맞는 공고인지
-    matched_keywords: list[str]   # 매칭된 키워드
-    excluded_keywords: list[str]  # 범위 밖 키워드
+    matched_keywords: tuple[str, ...]   # 매칭된 키워드
+    excluded_keywords: tuple[str, ...]  # 범위 밖 키워드
 
 
 def load_categories() -> dict:
-    """job_categories.json 로드"""
-    with open(DATA_PATH, encoding="utf-8") as f:
-        return json.load(f)["job_categories"]
+    """job_categories.json 로드 (프로세스 내 캐시, 파일 변경 시 재로드)"""
+    return get_categories()
 
 
 # 사이트 공통 분류 태그 및 기업 유형 (필터링에서 무시)
@@ -60,33 +55,13 @@ def filter_postings(
     Returns:
         FilterResult 리스트 (matched=True인 것만 직군에 맞는 공고)
     """
-    categories = load_categories()
-    category = categories[category_id]
-
-    if allowed_keywords is not None:
-        # 프론트에서 선택한 키워드 + 직군명/별칭은 항상 허용
-        allowed = {
-            kw.lower()
-            for kw in (
-                [category["name"]]
-                + category.get("aliases", [])
-                + allowed_keywords
-            )
-        }
-    else:
-        # 기본: 직군명 + 별칭 + 핵심 + 보조 전부 허용
-        allowed = {
-            kw.lower()
-            for kw in (
-                [category["name"]]
-                + category.get("aliases", [])
-                + category["core_keywords"]
-                + category["auxiliary_keywords"]
-            )
-        }
+    entry = get_category(category_id)
+    # allowed_keywords가 있으면 프론트에서 선택한 키워드 + 직군명/별칭은 항상 허용,
+    # 없으면 직군명 + 별칭 + 핵심 + 보조 전부 허용
+    matcher = entry.matcher_for(allowed_keywords)
 
     # 제목 필터용 키워드 (대소문자 무시)
-    title_keywords = [kw.lower() for kw in category.get("title_keywords", [category["name"]])]
+    title_keywords = entry.title_keywords
 
     results = []
     for posting in postings:
@@ -96,7 +71,7 @@ def filter_postings(
             continue
 
         # 지역 필터
-        if location and not _match_location(location, posting.conditions):
+        if location and not match_location(location, posting.conditions):
             continue
 
         matched_kw = []
@@ -108,7 +83,7 @@ def filter_postings(
             if kw_lower in IGNORE_KEYWORDS:
                 continue
             # 허용 범위에 포함되는지 확인 (부분 매칭)
-            if _is_allowed(kw_lower, allowed):
+            if matcher.is_allowed(kw_lower):
                 matched_kw.append(kw)
             else:
                 excluded_kw.append(kw)
@@ -117,8 +92,8 @@ def filter_postings(
         results.append(FilterResult(
             posting=posting,
             matched=len(excluded_kw) == 0,
-            matched_keywords=matched_kw,
-            excluded_keywords=excluded_kw,
+            matched_keywords=tuple(matched_kw),
+            excluded_keywords=tuple(excluded_kw),
         ))
 
     return results
@@ -146,7 +121,7 @@ LOCATION_MAP = {
 }
 
 
-def _match_location(location: str, conditions: list[str]) -> bool:
+def match_location(location: str, conditions: list[str]) -> bool:
     """지역 필터 매칭 (한영 모두 지원)"""
     variants = LOCATION_MAP.get(location, [location])
     for cond in conditions:
@@ -156,26 +131,6 @@ def _match_location(location: str, conditions: list[str]) -> bool:
     return False
 
 
-def _normalize(s: str) -> str:
-    """비교용 정규화: 공백, 특수문자 제거 + 소문자"""
-    return re.sub(r'[\s\-_./]', '', s).lower()
-
-
-def _is_allowed(keyword: str, allowed_set: set[str]) -> bool:
-    """키워드가 허용 범위에 포함되는지 확인 (부분 매칭 지원)"""
-    if keyword in allowed_set:
-        return True
-    kw_norm = _normalize(keyword)
-    for allowed_kw in allowed_set:
-        if allowed_kw in keyword or keyword in allowed_kw:
-            return True
-        # 정규화 후 비교 (REST API vs restapi 등)
-        aw_norm = _normalize(allowed_kw)
-        if aw_norm in kw_norm or kw_norm in aw_norm:
-            return True
-    return False
-
-
 # 직접 실행 시 테스트
 if __name__ == "__main__":
     from backend.crawlers.saramin import crawl
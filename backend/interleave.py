@@ -0,0 +1,90 @@
+"""사이트별 라운드 로빈 정렬
+
+main._round_robin 의 기존 순서를 그대로 유지하면서 O(n)으로 동작한다.
+    - 사이트 큐는 처음 등장한 순서대로 돌고, 비어 있는 큐는 그 차례에 제거한다
+      (제거된 차례에는 인덱스가 증가하지 않으므로 다음 큐를 건너뛸 수 있다 - 기존 동작 유지)
+    - list.pop(0) 대신 큐별 읽기 위치만 옮긴다
+weights를 주면 사이트별로 한 차례에 weight개씩 가져온다 (기본 1 = 기존 순서).
+"""
+
+import threading
+from itertools import islice
+
+
+def iter_round_robin(items: list, weights: dict[str, int] | None = None):
+    """사이트별로 번갈아 가며 하나씩(가중치만큼) 내보내는 제너레이터"""
+    by_source: dict[str, list] = {}
+    for item in items:
+        by_source.setdefault(item.posting.source, []).append(item)
+    return iter_round_robin_groups(by_source.items(), weights)
+
+
+def iter_round_robin_groups(groups, weights: dict[str, int] | None = None):
+    """이미 사이트별로 나눈 [(사이트, 항목 리스트)]를 라운드 로빈 (사이트는 주어진 순서대로)"""
+    # [항목 리스트, 읽기 위치, 한 차례에 가져올 수]
+    queues = [
+        [queue, 0, max(1, (weights or {}).get(source, 1))]
+        for source, queue in groups
+    ]
+    idx = 0
+    while queues:
+        pos = idx % len(queues)
+        entry = queues[pos]
+        queue, head, weight = entry
+        if head >= len(queue):
+            # 큐 수는 사이트 수(10개 미만)라 pop 비용은 무시할 수 있음
+            queues.pop(pos)
+            continue
+        if weight == 1:
+            yield queue[head]
+            entry[1] = head + 1
+        else:
+            end = min(head + weight, len(queue))
+            yield from queue[head:end]
+            entry[1] = end
+        idx += 1
+
+
+def round_robin(items: list, limit: int, weights: dict[str, int] | None = None) -> list:
+    """iter_round_robin 결과 중 앞에서 limit개"""
+    return list(islice(iter_round_robin(items, weights), limit))
+
+
+class LazySequence:
+    """전체 길이는 알지만 요소는 필요한 만큼만 만드는 시퀀스
+
+    스냅샷 페이지네이션에서 page * page_size 까지만 라운드 로빈을 진행한다.
+    """
+
+    def __init__(self, iterator, length: int):
+        self._iterator = iterator
+        self._length = length
+        self._items: list = []
+        self._lock = threading.Lock()
+
+    def _materialize(self, count: int) -> None:
+        if len(self._items) >= count:
+            return
+        with self._lock:
+            missing = count - len(self._items)
+            if missing > 0:
+                self._items.extend(islice(self._iterator, missing))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            self._materialize(stop if step > 0 else start + 1)
+            return self._items[start:stop:step]
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError(key)
+        self._materialize(key + 1)
+        return self._items[key]
+
+    def __iter__(self):
+        self._materialize(self._length)
+        return iter(self._items)
@@ -0,0 +1,158 @@
+"""크롤링 결과별 키워드 역색인 - 허용 키워드를 바꿔도 다시 크롤링/전체 필터링하지 않음
+
+크롤링(+중복 병합)된 공고 목록마다 한 번 만든다.
+    - 제목 필터는 allowed_keywords와 무관하므로 만들 때 한 번만 적용 (공고 ID = 통과한 순서)
+    - 키워드(소문자) → 그 키워드를 가진 공고 ID 비트셋(int)
+    - 지역 → 비트셋 (지역별로 처음 요청될 때 계산)
+filter()는 허용 범위 밖 키워드의 비트셋을 OR 하고, 제목/지역 비트셋과 AND 해서 매칭/제외 공고를 나눈다.
+공고별 matched_keywords/excluded_keywords는 응답에 실제로 나가는 페이지에서만 계산한다.
+결과(집합, 순서, 키워드 분류)는 같은 공고에 filter_postings를 돌린 것과 같다.
+"""
+
+import sys
+
+try:
+    from crawlers.saramin import JobPosting
+    from category_registry import get_category
+    from filter_engine import IGNORE_KEYWORDS, FilterResult, match_location
+except ImportError:
+    from backend.crawlers.saramin import JobPosting
+    from backend.category_registry import get_category
+    from backend.filter_engine import IGNORE_KEYWORDS, FilterResult, match_location
+
+
+# 공고 하나의 대략적인 메모리 크기 (바이트) - 비트셋 크기를 공고 수 단위로 환산할 때 사용
+POSTING_BYTES = 512
+
+
+def _bitset(ids: list[int], size: int) -> int:
+    """ID 목록 → 비트셋 (ID가 많으면 bytearray로 한 번에 만든다)"""
+    if len(ids) < 64:
+        bits = 0
+        for i in ids:
+            bits |= 1 << i
+        return bits
+    buf = bytearray((size + 7) // 8)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _ids(bits: int) -> list[int]:
+    """비트셋 → 오름차순 ID 목록"""
+    digits = bin(bits)[:1:-1]   # 최하위 비트부터
+    return [i for i, d in enumerate(digits) if d == "1"]
+
+
+class IndexedFilter:
+    """KeywordIndex.filter() 결과 - 사이트별 ID 목록과 지연 생성되는 FilterResult"""
+
+    def __init__(self, index: "KeywordIndex", matcher, matched: list[tuple[str, list[int]]],
+                 excluded: list[tuple[str, list[int]]], matched_count: int, excluded_count: int):
+        self._index = index
+        self._matcher = matcher
+        self.matched = matched          # [(사이트, 공고 ID 목록)] - 사이트는 처음 등장한 순서
+        self.excluded = excluded
+        self.matched_count = matched_count
+        self.excluded_count = excluded_count
+
+    def result(self, posting_id: int) -> FilterResult:
+        """filter_postings와 같은 FilterResult"""
+        posting = self._index.postings[posting_id]
+        matched_kw = []
+        excluded_kw = []
+        for kw in posting.keywords:
+            kw_lower = kw.lower()
+            if kw_lower in IGNORE_KEYWORDS:
+                continue
+            if self._matcher.is_allowed(kw_lower):
+                matched_kw.append(kw)
+            else:
+                excluded_kw.append(kw)
+        return FilterResult(
+            posting=posting,
+            matched=not excluded_kw,
+            matched_keywords=tuple(matched_kw),
+            excluded_keywords=tuple(excluded_kw),
+        )
+
+
+class KeywordIndex:
+    """직군 하나 기준으로 만든 공고 목록의 역색인"""
+
+    def __init__(self, postings: list[JobPosting], category_id: str):
+        self.category_id = category_id
+        title_keywords = get_category(category_id).title_keywords
+        # 제목에 직군 관련 키워드가 없는 공고는 어떤 allowed_keywords로도 결과에 나오지 않음
+        self.postings = [
+            p for p in postings
+            if any(tk in p.title.lower() for tk in title_keywords)
+        ]
+        size = len(self.postings)
+        self._all = (1 << size) - 1
+        self._sources = [p.source for p in self.postings]
+
+        keyword_ids: dict[str, list[int]] = {}
+        for i, posting in enumerate(self.postings):
+            for kw in posting.keywords:
+                kw_lower = kw.lower()
+                if kw_lower in IGNORE_KEYWORDS:
+                    continue
+                ids = keyword_ids.setdefault(kw_lower, [])
+                # 같은 공고에 같은 키워드가 두 번 있어도 한 번만
+                if not ids or ids[-1] != i:
+                    ids.append(i)
+        self._keywords = {kw: _bitset(ids, size) for kw, ids in keyword_ids.items()}
+        self._locations: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    @property
+    def size(self) -> int:
+        """메모리 크기 (공고 수 단위) - 보관한 공고 수 + 비트셋 크기 / POSTING_BYTES (스냅샷 저장소 상한 계산용)"""
+        bitset_bytes = sum(sys.getsizeof(bits) for bits in self._keywords.values())
+        bitset_bytes += sum(sys.getsizeof(bits) for bits in self._locations.values())
+        return len(self.postings) + -(-bitset_bytes // POSTING_BYTES)
+
+    def _location_bits(self, location: str | None) -> int:
+        if not location:
+            return self._all
+        bits = self._locations.get(location)
+        if bits is None:
+            bits = _bitset(
+                [i for i, p in enumerate(self.postings) if match_location(location, p.conditions)],
+                len(self.postings),
+            )
+            self._locations[location] = bits
+        return bits
+
+    def filter(self, location: str | None = None, allowed_keywords: list[str] | None = None) -> IndexedFilter:
+        """filter_postings(postings, category_id, location, allowed_keywords)와 같은 분류"""
+        matcher = get_category(self.category_id).matcher_for(allowed_keywords)
+
+        rejected = 0
+        for kw, bits in self._keywords.items():
+            if not matcher.is_allowed(kw):
+                rejected |= bits
+
+        candidates = self._location_bits(location)
+        matched_bits = candidates & ~rejected
+        excluded_bits = candidates & rejected
+        return IndexedFilter(
+            self, matcher,
+            self._group(matched_bits), self._group(excluded_bits),
+            matched_bits.bit_count(), excluded_bits.bit_count(),
+        )
+
+    def _group(self, bits: int) -> list[tuple[str, list[int]]]:
+        by_source: dict[str, list[int]] = {}
+        sources = self._sources
+        for i in _ids(bits):
+            source = sources[i]
+            ids = by_source.get(source)
+            if ids is None:
+                by_source[source] = [i]
+            else:
+                ids.append(i)
+        return list(by_source.items())
@@ -0,0 +1,108 @@
+"""허용 키워드 매칭기 - Aho-Corasick 오토마톤 + 역방향 부분문자열 인덱스
+
+키워드가 허용 키워드와 양방향 부분 매칭되는지를 허용 키워드 정규화 1회로 판정한다.
+    허용(a) ⇔ norm(a) ⊆ norm(kw)  또는  norm(kw) ⊆ norm(a)
+원문 부분 매칭(a in kw / kw in a)은 정규화 후 부분 매칭에 포함되므로 따로 보지 않는다.
+"""
+
+import re
+from collections import deque
+
+_NORMALIZE_RE = re.compile(r'[\s\-_./]')
+
+
+def normalize(s: str) -> str:
+    """비교용 정규화: 공백, 특수문자 제거 + 소문자"""
+    return _NORMALIZE_RE.sub('', s).lower()
+
+
+class KeywordMatcher:
+    """허용 키워드 집합에 대한 양방향 부분 매칭기"""
+
+    __slots__ = ("allowed", "_goto", "_fail", "_out", "_substrings", "_match_all", "_memo")
+
+    def __init__(self, allowed: set[str] | frozenset[str]):
+        self.allowed = frozenset(allowed)
+        patterns = {normalize(kw) for kw in self.allowed}
+
+        # 빈 문자열은 모든 키워드의 부분문자열 → 무조건 허용
+        self._match_all = "" in patterns
+        patterns.discard("")
+
+        self._build_automaton(patterns)
+
+        # 역방향 인덱스: 허용 키워드(정규화)의 모든 부분문자열
+        # (키워드가 허용 키워드에 포함되는 경우, 빈 문자열 포함)
+        substrings = set()
+        if self.allowed:
+            substrings.add("")
+        for p in patterns:
+            n = len(p)
+            for i in range(n):
+                for j in range(i + 1, n + 1):
+                    substrings.add(p[i:j])
+        self._substrings = substrings
+
+        # 키워드별 판정 결과 캐시 (공고 간 키워드 중복이 많음)
+        self._memo: dict[str, bool] = {}
+
+    def _build_automaton(self, patterns: set[str]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out: list[bool] = [False]
+        for p in patterns:
+            state = 0
+            for ch in p:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(False)
+                state = nxt
+            out[state] = True
+
+        # BFS로 실패 링크 구성 (출력은 존재 여부만 필요하므로 bool로 전파)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] or out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def _contains_pattern(self, text: str) -> bool:
+        """text 안에 허용 키워드(정규화)가 하나라도 포함되는지"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+    def is_allowed(self, keyword: str) -> bool:
+        """키워드가 허용 범위에 포함되는지 확인 (부분 매칭 지원)"""
+        cached = self._memo.get(keyword)
+        if cached is not None:
+            return cached
+
+        if keyword in self.allowed or self._match_all:
+            result = True
+        else:
+            kw_norm = normalize(keyword)
+            result = kw_norm in self._substrings or self._contains_pattern(kw_norm)
+
+        self._memo[keyword] = result
+        return result
+
+    __call__ = is_allowed
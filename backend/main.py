@@ -1,17 +1,45 @@
 """Job Finder API 서버"""
 
+import asyncio
 import json
 import os
+import time
+from functools import partial
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
 try:
+    import crawl_handler
+    import metrics
     from crawlers.saramin import JobPosting
+    from crawl_cache import crawl_cache
+    from dedup import Deduplicator, dedupe
     from filter_engine import filter_postings, load_categories
+    from interleave import LazySequence, iter_round_robin_groups, round_robin
+    from keyword_index import KeywordIndex
+    from posting_store import posting_store
+    from precomputed_store import precomputed_store
+    from responses import dumps, json_response
+    from result_transport import MAX_EXECUTION_ITEMS, result_transport
+    from snapshot_store import snapshot_store
+    from source_health import source_health
 except ImportError:
+    from backend import crawl_handler, metrics
     from backend.crawlers.saramin import JobPosting
+    from backend.crawl_cache import crawl_cache
+    from backend.dedup import Deduplicator, dedupe
     from backend.filter_engine import filter_postings, load_categories
+    from backend.interleave import LazySequence, iter_round_robin_groups, round_robin
+    from backend.keyword_index import KeywordIndex
+    from backend.posting_store import posting_store
+    from backend.precomputed_store import precomputed_store
+    from backend.responses import dumps, json_response
+    from backend.result_transport import MAX_EXECUTION_ITEMS, result_transport
+    from backend.snapshot_store import snapshot_store
+    from backend.source_health import source_health
 
 app = FastAPI(title="Job Finder API")
 
@@ -22,10 +50,45 @@ app.add_middleware(
         "https://d1ujto181dgh1n.cloudfront.net",
         "https://job-finder.hrsong.com",
     ],
-    allow_methods=["GET"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def server_timing(request: Request, call_next):
+    """요청 처리 시간 히스토그램 + 단계별 소요 시간 Server-Timing 헤더 (metrics 모듈)"""
+    start = time.perf_counter()
+    with metrics.collect() as timings:
+        response = await call_next(request)
+    elapsed = time.perf_counter() - start
+    route = request.scope.get("route")
+    metrics.request_seconds.observe(
+        (request.method, route.path if route is not None else "unmatched", str(response.status_code)), elapsed,
+    )
+    if metrics.SERVER_TIMING:
+        timings.add("total", elapsed * 1000)
+        response.headers["Server-Timing"] = timings.header()
+    return response
+
+
+# 라운드 로빈 사이트별 가중치 (예: "saramin=2,jumpit=2"), 없으면 모두 1
+ROUND_ROBIN_WEIGHTS = {
+    source.strip(): int(weight)
+    for source, _, weight in (
+        pair.partition("=") for pair in os.environ.get("ROUND_ROBIN_WEIGHTS", "").split(",") if "=" in pair
+    )
+}
+
+# 비동기 크롤링 엔진 (httpx가 없으면 스레드 풀로 대체)
+try:
+    from crawlers.async_engine import engine as crawl_engine
+except ImportError:
+    try:
+        from backend.crawlers.async_engine import engine as crawl_engine
+    except ImportError:
+        crawl_engine = None
+
 # Step Functions 클라이언트 (Lambda 환경에서만 활성화)
 SFN_ARN = os.environ.get("CRAWL_STATE_MACHINE_ARN", "")
 try:
@@ -35,54 +98,360 @@ except ImportError:
     sfn_client = None
 
 
-def _crawl_via_step_functions(keyword: str, category: str, pages: int) -> list[JobPosting]:
-    """Step Functions로 병렬 크롤링 실행 (동기)"""
-    resp = sfn_client.start_sync_execution(
-        stateMachineArn=SFN_ARN,
-        input=json.dumps({"keyword": keyword, "category": category, "pages": pages}),
-    )
+def _crawl_via_step_functions(
+    keyword: str, category: str, pages: int, deadline: float | None = None,
+) -> tuple[list[JobPosting], dict[str, str]]:
+    """Step Functions Map 상태로 (사이트, 페이지) 작업을 병렬 실행 (동기)
+
+    deadline(초)은 작업마다 남은 예산으로 계산되고, 넘긴 페이지는 빈 결과 + late로 돌아온다.
+    """
+    return _run_plan_step_functions(crawl_handler.crawl_plan(keyword, category, pages, _deadline_at(deadline)))
+
+
+def _run_plan_step_functions(items: list[dict]) -> tuple[list[JobPosting], dict[str, str]]:
+    """작업 목록을 Step Functions로 실행 - 서킷이 열린 사이트 작업은 보내지 않고 last good 결과로 대신함
+
+    실행 출력 한도(256KB) 때문에 작업은 실행 하나에 MAX_EXECUTION_ITEMS개씩 나눠 동시에 실행한다
+    (result_transport). 실패한 실행의 작업은 error 결과가 된다.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    allowed = {name: source_health.allow(name) for name in dict.fromkeys(item["crawler"] for item in items)}
+    run_items = [item for item in items if allowed[item["crawler"]]]
+    chunks = [run_items[i:i + MAX_EXECUTION_ITEMS] for i in range(0, len(run_items), MAX_EXECUTION_ITEMS)]
+    outputs = iter([])
+    if chunks:
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [pool.submit(metrics.bind(_start_execution), chunk) for chunk in chunks]
+            outputs = iter([output for future in futures for output in future.result()])
+
+    results = []
+    for item in items:
+        if not allowed[item["crawler"]]:
+            output = crawl_handler.circuit_open_result(item)
+            results.append((output, result_transport.unpack(output)))
+            continue
+        output = next(outputs)
+        metrics.merge(output.get("timings"))
+        postings = result_transport.unpack(output)
+        _record_health(item, output, postings)
+        results.append((output, postings))
+    return _plan_results(results)
+
+
+def _start_execution(items: list[dict]) -> list[dict]:
+    """Step Functions 동기 실행 하나 - 작업 순서대로의 작업별 결과 (실패하면 작업마다 error 결과)"""
+    with metrics.span("step_functions"):
+        resp = sfn_client.start_sync_execution(
+            stateMachineArn=SFN_ARN,
+            input=json.dumps({"items": items, "max_concurrency": crawl_handler.MAX_CONCURRENCY}, ensure_ascii=False),
+        )
     if resp["status"] != "SUCCEEDED":
-        print(f"Step Functions 실패: {resp.get('error')}")
-        return []
+        error = resp.get("error") or resp["status"]
+        print(f"Step Functions 실패: {error}")
+        return [
+            {
+                "crawler": item["crawler"], "keyword": item["keyword"], "category": item["category"],
+                "page": item["page"], "postings": [], "error": error,
+            }
+            for item in items
+        ]
+    # Map 상태 결과는 작업 순서대로의 작업별 결과 리스트
+    # 공고는 인라인(압축/열 단위) 또는 블롭 저장소 키 (result_transport)
+    return json.loads(resp["output"])
+
+
+def _record_health(item: dict, output: dict, postings: list[JobPosting]) -> None:
+    """크롤러 Lambda 작업 결과를 이 프로세스의 사이트 상태에 기록 (로컬 경로는 요청 시점에 직접 기록)"""
+    name = item["crawler"]
+    if "circuit" in output:
+        return
+    fetch_ms = (output.get("timings") or {}).get(f"fetch.{name}")
+    if "error" in output or output.get("late"):
+        source_health.record(name, False, (fetch_ms or 0) / 1000)
+        return
+    if fetch_ms is not None:
+        # 캐시 hit(요청 없음)은 기록하지 않음
+        source_health.record(name, True, fetch_ms / 1000)
+    if not output.get("end"):
+        source_health.remember(crawl_handler.last_good_key(item), postings)
+
+
+def _run_plan_threads(items: list[dict], until=None) -> tuple[list[JobPosting], dict[str, str]]:
+    """로컬 개발용: crawl_plan 작업을 스레드 풀에서 crawl_handler.handler로 실행
+
+    Step Functions Map 상태와 같은 작업, 같은 결과 형식, 같은 동시 실행 수(CRAWL_MAX_CONCURRENCY)를 쓴다.
+    until이 있으면 사이트별 작업을 페이지 순서대로 실행하다가 until(페이지 공고)이 참이면 남은 페이지를 건너뛴다.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if until is None:
+        groups = [[item] for item in items]
+    else:
+        by_site: dict[tuple, list[dict]] = {}
+        for item in items:
+            by_site.setdefault((item["crawler"], item["keyword"], item["category"]), []).append(item)
+        groups = list(by_site.values())
+
+    def _run(group):
+        results = []
+        for item in group:
+            output = crawl_handler.handler(item, None)
+            postings = result_transport.unpack(output)
+            results.append((output, postings))
+            if output.get("end") or (until is not None and until(postings)):
+                break
+        return results
 
-    output = json.loads(resp["output"])
+    with ThreadPoolExecutor(max_workers=max(1, min(crawl_handler.MAX_CONCURRENCY, len(groups)))) as pool:
+        futures = [pool.submit(metrics.bind(_run), group) for group in groups]
+        outputs = [result for future in futures for result in future.result()]
+    return _plan_results(outputs)
+
+
+def _plan_results(outputs: list[tuple[dict, list[JobPosting]]]) -> tuple[list[JobPosting], dict[str, str]]:
+    """작업별 (결과, 공고) → (공고, 사이트별 상태) - 사이트의 마지막 페이지(end) 이후 작업 결과는 버림
+
+    마지막 페이지는 _batch_plan이 작업을 합치는 기준((사이트, 검색어, kwargs))별로 따진다.
+    """
     postings = []
-    # Parallel State 결과는 각 브랜치 결과의 리스트
-    for branch_result in output:
-        for p in branch_result.get("postings", []):
-            postings.append(JobPosting(**p))
-    return postings
+    sources = {}
+    ended = set()
+    for output, page_postings in outputs:
+        name = output.get("crawler")
+        if not name:
+            continue
+        key = _plan_key(name, output.get("keyword") or "", output.get("category"))
+        if key in ended:
+            continue
+        if output.get("end"):
+            ended.add(key)
+        _set_status(sources, name, crawl_handler.output_status(output))
+        postings.extend(page_postings)
+    return postings, sources
 
 
-def _crawl_via_threads(keyword: str, category: str, pages: int) -> list[JobPosting]:
-    """로컬 개발용: ThreadPoolExecutor로 병렬 크롤링"""
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+def _deadline_at(deadline: float | None) -> float | None:
+    return time.time() + deadline if deadline else None
+
+
+def _crawler_jobs(category: str) -> list[tuple[str, object, dict]]:
+    """(이름, 크롤러 모듈, crawl kwargs) 목록"""
     try:
-        from crawlers import saramin, wanted, incruit, remember, rallit, jumpit
+        from crawlers import saramin, wanted, incruit, remember, rallit, jumpit, jobkorea
         from crawlers.wanted import TAG_MAP as WANTED_TAG_MAP
     except ImportError:
-        from backend.crawlers import saramin, wanted, incruit, remember, rallit, jumpit
+        from backend.crawlers import saramin, wanted, incruit, remember, rallit, jumpit, jobkorea
         from backend.crawlers.wanted import TAG_MAP as WANTED_TAG_MAP
 
-    crawlers = [
-        ("saramin", saramin), ("wanted", wanted), ("incruit", incruit),
-        ("remember", remember), ("rallit", rallit), ("jumpit", jumpit),
+    jobs = [
+        ("saramin", saramin, {}),
+        ("wanted", wanted, {"tag_id": WANTED_TAG_MAP.get(category)}),
+        ("incruit", incruit, {}),
+        ("remember", remember, {}),
+        ("rallit", rallit, {}),
+        ("jumpit", jumpit, {}),
     ]
+    if jobkorea.available():
+        jobs.append(("jobkorea", jobkorea, {}))
+    return jobs
+
+
+def _crawl_via_async(
+    keyword: str, category: str, pages: int, deadline: float | None = None, known_links: set[str] | None = None,
+) -> tuple[list[JobPosting], dict[str, str]]:
+    """로컬 개발용: 공유 커넥션 풀로 모든 사이트/페이지를 동시에 크롤링
+
+    deadline(초)까지 끝난 사이트 결과만 반환한다. 늦은 사이트는 취소하지 않고 계속 진행해
+    결과를 크롤링 캐시에 채운다 (다음 요청에서 hit).
+    known_links가 있으면 그 공고만 나온 페이지에서 사이트별 페이지 이동을 멈춘다 (증분 크롤링).
+    """
+    return _run_jobs_async(_search_jobs(keyword, category), pages, deadline, _until_seen(known_links))
 
-    def _run(name, crawler):
-        if name == "wanted":
-            return crawler.crawl(keyword, pages=pages, tag_id=WANTED_TAG_MAP.get(category))
-        return crawler.crawl(keyword, pages=pages)
 
+def _crawl_via_threads(
+    keyword: str, category: str, pages: int, deadline: float | None = None, known_links: set[str] | None = None,
+) -> tuple[list[JobPosting], dict[str, str]]:
+    """로컬 개발용: Step Functions와 같은 (사이트, 페이지) 작업 목록을 스레드 풀로 실행 (httpx가 없을 때)"""
+    items = crawl_handler.crawl_plan(keyword, category, pages, _deadline_at(deadline))
+    return _run_plan_threads(items, _until_seen(known_links))
+
+
+def _search_jobs(keyword: str, category: str) -> list[tuple[str, object, str, dict]]:
+    """검색 하나의 (이름, 크롤러 모듈, 검색어, crawl kwargs) 목록"""
+    return [(name, crawler, keyword, kwargs) for name, crawler, kwargs in _crawler_jobs(category)]
+
+
+def _run_jobs_async(jobs, pages: int, deadline: float | None = None, until=None) -> tuple[list[JobPosting], dict[str, str]]:
+    """(이름, 크롤러, 검색어, kwargs) 목록을 asyncio 엔진으로 동시에 크롤링
+
+    서킷이 열린 사이트(source_health)는 크롤링하지 않고 같은 검색의 마지막 성공 결과(stale)로 대신한다.
+    """
     postings = []
-    with ThreadPoolExecutor(max_workers=len(crawlers)) as pool:
-        futures = {pool.submit(_run, n, c): n for n, c in crawlers}
-        for f in as_completed(futures):
-            try:
-                postings.extend(f.result())
-            except Exception as e:
-                print(f"[{futures[f]}] 크롤링 실패: {e}")
-    return postings
+    sources = {}
+    run_jobs = []
+    for job in jobs:
+        name, _, keyword, kwargs = job
+        if source_health.allow(name):
+            run_jobs.append(job)
+            continue
+        stale = source_health.last_good(_job_key(name, keyword, kwargs, pages))
+        if stale is None:
+            _set_status(sources, name, "skipped")
+        else:
+            postings.extend(stale)
+            _set_status(sources, name, "stale")
+
+    async def _gather():
+        tasks = {
+            asyncio.ensure_future(
+                crawl_cache.crawl_async(crawl_engine, crawler, name, keyword, pages=pages, until=until, **kwargs)
+            ): (name, keyword, kwargs)
+            for name, crawler, keyword, kwargs in run_jobs
+        }
+        done, pending = await asyncio.wait(tasks, timeout=deadline) if tasks else (set(), set())
+        for task in pending:
+            # 늦게 실패해도 "exception was never retrieved" 경고가 남지 않도록
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return [(job, task if task in done else None) for task, job in tasks.items()]
+
+    for (name, keyword, kwargs), task in crawl_engine.run(_gather()):
+        if task is None:
+            print(f"[{name}] 응답 시간 예산 초과")
+            _set_status(sources, name, "late")
+        elif task.exception() is not None:
+            print(f"[{name}] 크롤링 실패: {task.exception()}")
+            _set_status(sources, name, "error")
+        else:
+            postings.extend(task.result())
+            _set_status(sources, name, "ok")
+            if until is None:
+                # 증분 크롤링 결과는 일부 페이지만이므로 보관하지 않음
+                source_health.remember(_job_key(name, keyword, kwargs, pages), task.result())
+    return postings, sources
+
+
+def _job_key(name: str, keyword: str, kwargs: dict, pages: int) -> tuple:
+    """asyncio 경로 작업의 last good 결과 키"""
+    return name, _normalize_keyword(keyword), _kwargs_key(kwargs), pages
+
+
+# 한 사이트를 여러 검색어로 크롤링한 경우 가장 나쁜 상태로 표시
+# stale: 서킷이 열려 마지막으로 성공한 결과로 응답, skipped: 서킷이 열렸고 이전 결과도 없음
+_STATUS_RANK = {"ok": 0, "stale": 1, "late": 2, "skipped": 3, "error": 4}
+
+
+def _set_status(sources: dict[str, str], name: str, status: str) -> None:
+    if _STATUS_RANK[status] >= _STATUS_RANK.get(sources.get(name), -1):
+        sources[name] = status
+
+
+def _until_seen(known_links: set[str] | None):
+    """이미 본 공고만 나온 페이지에서 멈추는 until 콜백 (known_links가 없으면 None)"""
+    if not known_links:
+        return None
+    return lambda postings: bool(postings) and all(p.link in known_links for p in postings)
+
+
+def _crawl(
+    keyword: str, category: str, pages: int, deadline: float | None = None, known_links: set[str] | None = None,
+) -> tuple[list[JobPosting], dict[str, str]]:
+    """Lambda 환경이면 Step Functions, 로컬이면 asyncio 엔진 (없으면 ThreadPoolExecutor)
+
+    Step Functions는 사이트별 Lambda가 따로 크롤링하므로 증분 크롤링(known_links)은 로컬에서만 적용된다.
+    """
+    if sfn_client and SFN_ARN:
+        return _crawl_via_step_functions(keyword, category, pages, deadline)
+    if crawl_engine is not None:
+        return _crawl_via_async(keyword, category, pages, deadline, known_links)
+    return _crawl_via_threads(keyword, category, pages, deadline, known_links)
+
+
+def _crawl_batch(
+    searches: list[tuple[str, str]], pages: int, deadline: float | None = None,
+) -> tuple[list[JobPosting], dict[str, str]]:
+    """여러 (검색어, 직군)을 한 번에 크롤링 - 같은 (사이트, 검색어, kwargs) 호출은 한 번만
+
+    Step Functions/스레드 경로는 검색별 crawl_plan을 합친 작업 목록을 실행한다
+    (Step Functions는 MAX_EXECUTION_ITEMS개씩 나눈 실행들을 동시에).
+    """
+    if sfn_client and SFN_ARN:
+        return _run_plan_step_functions(_batch_plan(searches, pages, _deadline_at(deadline)))
+    if crawl_engine is None:
+        return _run_plan_threads(_batch_plan(searches, pages, _deadline_at(deadline)))
+
+    jobs = {}
+    for keyword, category in searches:
+        for name, crawler, kwargs in _crawler_jobs(category):
+            jobs.setdefault((name, _normalize_keyword(keyword), _kwargs_key(kwargs)), (name, crawler, keyword, kwargs))
+    return _run_jobs_async(list(jobs.values()), pages, deadline)
+
+
+def _batch_plan(searches: list[tuple[str, str]], pages: int, deadline_at: float | None) -> list[dict]:
+    """검색별 crawl_plan을 합치고 같은 (사이트, 검색어, kwargs, 페이지) 작업은 하나만 남긴 목록"""
+    items = {}
+    for keyword, category in searches:
+        for item in crawl_handler.crawl_plan(keyword, category, pages, deadline_at):
+            items.setdefault((*_plan_key(item["crawler"], keyword, category), item["page"]), item)
+    return list(items.values())
+
+
+def _plan_key(name: str, keyword: str, category: str | None) -> tuple:
+    """같은 크롤링 호출인 작업끼리 같은 키 (사이트, 정규화한 검색어, crawl kwargs)"""
+    return name, _normalize_keyword(keyword), _kwargs_key(crawl_handler.crawler_kwargs(name, category))
+
+
+def _normalize_keyword(keyword: str) -> str:
+    # 크롤링 캐시 키와 같은 기준 (대소문자/앞뒤 공백 무시)
+    return keyword.strip().lower()
+
+
+def _kwargs_key(kwargs: dict) -> tuple:
+    return tuple(sorted(kwargs.items()))
+
+
+def _collect_postings(
+    category: str, keyword: str, pages: int, deadline: float | None = None, since: float | None = None,
+) -> tuple[list[JobPosting], dict[str, str], float | None]:
+    """(공고, 사이트별 상태, 저장소 갱신 시각) - 공고 저장소가 있으면 저장소를 거친다
+
+    - POSTING_STORE_FRESH 이내에 갱신된 검색: 크롤링 없이 저장소에서 반환
+    - POSTING_STORE_MAX_AGE 이내: 저장소에서 바로 반환하고 백그라운드에서 증분 갱신
+      (Lambda 등 백그라운드 갱신을 끈 환경에서는 증분 크롤링 후 반환)
+    - 그 외(처음 검색, 오래됨, 더 많은 페이지 요청): 증분 크롤링 후 저장소에서 반환
+    저장소에서는 요청한 페이지 수만큼의 공고만 반환한다 (더 깊이 저장된 검색도).
+    """
+    if posting_store is None:
+        postings, sources = _crawl(keyword, category, pages, deadline)
+        return postings, sources, None
+
+    stored = posting_store.load(category, keyword, since, pages)
+    if stored is not None and stored.pages >= pages and stored.age < posting_store.max_age:
+        if stored.age < posting_store.fresh:
+            return stored.postings, stored.sources, stored.refreshed_at
+        if posting_store.background:
+            posting_store.refresh_in_background(
+                category, keyword, partial(_refresh_store, category, keyword, stored.pages),
+            )
+            return stored.postings, stored.sources, stored.refreshed_at
+        # Lambda는 응답 후 백그라운드 스레드가 멈추므로 요청 안에서 증분 갱신 (아래)
+
+    postings, sources = _refresh_store(category, keyword, pages, deadline)
+    stored = posting_store.load(category, keyword, since, pages)
+    if stored is None:
+        # 모든 사이트가 실패해 저장하지 않은 경우
+        return postings, sources, None
+    return stored.postings, sources, stored.refreshed_at
+
+
+def _refresh_store(
+    category: str, keyword: str, pages: int, deadline: float | None = None,
+) -> tuple[list[JobPosting], dict[str, str]]:
+    """이미 본 공고에서 멈추는 증분 크롤링 후 저장 (모든 사이트가 실패하면 저장하지 않음)"""
+    postings, sources = _crawl(keyword, category, pages, deadline, posting_store.links(category, keyword))
+    if "ok" in sources.values():
+        posting_store.save(category, keyword, pages, postings, sources)
+    return postings, sources
 
 
 @app.get("/api/categories")
@@ -95,8 +464,27 @@ def get_categories():
     ]
 
 
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """크롤링 캐시 hit/miss 통계 (TTL 튜닝용)"""
+    return crawl_cache.stats()
+
+
+@app.get("/api/sources/health")
+def get_source_health():
+    """사이트별 최근 호출 실패율/응답 시간과 서킷 상태 (source_health)"""
+    return source_health.stats()
+
+
+@app.get("/api/metrics")
+def get_metrics():
+    """단계별/요청별 소요 시간 히스토그램 (Prometheus text format, 이 프로세스 기준)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/api/jobs")
 def get_jobs(
+    request: Request,
     category: str = Query(..., description="직군 ID (예: publisher)"),
     keyword: str | None = Query(None, description="검색 키워드 (없으면 직군명으로 검색)"),
     location: str | None = Query(None, description="지역 필터 (예: 서울)"),
@@ -105,35 +493,136 @@ def get_jobs(
     excluded_page: int = Query(1, ge=1, description="제외 공고 페이지"),
     page_size: int = Query(20, ge=1, le=500, description="페이지당 공고 수"),
     crawl_pages: int = Query(1, ge=1, le=5, description="크롤링 페이지 수"),
+    snapshot_id: str | None = Query(None, description="이전 응답의 스냅샷 ID (있으면 재크롤링 없이 페이지 이동)"),
+    deadline_ms: int | None = Query(None, ge=100, le=60000, description="응답 시간 예산 (넘긴 사이트는 제외하고 반환)"),
+    since: float | None = Query(None, description="이 시각(unix time) 이후 처음 수집된 공고만 (지난 방문 이후 새 공고)"),
+    fields: str | None = Query(None, description="공고별로 반환할 필드 (쉼표 구분, 예: title,link,source)"),
 ):
-    """7개 사이트에서 공고 수집 + 필터링 + 페이지네이션 결과 반환"""
+    """7개 사이트에서 공고 수집 + 필터링 + 페이지네이션 결과 반환
+
+    deadline_ms를 주면 그 안에 끝난 사이트 결과만으로 응답하고, 늦은 사이트는 late_sources로 알린다.
+    공고 저장소(posting_store)가 켜져 있으면 반복 검색은 저장소에서 응답하고, 응답의 refreshed_at을
+    다음 방문 때 since로 넘기면 그 사이 새로 올라온 공고만 볼 수 있다.
+    """
     categories = load_categories()
     if category not in categories:
         return {"error": f"존재하지 않는 직군: {category}"}
+    projection = _parse_fields(fields)
+    if isinstance(projection, dict):
+        return projection
 
     search_keyword = keyword or categories[category]["name"]
+    query = _snapshot_query(category, search_keyword, location, allowed_keywords, crawl_pages, since)
+
+    # 같은 검색 조건의 스냅샷이 살아 있으면 크롤링 없이 재사용
+    snapshot = snapshot_store.get(snapshot_id, query) if snapshot_id else None
+    if snapshot is None and snapshot_id:
+        # 같은 크롤링 결과에서 허용 키워드/지역만 바뀐 경우 역색인으로 다시 분류
+        snapshot = _refilter_snapshot(snapshot_id, query, location, allowed_keywords)
+    # 기본 검색은 주기적으로 사전 계산된 결과 사용 (사용자 지정 키워드/검색어는 직접 크롤링)
+    if snapshot is None and keyword is None and allowed_keywords is None and since is None:
+        snapshot = _precomputed_snapshot(query, category, location, crawl_pages)
+    if snapshot is None:
+        deadline = deadline_ms / 1000 if deadline_ms else None
+        with metrics.span("crawl"):
+            all_postings, sources, refreshed_at = _collect_postings(category, search_keyword, crawl_pages, deadline, since)
+
+        # 사이트 간 중복 공고 병합 후 역색인 생성 + 필터링
+        with metrics.span("dedup"):
+            all_postings = dedupe(all_postings)
+        with metrics.span("index"):
+            index = KeywordIndex(all_postings, category)
+        snapshot = _store_snapshot(query, index, location, allowed_keywords, sources, refreshed_at)
+
+    return json_response(_snapshot_response(snapshot, matched_page, excluded_page, page_size, projection), request)
 
-    # Lambda 환경이면 Step Functions, 로컬이면 ThreadPoolExecutor
-    if sfn_client and SFN_ARN:
-        all_postings = _crawl_via_step_functions(search_keyword, category, crawl_pages)
-    else:
-        all_postings = _crawl_via_threads(search_keyword, category, crawl_pages)
 
-    # 필터링
-    results = filter_postings(all_postings, category, location=location, allowed_keywords=allowed_keywords)
+class BatchSearch(BaseModel):
+    """배치 검색의 직군 하나 (필드 의미는 /api/jobs와 같음)"""
+    category: str
+    keyword: str | None = None
+    location: str | None = None
+    allowed_keywords: list[str] | None = None
 
-    matched_all = _round_robin([r for r in results if r.matched], len(results))
-    excluded_all = _round_robin([r for r in results if not r.matched], len(results))
+
+class BatchRequest(BaseModel):
+    searches: list[BatchSearch] = Field(..., min_length=1, max_length=20)
+    page_size: int = Field(20, ge=1, le=500)
+    crawl_pages: int = Field(1, ge=1, le=5)
+    deadline_ms: int | None = Field(None, ge=100, le=60000)
+    fields: str | None = None
+
+
+@app.post("/api/jobs/batch")
+def batch_jobs(body: BatchRequest, request: Request):
+    """여러 직군(필터 조건)을 한 번의 크롤링으로 검색해 직군별 결과를 한 번에 반환
+
+    직군별 검색어를 모아 (사이트, 검색어) 호출을 중복 없이 한 번씩 크롤링하고, 합친 공고(중복 병합)를
+    직군마다 필터링한다. 직군별 결과의 snapshot_id로 /api/jobs에서 다음 페이지를 볼 수 있다.
+    """
+    categories = load_categories()
+    unknown = [s.category for s in body.searches if s.category not in categories]
+    if unknown:
+        return {"error": f"존재하지 않는 직군: {', '.join(unknown)}"}
+    projection = _parse_fields(body.fields)
+    if isinstance(projection, dict):
+        return projection
+
+    search_keywords = [s.keyword or categories[s.category]["name"] for s in body.searches]
+    deadline = body.deadline_ms / 1000 if body.deadline_ms else None
+    with metrics.span("crawl"):
+        all_postings, sources = _crawl_batch(
+            [(kw, s.category) for kw, s in zip(search_keywords, body.searches)], body.crawl_pages, deadline,
+        )
+    with metrics.span("dedup"):
+        postings = dedupe(all_postings)
+
+    # 역색인은 직군별로 한 번만 (같은 직군을 지역/허용 키워드만 바꿔 여러 번 요청해도 재사용)
+    indexes: dict[str, KeywordIndex] = {}
+    results = []
+    for search, search_keyword in zip(body.searches, search_keywords):
+        index = indexes.get(search.category)
+        if index is None:
+            with metrics.span("index"):
+                index = indexes[search.category] = KeywordIndex(postings, search.category)
+        query = _snapshot_query(
+            search.category, search_keyword, search.location, search.allowed_keywords, body.crawl_pages,
+        )
+        snapshot = _store_snapshot(query, index, search.location, search.allowed_keywords, sources)
+        results.append({"category": search.category, **_snapshot_response(snapshot, 1, 1, body.page_size, projection)})
+
+    return json_response({
+        "sources": sources,
+        "late_sources": [name for name, status in sources.items() if status == "late"],
+        "results": results,
+    }, request)
+
+
+def _snapshot_response(
+    snapshot, matched_page: int, excluded_page: int, page_size: int, fields: tuple[str, ...] | None = None,
+) -> dict:
+    """스냅샷에서 요청한 페이지를 잘라 응답 형식으로"""
+    matched_all = snapshot.matched
+    excluded_all = snapshot.excluded
 
     # 페이지네이션 적용
     def _paginate(items, pg, sz):
         start = (pg - 1) * sz
         return items[start:start + sz]
 
-    matched_items = _paginate(matched_all, matched_page, page_size)
-    excluded_items = _paginate(excluded_all, excluded_page, page_size)
+    # 라운드 로빈과 공고별 키워드 분류는 여기서 요청한 페이지까지 진행됨 (LazySequence)
+    with metrics.span("paginate"):
+        matched_items = _paginate(matched_all, matched_page, page_size)
+        excluded_items = _paginate(excluded_all, excluded_page, page_size)
+    with metrics.span("serialize"):
+        matched = [_to_dict(r, fields) for r in matched_items]
+        excluded = [_to_dict(r, fields) for r in excluded_items]
 
     return {
+        "snapshot_id": snapshot.id,
+        "sources": snapshot.sources,
+        "late_sources": [name for name, status in snapshot.sources.items() if status == "late"],
+        "refreshed_at": snapshot.refreshed_at,
         "matched_count": len(matched_all),
         "excluded_count": len(excluded_all),
         "page_size": page_size,
@@ -141,38 +630,248 @@ def get_jobs(
         "matched_total_pages": max(1, (len(matched_all) + page_size - 1) // page_size),
         "excluded_page": excluded_page,
         "excluded_total_pages": max(1, (len(excluded_all) + page_size - 1) // page_size),
-        "matched": [_to_dict(r) for r in matched_items],
-        "excluded": [_to_dict(r) for r in excluded_items],
+        "matched": matched,
+        "excluded": excluded,
     }
 
 
-def _round_robin(items: list, limit: int) -> list:
-    """사이트별로 번갈아 가며 골고루 선택"""
-    from collections import defaultdict
-    by_source = defaultdict(list)
-    for item in items:
-        by_source[item.posting.source].append(item)
-
-    result = []
-    queues = list(by_source.values())
-    idx = 0
-    while len(result) < limit and queues:
-        queue = queues[idx % len(queues)]
-        if queue:
-            result.append(queue.pop(0))
-        else:
-            queues.pop(idx % len(queues))
+@app.get("/api/jobs/stream")
+async def stream_jobs(
+    request: Request,
+    category: str = Query(..., description="직군 ID (예: publisher)"),
+    keyword: str | None = Query(None, description="검색 키워드 (없으면 직군명으로 검색)"),
+    location: str | None = Query(None, description="지역 필터 (예: 서울)"),
+    allowed_keywords: list[str] | None = Query(None, description="허용 키워드 목록 (없으면 전체)"),
+    crawl_pages: int = Query(1, ge=1, le=5, description="크롤링 페이지 수"),
+    format: str | None = Query(None, pattern="^(ndjson|sse)$", description="ndjson 또는 sse (없으면 Accept 헤더로 결정)"),
+    fields: str | None = Query(None, description="공고별로 반환할 필드 (쉼표 구분, 예: title,link,source)"),
+):
+    """사이트별 크롤링이 끝나는 대로 필터링 결과를 스트리밍
+
+    각 줄(이벤트)은 {"type": "batch", "source", "matched", "excluded"} 이고,
+    마지막에 {"type": "summary", "matched_count", "excluded_count", "sources", "snapshot_id"}를 보낸다.
+    snapshot_id는 /api/jobs 페이지네이션에 그대로 쓸 수 있다. 서킷이 열린 사이트는 sources에
+    status(stale: 마지막 성공 결과로 응답, skipped: 결과 없음)가 붙는다.
+    Step Functions는 전체 완료 후에만 결과를 돌려주므로 이 엔드포인트는 항상 직접 크롤링한다.
+    """
+    categories = load_categories()
+    if category not in categories:
+        return {"error": f"존재하지 않는 직군: {category}"}
+    projection = _parse_fields(fields)
+    if isinstance(projection, dict):
+        return projection
+
+    search_keyword = keyword or categories[category]["name"]
+    use_sse = format == "sse" or (format is None and "text/event-stream" in request.headers.get("accept", ""))
+
+    async def _events():
+        dedup = Deduplicator()
+        sources = {}
+        crawled, statuses = [], {}
+        async for name, outcome, status in _crawl_as_completed(search_keyword, category, crawl_pages):
+            statuses[name] = status
+            if isinstance(outcome, Exception):
+                print(f"[{name}] 크롤링 실패: {outcome}")
+                sources[name] = {"error": str(outcome)}
+                continue
+            if status == "skipped":
+                # 서킷이 열렸고 이전 결과도 없음
+                sources[name] = {"status": status}
+                continue
+            crawled.extend(outcome)
+            # 앞서 보낸 사이트의 공고와 중복이면 보내지 않음 (병합 결과는 스냅샷에 반영)
+            results = filter_postings(dedup.add(outcome), category, location=location, allowed_keywords=allowed_keywords)
+            matched = [_to_dict(r, projection) for r in results if r.matched]
+            excluded = [_to_dict(r, projection) for r in results if not r.matched]
+            sources[name] = {"matched": len(matched), "excluded": len(excluded)}
+            if status != "ok":
+                sources[name]["status"] = status
+            yield _encode_event({"type": "batch", "source": name, "matched": matched, "excluded": excluded}, use_sse)
+
+        snapshot = _store_snapshot(
+            _snapshot_query(category, search_keyword, location, allowed_keywords, crawl_pages),
+            KeywordIndex(dedup.postings(), category), location, allowed_keywords, statuses,
+        )
+        if posting_store is not None and "ok" in statuses.values():
+            await asyncio.to_thread(posting_store.save, category, search_keyword, crawl_pages, crawled, statuses)
+        yield _encode_event({
+            "type": "summary",
+            "matched_count": len(snapshot.matched),
+            "excluded_count": len(snapshot.excluded),
+            "sources": sources,
+            "snapshot_id": snapshot.id,
+        }, use_sse)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream" if use_sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _crawl_as_completed(keyword: str, category: str, pages: int):
+    """사이트별 크롤링 결과를 끝나는 순서대로 (이름, 공고 리스트 또는 예외, 상태)로 반환
+
+    서킷이 열린 사이트(source_health)는 크롤링하지 않고 마지막 성공 결과(stale) 또는 빈 결과(skipped)로
+    먼저 반환한다 (crawl_handler.circuit_open_result).
+    """
+    loop = asyncio.get_running_loop()
+
+    async def _named(name, event, future):
+        try:
+            postings = await future
+        except Exception as e:
+            return name, e, "error"
+        source_health.remember(crawl_handler.last_good_key(event), postings)
+        return name, postings, "ok"
+
+    tasks = []
+    for name, crawler, kwargs in _crawler_jobs(category):
+        event = {"crawler": name, "keyword": keyword, "category": category, "pages": pages}
+        if not source_health.allow(name):
+            output = crawl_handler.circuit_open_result(event)
+            yield name, result_transport.unpack(output), crawl_handler.output_status(output)
             continue
-        idx += 1
-    return result
+        if crawl_engine is not None:
+            future = asyncio.wrap_future(crawl_engine.submit(
+                crawl_cache.crawl_async(crawl_engine, crawler, name, keyword, pages=pages, **kwargs)
+            ))
+        else:
+            future = loop.run_in_executor(None, partial(crawl_cache.crawl, crawler, name, keyword, pages=pages, **kwargs))
+        tasks.append(asyncio.ensure_future(_named(name, event, future)))
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트가 끊으면 남은 크롤링 취소
+        for task in tasks:
+            task.cancel()
+
+
+def _encode_event(payload: dict, sse: bool) -> str:
+    data = dumps(payload).decode("utf-8")
+    if sse:
+        return f"event: {payload['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+# 검색 조건 → (사전 계산 시각, 스냅샷 ID) - 같은 사전 계산 결과로 스냅샷을 반복해 만들지 않음
+_precomputed_snapshots: dict[tuple, tuple[float, str]] = {}
+PRECOMPUTED_SNAPSHOT_MEMO = 256
+
+
+def _precomputed_snapshot(query: tuple, category: str, location: str | None, crawl_pages: int):
+    """사전 계산 결과로 만든 스냅샷 (결과가 없거나 오래됐거나 페이지 수가 부족하면 None)"""
+    precomputed = precomputed_store.load(category)
+    if precomputed is None or precomputed.pages < crawl_pages:
+        return None
+
+    memo = _precomputed_snapshots.get(query)
+    if memo is not None and memo[0] == precomputed.created_at:
+        snapshot = snapshot_store.get(memo[1], query)
+        if snapshot is not None:
+            return snapshot
+
+    snapshot = _store_snapshot(
+        query, precomputed.index, location, None, precomputed.sources, precomputed.created_at,
+    )
+    if len(_precomputed_snapshots) >= PRECOMPUTED_SNAPSHOT_MEMO:
+        _precomputed_snapshots.clear()
+    _precomputed_snapshots[query] = (precomputed.created_at, snapshot.id)
+    return snapshot
+
+
+def _snapshot_query(category, search_keyword, location, allowed_keywords, crawl_pages, since=None) -> tuple:
+    """스냅샷 재사용 판단용 검색 조건"""
+    return (
+        category, search_keyword, location,
+        tuple(allowed_keywords) if allowed_keywords is not None else None,
+        crawl_pages, since,
+    )
+
+
+def _refilter_snapshot(snapshot_id: str, query: tuple, location: str | None, allowed_keywords: list[str] | None):
+    """이전 스냅샷과 크롤링 조건(직군, 검색어, 페이지, since)이 같으면 그 역색인으로 새 스냅샷 생성"""
+    base = snapshot_store.peek(snapshot_id)
+    if base is None or base.index is None or _crawl_query(base.query) != _crawl_query(query):
+        return None
+    return _store_snapshot(query, base.index, location, allowed_keywords, base.sources, base.refreshed_at)
+
+
+def _crawl_query(query: tuple) -> tuple:
+    """스냅샷 검색 조건 중 크롤링 결과를 결정하는 부분 (지역/허용 키워드 제외)"""
+    category, search_keyword, _, _, crawl_pages, since = query
+    return category, search_keyword, crawl_pages, since
+
+
+def _store_snapshot(
+    query: tuple,
+    index: KeywordIndex,
+    location: str | None,
+    allowed_keywords: list[str] | None,
+    sources: dict | None = None,
+    refreshed_at: float | None = None,
+):
+    """역색인으로 필터링한 결과를 스냅샷으로 저장
+
+    라운드 로빈과 공고별 키워드 분류는 요청된 페이지까지만 진행하고 나머지는 다음 페이지 요청 때 이어서 진행
+    """
+    with metrics.span("filter"):
+        result = index.filter(location, allowed_keywords)
+    return snapshot_store.put(
+        query,
+        matched=LazySequence(
+            map(result.result, iter_round_robin_groups(result.matched, ROUND_ROBIN_WEIGHTS)), result.matched_count,
+        ),
+        excluded=LazySequence(
+            map(result.result, iter_round_robin_groups(result.excluded, ROUND_ROBIN_WEIGHTS)), result.excluded_count,
+        ),
+        sources=sources,
+        refreshed_at=refreshed_at,
+        index=index,
+    )
+
+
+def _round_robin(items: list, limit: int, weights: dict[str, int] | None = None) -> list:
+    """사이트별로 번갈아 가며 골고루 선택 (O(n), interleave.round_robin 참고)"""
+    return round_robin(items, limit, weights)
+
+
+# 공고 응답 필드 → 값 (fields 파라미터로 일부만 요청할 때)
+_POSTING_FIELDS = {
+    "source": lambda r: r.posting.source,
+    "company": lambda r: r.posting.company,
+    "title": lambda r: r.posting.title,
+    "link": lambda r: r.posting.link,
+    "links": lambda r: r.posting.links or {r.posting.source: r.posting.link},
+    "conditions": lambda r: r.posting.conditions,
+    "keywords": lambda r: r.posting.keywords,
+    "matched_keywords": lambda r: r.matched_keywords,
+    "excluded_keywords": lambda r: r.excluded_keywords,
+}
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...] | dict | None:
+    """fields 파라미터 → 필드 튜플 (없으면 None = 전체, 모르는 필드가 있으면 에러 응답 dict)"""
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in names if f not in _POSTING_FIELDS]
+    if unknown:
+        return {"error": f"알 수 없는 필드: {', '.join(unknown)} (가능: {', '.join(_POSTING_FIELDS)})"}
+    return names or None
 
 
-def _to_dict(r) -> dict:
+def _to_dict(r, fields: tuple[str, ...] | None = None) -> dict:
+    if fields is not None:
+        return {f: _POSTING_FIELDS[f](r) for f in fields}
     return {
         "source": r.posting.source,
         "company": r.posting.company,
         "title": r.posting.title,
         "link": r.posting.link,
+        "links": r.posting.links or {r.posting.source: r.posting.link},
         "conditions": r.posting.conditions,
         "keywords": r.posting.keywords,
         "matched_keywords": r.matched_keywords,
@@ -0,0 +1,163 @@
+"""단계별 소요 시간 측정 - Prometheus 히스토그램 + 요청별 Server-Timing
+
+    with span("fetch", source="saramin"):
+        ...
+
+span은 단계별 히스토그램(job_finder_stage_seconds{stage, source})에 기록하고, 요청 처리 중이면
+(main의 미들웨어가 collect()로 연 요청별 타이밍) 같은 이름끼리 합산해 Server-Timing 헤더로 돌려준다.
+요청별 타이밍은 contextvars로 전달되므로 다른 스레드/이벤트 루프에서 실행하는 작업은 bind()로 감싸거나
+(스레드 풀) 호출한 쪽의 컨텍스트를 이어 받아야 한다 (async_engine.submit).
+
+단계
+    step_functions  Step Functions 동기 실행 전체 (크롤러 Lambda 포함)
+    crawl           사이트 크롤링 전체 (공고 저장소 조회 포함)
+    fetch / parse   사이트별 페이지 요청 / 파싱 (source 라벨, 페이지마다 기록)
+    dedup           사이트 간 중복 병합
+    index / filter  역색인 생성 / 지역·허용 키워드 필터
+    paginate        요청한 페이지까지 라운드 로빈 + 공고별 키워드 분류 (지연 계산)
+    serialize       응답 dict 변환 + JSON 직렬화
+    compress        응답 압축
+
+히스토그램은 프로세스(Lambda 컨테이너)마다 따로 쌓인다. Step Functions 경로의 fetch/parse는 크롤러 Lambda에서
+측정해 결과에 담아 오므로 Server-Timing에만 나타난다.
+
+환경 변수
+    SERVER_TIMING  0이면 Server-Timing 헤더를 붙이지 않음 (기본 1)
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import partial
+
+SERVER_TIMING = os.environ.get("SERVER_TIMING", "1") != "0"
+
+# 초 단위 히스토그램 경계 (Prometheus 기본값과 같음)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """라벨별 누적 히스토그램 (Prometheus text format)"""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # 라벨 값 튜플 → [버킷별 개수..., 합계, 개수]
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_values: tuple, seconds: float) -> None:
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * len(self.buckets) + [0.0, 0]
+            index = bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted(self._series.items())
+            series = [(labels, list(values)) for labels, values in series]
+        for label_values, values in series:
+            labels = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.labels, label_values))
+            prefix = labels + "," if labels else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {values[-1]}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{self.name}_sum{suffix} {values[-2]:.6f}")
+            lines.append(f"{self.name}_count{suffix} {values[-1]}")
+        return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+stage_seconds = Histogram("job_finder_stage_seconds", "단계별 소요 시간(초)", ("stage", "source"))
+request_seconds = Histogram("job_finder_request_seconds", "API 요청 처리 시간(초)", ("method", "path", "status"))
+
+
+def render() -> str:
+    """/api/metrics 응답 본문"""
+    return "\n".join(stage_seconds.render() + request_seconds.render()) + "\n"
+
+
+class Timings:
+    """요청별 단계 소요 시간(ms) 합계 - 하위 타이밍(collect 중첩)은 상위에도 더함"""
+
+    def __init__(self, parent: "Timings | None" = None):
+        self.parent = parent
+        self._ms: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, ms: float) -> None:
+        with self._lock:
+            self._ms[name] = self._ms.get(name, 0.0) + ms
+        if self.parent is not None:
+            self.parent.add(name, ms)
+
+    def as_dict(self) -> dict[str, float]:
+        with self._lock:
+            return {name: round(ms, 3) for name, ms in self._ms.items()}
+
+    def header(self) -> str:
+        """Server-Timing 헤더 값 (예: crawl;dur=812.3, fetch.saramin;dur=640.1)"""
+        return ", ".join(f"{name};dur={ms:.1f}" for name, ms in self.as_dict().items())
+
+
+_current: ContextVar[Timings | None] = ContextVar("job_finder_timings", default=None)
+
+
+@contextmanager
+def collect():
+    """이 블록 안의 span을 모으는 타이밍 (바깥 타이밍이 있으면 거기에도 더함)"""
+    timings = Timings(_current.get())
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def record(stage: str, seconds: float, source: str | None = None) -> None:
+    """측정한 시간 기록 (히스토그램 + 현재 요청 타이밍)"""
+    stage_seconds.observe((stage, source or ""), seconds)
+    timings = _current.get()
+    if timings is not None:
+        timings.add(f"{stage}.{source}" if source else stage, seconds * 1000)
+
+
+@contextmanager
+def span(stage: str, source: str | None = None):
+    """블록 실행 시간 기록 (예외가 나도 기록)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start, source)
+
+
+def merge(timings: dict[str, float] | None) -> None:
+    """다른 프로세스(크롤러 Lambda)에서 측정한 타이밍을 현재 요청 타이밍에 더함 (히스토그램에는 기록 안 함)"""
+    current = _current.get()
+    if current is None or not timings:
+        return
+    for name, ms in timings.items():
+        current.add(name, ms)
+
+
+def bind(fn):
+    """현재 컨텍스트(요청 타이밍)에서 fn을 실행하는 callable - 스레드 풀에 넘길 때 사용"""
+    return partial(copy_context().run, fn)
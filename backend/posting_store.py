@@ -0,0 +1,338 @@
+"""공고 영구 저장소 (SQLite) - 반복 검색 재사용 + 증분 크롤링 + "지난 방문 이후 새 공고"
+
+크롤링한 JobPosting을 링크 기준으로 저장하고, 어떤 검색(직군, 키워드)에서 나왔는지 함께 기록한다.
+    postings         link(PK), source, 공고 필드, first_seen, last_seen
+    search_postings  (category, keyword, link) - 검색별 공고 목록과 사이트 내 순서(rank)
+    searches         (category, keyword) - 마지막 갱신 시각, 사이트별 크롤링 상태
+
+이미 저장된 링크만 나오는 페이지에 도달하면 크롤러는 다음 페이지를 요청하지 않고
+(crawl_cache.crawl의 until), 나머지는 저장소에 있는 공고로 채운다.
+
+환경 변수
+    POSTING_STORE            sqlite | off (기본 sqlite)
+    POSTING_STORE_PATH       sqlite 파일 경로 (기본 /tmp/job-finder-postings.sqlite3)
+    POSTING_STORE_FRESH      초 - 이보다 최근에 갱신된 검색은 크롤링 없이 저장소에서 응답 (기본 300)
+    POSTING_STORE_MAX_AGE    초 - 이보다 오래된 검색은 저장소를 쓰지 않고 새로 크롤링 (기본 900, 크롤링 캐시 TTL의 3배)
+    POSTING_STORE_BACKGROUND 0이면 FRESH ~ MAX_AGE 사이 검색도 요청 안에서 갱신 (기본: Lambda에서는 0, 그 외 1 -
+                             Lambda는 응답을 반환하면 컨테이너가 멈춰 백그라운드 스레드가 끝나지 않음)
+    POSTING_STORE_RETENTION  초 - 이 기간 동안 다시 보이지 않은 공고는 제외/삭제 (기본 259200, 3일)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+try:
+    from crawlers.saramin import JobPosting
+except ImportError:
+    from backend.crawlers.saramin import JobPosting
+
+DEFAULT_PATH = "/tmp/job-finder-postings.sqlite3"
+DEFAULT_FRESH = 300
+DEFAULT_MAX_AGE = 900
+DEFAULT_RETENTION = 259_200
+# 백그라운드 갱신이 이보다 오래 끝나지 않으면 멈춘 것으로 보고 다시 시작 허용 (초)
+REFRESH_TIMEOUT = 120
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS postings ("
+    " link TEXT PRIMARY KEY,"
+    " source TEXT NOT NULL,"
+    " company TEXT NOT NULL,"
+    " title TEXT NOT NULL,"
+    " conditions TEXT NOT NULL,"
+    " keywords TEXT NOT NULL,"
+    " first_seen REAL NOT NULL,"
+    " last_seen REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS postings_source ON postings (source)",
+    "CREATE INDEX IF NOT EXISTS postings_first_seen ON postings (first_seen)",
+    "CREATE INDEX IF NOT EXISTS postings_last_seen ON postings (last_seen)",
+    "CREATE TABLE IF NOT EXISTS search_postings ("
+    " category TEXT NOT NULL,"
+    " keyword TEXT NOT NULL,"
+    " link TEXT NOT NULL,"
+    " rank INTEGER NOT NULL,"
+    " PRIMARY KEY (category, keyword, link))",
+    "CREATE INDEX IF NOT EXISTS search_postings_link ON search_postings (link)",
+    "CREATE TABLE IF NOT EXISTS searches ("
+    " category TEXT NOT NULL,"
+    " keyword TEXT NOT NULL,"
+    " refreshed_at REAL NOT NULL,"
+    " pages INTEGER NOT NULL,"
+    " sources TEXT NOT NULL,"
+    " PRIMARY KEY (category, keyword))",
+)
+
+
+@dataclass
+class StoredSearch:
+    """저장소에서 읽은 검색 결과"""
+    postings: list[JobPosting]
+    first_seen: dict[str, float]   # link → 처음 본 시각
+    refreshed_at: float
+    pages: int                     # 저장된 공고가 덮는 페이지 수 (지금까지 크롤링한 최대)
+    sources: dict[str, str]        # 마지막 갱신 때 사이트별 크롤링 상태
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.refreshed_at
+
+
+class PostingStore:
+    """SQLite 공고 저장소 (스레드별 연결, WAL)"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        fresh: float = DEFAULT_FRESH,
+        max_age: float = DEFAULT_MAX_AGE,
+        retention: float = DEFAULT_RETENTION,
+        background: bool = True,
+    ):
+        self.path = path
+        self.fresh = fresh
+        self.max_age = max_age
+        self.retention = retention
+        self.background = background
+        self._local = threading.local()
+        self._refreshing: dict[tuple[str, str], float] = {}   # 갱신 중인 검색 → 시작 시각
+        self._refresh_lock = threading.Lock()
+        with self._conn() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않음
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    # --- 저장 ---
+
+    def save(
+        self, category: str, keyword: str, pages: int, postings: list[JobPosting], sources: dict[str, str],
+    ) -> int:
+        """크롤링 결과 저장 후 새로 본 공고 수 반환
+
+        결과가 없거나 실패한 사이트(sources 상태가 ok가 아님)의 기존 공고와 순서는 그대로 둔다.
+        """
+        now = time.time()
+        keyword = _normalize_keyword(keyword)
+        conn = self._conn()
+        with conn:
+            known = self._known_links(conn, [p.link for p in postings])
+            conn.executemany(
+                "INSERT INTO postings (link, source, company, title, conditions, keywords, first_seen, last_seen)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (link) DO UPDATE SET"
+                " company = excluded.company, title = excluded.title,"
+                " conditions = excluded.conditions, keywords = excluded.keywords,"
+                " last_seen = excluded.last_seen",
+                [
+                    (p.link, p.source, p.company, p.title,
+                     json.dumps(p.conditions, ensure_ascii=False), json.dumps(p.keywords, ensure_ascii=False),
+                     now, now)
+                    for p in postings
+                ],
+            )
+            by_source: dict[str, list[str]] = {}
+            for p in postings:
+                by_source.setdefault(p.source, []).append(p.link)
+            for source, links in by_source.items():
+                self._save_ranks(conn, category, keyword, source, links, sources.get(source) == "ok")
+            row = conn.execute(
+                "SELECT pages FROM searches WHERE category = ? AND keyword = ?", (category, keyword),
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO searches (category, keyword, refreshed_at, pages, sources)"
+                " VALUES (?, ?, ?, ?, ?)",
+                # 증분 크롤링은 이전에 더 깊이 받은 페이지의 공고를 뒤에 남기므로 페이지 수는 큰 쪽
+                (category, keyword, now, max(pages, row[0] if row else 0), json.dumps(sources)),
+            )
+            self._prune(conn, now)
+        return len(postings) - len(known)
+
+    def _save_ranks(self, conn, category: str, keyword: str, source: str, links: list[str], ok: bool) -> None:
+        """사이트 하나의 검색 내 순서(rank)를 0부터 다시 매김
+
+        ok인 사이트는 새로 받은 공고가 앞에 오고, 이번 크롤링이 다시 본 마지막 기존 공고보다 뒤에 있던
+        기존 공고(증분 크롤링이 받지 않은 페이지)가 이전 순서대로 그 뒤에 온다. 그 앞 구간에서 이번에
+        보이지 않은 공고는 사이트에서 내려간 것이므로 이 검색에서 뺀다. 이번 결과에 기존 공고가 하나도 없으면
+        (모든 페이지를 새로 받음) 기존 목록 전체를 바꾼다. ok가 아닌 사이트(stale 등)는 기존 순서 뒤에 새 링크만 붙인다.
+        """
+        old = [row[0] for row in conn.execute(
+            "SELECT s.link FROM search_postings s JOIN postings p ON p.link = s.link"
+            " WHERE s.category = ? AND s.keyword = ? AND p.source = ? ORDER BY s.rank",
+            (category, keyword, source),
+        )]
+        links = list(dict.fromkeys(links))
+        seen = set(links)
+        if ok:
+            positions = [i for i, link in enumerate(old) if link in seen]
+            cut = positions[-1] + 1 if positions else len(old)
+            merged = links + [link for link in old[cut:] if link not in seen]
+        else:
+            stored = set(old)
+            merged = old + [link for link in links if link not in stored]
+        conn.execute(
+            "DELETE FROM search_postings WHERE category = ? AND keyword = ?"
+            " AND link IN (SELECT link FROM postings WHERE source = ?)",
+            (category, keyword, source),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO search_postings (category, keyword, link, rank) VALUES (?, ?, ?, ?)",
+            [(category, keyword, link, rank) for rank, link in enumerate(merged)],
+        )
+
+    def _known_links(self, conn, links: list[str]) -> set[str]:
+        known = set()
+        # SQLite 바인딩 변수 수 제한을 피해 나눠서 조회
+        for i in range(0, len(links), 500):
+            chunk = links[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(row[0] for row in conn.execute(
+                f"SELECT link FROM postings WHERE link IN ({placeholders})", chunk
+            ))
+        return known
+
+    def _prune(self, conn, now: float) -> None:
+        cutoff = now - self.retention
+        conn.execute(
+            "DELETE FROM search_postings WHERE link IN (SELECT link FROM postings WHERE last_seen < ?)", (cutoff,)
+        )
+        conn.execute("DELETE FROM postings WHERE last_seen < ?", (cutoff,))
+
+    # --- 조회 ---
+
+    def load(
+        self, category: str, keyword: str, since: float | None = None, pages: int | None = None,
+    ) -> StoredSearch | None:
+        """저장된 검색 결과 (저장된 적 없으면 None)
+
+        since가 있으면 그 이후 처음 본 공고만, pages가 저장된 페이지 수보다 적으면 사이트별로 앞쪽 공고만
+        (사이트마다 페이지 크기가 달라 저장된 공고 수를 페이지 비율로 자름).
+        """
+        keyword = _normalize_keyword(keyword)
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT refreshed_at, pages, sources FROM searches WHERE category = ? AND keyword = ?",
+            (category, keyword),
+        ).fetchone()
+        if row is None:
+            return None
+        refreshed_at, stored_pages, sources = row
+
+        cutoff = time.time() - self.retention
+        rows = conn.execute(
+            "SELECT p.link, p.source, p.company, p.title, p.conditions, p.keywords, p.first_seen"
+            " FROM search_postings s JOIN postings p ON p.link = s.link"
+            " WHERE s.category = ? AND s.keyword = ? AND p.last_seen >= ?"
+            " ORDER BY s.rank",
+            (category, keyword, cutoff),
+        ).fetchall()
+        if pages is not None and pages < stored_pages:
+            rows = _first_pages(rows, pages, stored_pages)
+        postings = []
+        first_seen = {}
+        for link, source, company, title, conditions, keywords, seen in rows:
+            if since is not None and seen <= since:
+                continue
+            postings.append(JobPosting(
+                company=company,
+                title=title,
+                link=link,
+                conditions=json.loads(conditions),
+                keywords=json.loads(keywords),
+                source=source,
+            ))
+            first_seen[link] = seen
+        # 사이트 순서는 마지막 크롤링 순서대로 (라운드 로빈 시작 사이트 유지)
+        sources = json.loads(sources)
+        order = {name: i for i, name in enumerate(sources)}
+        postings.sort(key=lambda p: order.get(p.source, len(order)))
+        return StoredSearch(postings, first_seen, refreshed_at, stored_pages, sources)
+
+    def links(self, category: str, keyword: str) -> set[str]:
+        """이 검색에서 이미 본 공고 링크 (증분 크롤링 중단 판단용)"""
+        rows = self._conn().execute(
+            "SELECT link FROM search_postings WHERE category = ? AND keyword = ?",
+            (category, _normalize_keyword(keyword)),
+        )
+        return {row[0] for row in rows}
+
+    # --- 백그라운드 갱신 ---
+
+    def refresh_in_background(self, category: str, keyword: str, refresh) -> bool:
+        """같은 검색의 갱신이 진행 중이 아니면 refresh()를 데몬 스레드로 실행
+
+        REFRESH_TIMEOUT이 지나도 끝나지 않은 갱신(멈춘 스레드)은 진행 중으로 보지 않는다.
+        """
+        key = (category, _normalize_keyword(keyword))
+        now = time.monotonic()
+        with self._refresh_lock:
+            started = self._refreshing.get(key)
+            if started is not None and now - started < REFRESH_TIMEOUT:
+                return False
+            self._refreshing[key] = now
+
+        def _run():
+            try:
+                refresh()
+            except Exception as e:
+                print(f"[{category}] 백그라운드 갱신 실패: {e}")
+            finally:
+                with self._refresh_lock:
+                    if self._refreshing.get(key) == now:
+                        del self._refreshing[key]
+
+        threading.Thread(target=_run, name=f"refresh-{category}", daemon=True).start()
+        return True
+
+    def clear(self) -> None:
+        conn = self._conn()
+        with conn:
+            for table in ("postings", "search_postings", "searches"):
+                conn.execute(f"DELETE FROM {table}")
+
+
+def _normalize_keyword(keyword: str) -> str:
+    return keyword.strip().lower()
+
+
+def _first_pages(rows: list[tuple], pages: int, stored_pages: int) -> list[tuple]:
+    """rank 순 행에서 사이트별 앞쪽 pages / stored_pages 비율만 (올림)"""
+    counts: dict[str, int] = {}
+    for row in rows:
+        counts[row[1]] = counts.get(row[1], 0) + 1
+    limits = {source: -(-count * pages // stored_pages) for source, count in counts.items()}
+    taken: dict[str, int] = {}
+    kept = []
+    for row in rows:
+        source = row[1]
+        if taken.get(source, 0) < limits[source]:
+            taken[source] = taken.get(source, 0) + 1
+            kept.append(row)
+    return kept
+
+
+def _store_from_env() -> PostingStore | None:
+    if os.environ.get("POSTING_STORE", "sqlite").lower() == "off":
+        return None
+    return PostingStore(
+        os.environ.get("POSTING_STORE_PATH", DEFAULT_PATH),
+        fresh=float(os.environ.get("POSTING_STORE_FRESH", DEFAULT_FRESH)),
+        max_age=float(os.environ.get("POSTING_STORE_MAX_AGE", DEFAULT_MAX_AGE)),
+        retention=float(os.environ.get("POSTING_STORE_RETENTION", DEFAULT_RETENTION)),
+        background=os.environ.get(
+            "POSTING_STORE_BACKGROUND", "0" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else "1",
+        ) != "0",
+    )
+
+
+posting_store = _store_from_env()
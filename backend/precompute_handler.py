@@ -0,0 +1,85 @@
+"""사전 계산 Lambda 핸들러 - EventBridge 스케줄로 주기 실행
+
+11개 직군의 기본 검색(키워드 = 직군명, 허용 키워드 전체, 지역 없음)을 크롤링 + 필터링해
+precomputed_store에 저장한다. 사이트별 크롤링은 crawl_handler.handler를 그대로 호출하므로
+Step Functions 경로와 같은 캐시/요청 속도 제한/응답 시간 예산 처리를 따른다.
+
+로컬 실행: python -m backend.precompute_handler [--interval 600]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import crawl_handler
+    from dedup import dedupe
+    from filter_engine import filter_postings, load_categories
+    from precomputed_store import precomputed_store
+    from result_transport import result_transport
+except ImportError:
+    from backend import crawl_handler
+    from backend.dedup import dedupe
+    from backend.filter_engine import filter_postings, load_categories
+    from backend.precomputed_store import precomputed_store
+    from backend.result_transport import result_transport
+
+DEFAULT_PAGES = 1
+
+
+def precompute(category_id: str, pages: int = DEFAULT_PAGES, deadline_ms: int | None = None) -> dict:
+    """직군 하나의 기본 검색 결과를 계산해 저장하고 요약 반환"""
+    keyword = load_categories()[category_id]["name"]
+    events = [
+        {"crawler": name, "keyword": keyword, "pages": pages, "category": category_id, "deadline_ms": deadline_ms}
+        for name in crawl_handler.CRAWLERS
+    ]
+    with ThreadPoolExecutor(max_workers=len(events)) as pool:
+        outputs = list(pool.map(lambda event: crawl_handler.handler(event, None), events))
+
+    postings = []
+    sources = {}
+    for output in outputs:
+        sources[output["crawler"]] = crawl_handler.output_status(output)
+        postings.extend(result_transport.unpack(output))
+
+    # 실제로 크롤링에 성공한 사이트가 없으면(실패/서킷 열림뿐) 이전 결과를 덮어쓰지 않음
+    if "ok" not in sources.values():
+        return {"saved": False, "sources": sources}
+
+    results = filter_postings(dedupe(postings), category_id)
+    precomputed_store.save(category_id, keyword, pages, results, sources)
+    return {"saved": True, "postings": len(postings), "results": len(results), "sources": sources}
+
+
+def handler(event, context):
+    """모든 직군(또는 event["categories"])을 차례로 사전 계산"""
+    event = event or {}
+    categories = event.get("categories") or list(load_categories())
+    pages = event.get("pages", DEFAULT_PAGES)
+    deadline_ms = event.get("deadline_ms")
+
+    report = {}
+    for category_id in categories:
+        start = time.perf_counter()
+        try:
+            report[category_id] = precompute(category_id, pages, deadline_ms)
+        except Exception as e:
+            print(f"[{category_id}] 사전 계산 실패: {e}")
+            report[category_id] = {"saved": False, "error": str(e)}
+        report[category_id]["seconds"] = round(time.perf_counter() - start, 2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="직군별 기본 검색 사전 계산")
+    parser.add_argument("--interval", type=float, help="초 단위 반복 간격 (없으면 한 번만 실행)")
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="크롤링 페이지 수")
+    args = parser.parse_args()
+
+    while True:
+        for category_id, summary in handler({"pages": args.pages}, None).items():
+            print(f"{category_id:<12} {summary}")
+        if not args.interval:
+            break
+        time.sleep(args.interval)
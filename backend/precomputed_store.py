@@ -0,0 +1,197 @@
+"""직군별 기본 검색 사전 계산 결과 저장소
+
+precompute_handler가 주기적으로 11개 직군의 기본 검색(keyword/allowed_keywords 없음)을 크롤링 +
+필터링해 여기에 저장하고, API는 기본 검색 요청을 크롤링 없이 이 결과로 응답한다.
+API Lambda와 사전 계산 Lambda는 /tmp를 공유하지 않으므로 Lambda에서는 S3를 쓴다.
+
+저장 형식: 직군별 JSON 1개 ({category}.json)
+    {"category", "keyword", "pages", "created_at", "sources", "results": [공고 + 매칭 결과]}
+results는 필터링 순서 그대로 (라운드 로빈 전) 저장하고, API는 이 공고로 만든 역색인(keyword_index)으로
+지역 필터나 허용 키워드 변경을 응답 시점에 적용한다.
+
+환경 변수
+    PRECOMPUTED_BUCKET          S3 버킷 (있으면 S3, 없으면 로컬 디렉터리)
+    PRECOMPUTED_DIR             로컬 디렉터리 (기본 /tmp/job-finder-precomputed)
+    PRECOMPUTED_MAX_AGE         초 - 이보다 오래된 결과는 쓰지 않음 (기본 3600)
+    PRECOMPUTED_CHECK_INTERVAL  초 - 저장소에 새 결과가 있는지 확인하는 간격 (기본 30)
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from pathlib import Path
+
+try:
+    from crawlers.saramin import JobPosting
+    from filter_engine import FilterResult
+    from keyword_index import KeywordIndex
+except ImportError:
+    from backend.crawlers.saramin import JobPosting
+    from backend.filter_engine import FilterResult
+    from backend.keyword_index import KeywordIndex
+
+DEFAULT_DIR = "/tmp/job-finder-precomputed"
+DEFAULT_MAX_AGE = 3600
+DEFAULT_CHECK_INTERVAL = 30.0
+
+
+@dataclass
+class Precomputed:
+    """직군 하나의 사전 계산 결과"""
+    category: str
+    keyword: str
+    pages: int
+    created_at: float
+    sources: dict[str, str]
+    results: list[FilterResult]
+
+    @cached_property
+    def index(self) -> KeywordIndex:
+        """지역/허용 키워드를 바꿔 다시 분류하기 위한 역색인 (처음 쓸 때 한 번 생성)"""
+        return KeywordIndex([r.posting for r in self.results], self.category)
+
+
+class LocalBackend:
+    """로컬 디렉터리 (로컬 개발 서버 + 같은 머신의 사전 계산 스크립트)"""
+
+    def __init__(self, path: str = DEFAULT_DIR):
+        self.path = Path(path)
+
+    def version(self, name: str) -> str | None:
+        try:
+            return str((self.path / name).stat().st_mtime_ns)
+        except FileNotFoundError:
+            return None
+
+    def read(self, name: str) -> bytes | None:
+        try:
+            return (self.path / name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write(self, name: str, data: bytes) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        tmp = self.path / f".{name}.tmp"
+        tmp.write_bytes(data)
+        tmp.replace(self.path / name)
+
+
+class S3Backend:
+    """S3 버킷 (Lambda 간 공유)"""
+
+    def __init__(self, bucket: str, prefix: str = "precomputed/"):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self._s3 = boto3.client("s3")
+
+    def version(self, name: str) -> str | None:
+        try:
+            return self._s3.head_object(Bucket=self.bucket, Key=self.prefix + name)["ETag"]
+        except self._s3.exceptions.ClientError:
+            return None
+
+    def read(self, name: str) -> bytes | None:
+        try:
+            return self._s3.get_object(Bucket=self.bucket, Key=self.prefix + name)["Body"].read()
+        except self._s3.exceptions.NoSuchKey:
+            return None
+
+    def write(self, name: str, data: bytes) -> None:
+        self._s3.put_object(Bucket=self.bucket, Key=self.prefix + name, Body=data, ContentType="application/json")
+
+
+class PrecomputedStore:
+    """사전 계산 결과 저장/조회 (조회 결과는 버전이 바뀔 때까지 프로세스 메모리에 유지)"""
+
+    def __init__(self, backend, max_age: float = DEFAULT_MAX_AGE, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.backend = backend
+        self.max_age = max_age
+        self.check_interval = check_interval
+        # category → (버전, 마지막 확인 시각, 결과)
+        self._cache: dict[str, tuple[str | None, float, Precomputed | None]] = {}
+        self._lock = threading.Lock()
+
+    def save(self, category: str, keyword: str, pages: int, results: list[FilterResult], sources: dict[str, str]) -> None:
+        payload = {
+            "category": category,
+            "keyword": keyword,
+            "pages": pages,
+            "created_at": time.time(),
+            "sources": sources,
+            "results": [
+                {
+                    **asdict(r.posting),
+                    "matched": r.matched,
+                    "matched_keywords": r.matched_keywords,
+                    "excluded_keywords": r.excluded_keywords,
+                }
+                for r in results
+            ],
+        }
+        self.backend.write(f"{category}.json", json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def load(self, category: str) -> Precomputed | None:
+        """직군의 사전 계산 결과 (없거나 max_age보다 오래됐으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(category)
+        if cached is not None and now - cached[1] < self.check_interval:
+            return self._fresh(cached[2])
+
+        name = f"{category}.json"
+        version = self.backend.version(name)
+        if cached is not None and version == cached[0]:
+            precomputed = cached[2]
+        else:
+            data = self.backend.read(name) if version is not None else None
+            precomputed = _decode(json.loads(data)) if data is not None else None
+        with self._lock:
+            self._cache[category] = (version, now, precomputed)
+        return self._fresh(precomputed)
+
+    def _fresh(self, precomputed: Precomputed | None) -> Precomputed | None:
+        if precomputed is None or time.time() - precomputed.created_at > self.max_age:
+            return None
+        return precomputed
+
+
+def _decode(payload: dict) -> Precomputed:
+    results = []
+    for item in payload["results"]:
+        matched = item.pop("matched")
+        matched_keywords = item.pop("matched_keywords")
+        excluded_keywords = item.pop("excluded_keywords")
+        results.append(FilterResult(
+            posting=JobPosting(**item),
+            matched=matched,
+            matched_keywords=tuple(matched_keywords),
+            excluded_keywords=tuple(excluded_keywords),
+        ))
+    return Precomputed(
+        category=payload["category"],
+        keyword=payload["keyword"],
+        pages=payload["pages"],
+        created_at=payload["created_at"],
+        sources=payload["sources"],
+        results=results,
+    )
+
+
+def _backend_from_env():
+    bucket = os.environ.get("PRECOMPUTED_BUCKET")
+    if bucket:
+        return S3Backend(bucket)
+    return LocalBackend(os.environ.get("PRECOMPUTED_DIR", DEFAULT_DIR))
+
+
+precomputed_store = PrecomputedStore(
+    _backend_from_env(),
+    max_age=float(os.environ.get("PRECOMPUTED_MAX_AGE", DEFAULT_MAX_AGE)),
+    check_interval=float(os.environ.get("PRECOMPUTED_CHECK_INTERVAL", DEFAULT_CHECK_INTERVAL)),
+)
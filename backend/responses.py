@@ -0,0 +1,86 @@
+"""JSON 응답 직렬화 + 압축 - /api/jobs처럼 공고가 많이 나가는 응답용
+
+    - orjson이 있으면 orjson, 없으면 표준 json (공백 없는 구분자, ensure_ascii=False)
+    - Accept-Encoding에 따라 brotli(brotli 패키지가 있을 때) 또는 gzip으로 압축
+      (작은 응답은 압축하지 않음, Mangum은 압축된 본문을 base64로 API Gateway에 넘긴다)
+
+환경 변수
+    RESPONSE_COMPRESS_MIN_BYTES  이보다 작은 응답은 압축하지 않음 (기본 1024, 0이면 압축 안 함)
+"""
+
+import gzip
+import json
+import os
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    from metrics import span
+except ImportError:
+    from backend.metrics import span
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_MIN_BYTES = int(os.environ.get("RESPONSE_COMPRESS_MIN_BYTES", 1024))
+GZIP_LEVEL = 5       # 6(기본) 대비 크기 차이는 작고 CPU는 덜 씀
+BROTLI_QUALITY = 4   # 응답마다 압축하므로 11(기본) 대신 빠른 단계
+
+
+def dumps(payload) -> bytes:
+    """JSON 직렬화 (UTF-8 bytes)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding에서 쓸 압축 방식 (br > gzip, q=0이면 제외, *는 따로 적지 않은 방식에 적용)"""
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        params = params.strip()
+        q = 1.0
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip()] = q
+
+    def _accepts(coding: str) -> bool:
+        return weights.get(coding, weights.get("*", 0.0)) > 0
+
+    if brotli is not None and _accepts("br"):
+        return "br"
+    if _accepts("gzip"):
+        return "gzip"
+    return None
+
+
+def gzip_compress(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def json_response(payload, request: Request, status_code: int = 200) -> Response:
+    """payload를 직렬화하고 클라이언트가 받을 수 있으면 압축한 응답"""
+    with span("serialize"):
+        body = dumps(payload)
+    headers = {"Vary": "Accept-Encoding"}
+    encoding = None
+    if COMPRESS_MIN_BYTES and len(body) >= COMPRESS_MIN_BYTES:
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    if encoding:
+        with span("compress"):
+            body = brotli.compress(body, quality=BROTLI_QUALITY) if encoding == "br" else gzip_compress(body)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(body, status_code=status_code, media_type="application/json", headers=headers)
@@ -0,0 +1,177 @@
+"""크롤러 Lambda → API Lambda 결과 전달 형식 (Step Functions 페이로드)
+
+Express 상태 머신은 Map 상태의 작업별 결과를 합친 전체 출력이 256KB를 넘으면 실패하므로
+공고 목록을 그대로(asdict 리스트) 넘기지 않고
+    1. 열 단위(columnar)로 모아 회사명/사이트명/조건/키워드는 어휘 ID로 바꾸고
+    2. JSON → zlib 압축 → base64 문자열로 인라인 전달
+    3. 압축해도 RESULT_OFFLOAD_BYTES를 넘으면 블롭 저장소(S3, 로컬은 디렉터리)에 쓰고 키만 전달
+받는 쪽(unpack)은 세 형식과 이전 형식({"postings": [...]})을 모두 읽는다. 블롭은 한 번 읽으면 지운다.
+
+인라인 한도는 실행 하나의 작업 수가 MAX_EXECUTION_ITEMS(30개) 이하라는 전제로 정한다
+(256KB ÷ 30 - 작업별 메타데이터 여유분). 작업 목록을 실행으로 나누는 쪽(main._run_plan_step_functions)이
+이 수를 넘기지 않는다.
+
+결과 형식 (크롤러 결과 dict에 합쳐짐)
+    {"encoding": "columnar+zlib", "data": "<base64>"}   인라인
+    {"encoding": "columnar+zlib", "ref": "<블롭 키>"}    오프로드
+    {"postings": [asdict(JobPosting), ...]}              RESULT_ENCODING=json (디버깅용)
+
+환경 변수
+    RESULT_ENCODING       columnar | json (기본 columnar)
+    RESULT_OFFLOAD_BYTES  인라인 최대 크기 (기본 MAX_EXECUTION_ITEMS에서 계산한 값, 약 7.5KB)
+    RESULT_BUCKET         블롭 S3 버킷 (없으면 로컬 디렉터리)
+    RESULT_DIR            블롭 로컬 디렉터리 (기본 /tmp/job-finder-results)
+"""
+
+import base64
+import json
+import os
+import secrets
+import zlib
+from dataclasses import asdict
+from pathlib import Path
+
+try:
+    from crawlers.saramin import JobPosting
+except ImportError:
+    from backend.crawlers.saramin import JobPosting
+
+ENCODING = "columnar+zlib"
+# Express 상태 머신 실행 출력 한도와 실행 하나의 최대 작업 수 - 한 검색(사이트 6~7개 × 최대 5페이지 = 최대 35개)이나
+# 배치 작업 목록도 main._run_plan_step_functions가 30개씩 나눠 실행하므로 실행 하나의 작업은 항상 30개 이하
+PAYLOAD_LIMIT_BYTES = 256 * 1024
+MAX_EXECUTION_ITEMS = 30
+# 작업별 결과에서 공고 외 필드(crawler/keyword/page/timings/cache 등)와 Map 출력 구분자 여유분
+ITEM_OVERHEAD_BYTES = 1_024
+DEFAULT_OFFLOAD_BYTES = PAYLOAD_LIMIT_BYTES // MAX_EXECUTION_ITEMS - ITEM_OVERHEAD_BYTES
+DEFAULT_DIR = "/tmp/job-finder-results"
+
+
+class LocalBlobStore:
+    """로컬 디렉터리 블롭 저장소 (로컬 실행/테스트)"""
+
+    def __init__(self, path: str = DEFAULT_DIR):
+        self.path = Path(path)
+
+    def write(self, key: str, data: bytes) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / key).write_bytes(data)
+
+    def read(self, key: str) -> bytes:
+        return (self.path / key).read_bytes()
+
+    def delete(self, key: str) -> None:
+        (self.path / key).unlink(missing_ok=True)
+
+
+class S3BlobStore:
+    """S3 블롭 저장소 (크롤러 Lambda가 쓰고 API Lambda가 읽음, 버킷 수명 주기로 남은 블롭 정리)"""
+
+    def __init__(self, bucket: str, prefix: str = "results/"):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self._s3 = boto3.client("s3")
+
+    def write(self, key: str, data: bytes) -> None:
+        self._s3.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def read(self, key: str) -> bytes:
+        return self._s3.get_object(Bucket=self.bucket, Key=self.prefix + key)["Body"].read()
+
+    def delete(self, key: str) -> None:
+        self._s3.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+
+def encode(postings: list[JobPosting]) -> bytes:
+    """공고 목록 → 열 단위 JSON (zlib 압축)"""
+    vocab: dict[str, int] = {}
+
+    def _id(value: str) -> int:
+        return vocab.setdefault(value, len(vocab))
+
+    columns = {
+        "company": [_id(p.company) for p in postings],
+        "title": [p.title for p in postings],
+        "link": [p.link for p in postings],
+        "source": [_id(p.source) for p in postings],
+        "conditions": [[_id(v) for v in p.conditions] for p in postings],
+        "keywords": [[_id(v) for v in p.keywords] for p in postings],
+        # 병합된 공고만 links가 있으므로 {행 번호: links}
+        "links": {str(i): p.links for i, p in enumerate(postings) if p.links},
+    }
+    body = json.dumps({"vocab": list(vocab), "columns": columns}, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(body.encode("utf-8"), 6)
+
+
+def decode(data: bytes) -> list[JobPosting]:
+    """encode()의 역"""
+    payload = json.loads(zlib.decompress(data))
+    vocab = payload["vocab"]
+    c = payload["columns"]
+    links = c["links"]
+    return [
+        JobPosting(
+            company=vocab[company],
+            title=title,
+            link=link,
+            conditions=[vocab[v] for v in conditions],
+            keywords=[vocab[v] for v in keywords],
+            source=vocab[source],
+            links=links.get(str(i)),
+        )
+        for i, (company, title, link, source, conditions, keywords) in enumerate(
+            zip(c["company"], c["title"], c["link"], c["source"], c["conditions"], c["keywords"])
+        )
+    ]
+
+
+class ResultTransport:
+    """크롤러 결과 포장(pack) / 풀기(unpack)"""
+
+    def __init__(self, blob_store=None, encoding: str = "columnar", offload_bytes: int = DEFAULT_OFFLOAD_BYTES):
+        self.blob_store = blob_store
+        self.encoding = encoding
+        self.offload_bytes = offload_bytes
+
+    def pack(self, postings: list[JobPosting]) -> dict:
+        """크롤러 결과 dict에 합칠 공고 필드"""
+        if self.encoding == "json":
+            return {"postings": [asdict(p) for p in postings]}
+        data = encode(postings)
+        inline = base64.b64encode(data).decode("ascii")
+        if self.blob_store is None or len(inline) <= self.offload_bytes:
+            return {"encoding": ENCODING, "data": inline}
+        key = f"{secrets.token_urlsafe(16)}.bin"
+        self.blob_store.write(key, data)
+        return {"encoding": ENCODING, "ref": key}
+
+    def unpack(self, result: dict) -> list[JobPosting]:
+        """크롤러 결과 dict → 공고 목록 (형식 자동 판별, 공고 필드가 없으면 빈 목록)"""
+        if "postings" in result:
+            return [JobPosting(**p) for p in result["postings"]]
+        if result.get("encoding") != ENCODING:
+            return []
+        if "ref" in result:
+            data = self.blob_store.read(result["ref"])
+            try:
+                self.blob_store.delete(result["ref"])
+            except Exception as e:
+                print(f"결과 블롭 삭제 실패 ({result['ref']}): {e}")
+            return decode(data)
+        return decode(base64.b64decode(result["data"]))
+
+
+def _blob_store_from_env():
+    bucket = os.environ.get("RESULT_BUCKET")
+    if bucket:
+        return S3BlobStore(bucket)
+    return LocalBlobStore(os.environ.get("RESULT_DIR", DEFAULT_DIR))
+
+
+result_transport = ResultTransport(
+    _blob_store_from_env(),
+    encoding=os.environ.get("RESULT_ENCODING", "columnar").lower(),
+    offload_bytes=int(os.environ.get("RESULT_OFFLOAD_BYTES", DEFAULT_OFFLOAD_BYTES)),
+)
@@ -0,0 +1,117 @@
+"""검색 결과 스냅샷 저장소 - 페이지 이동 시 재크롤링 없이 같은 결과를 잘라서 반환
+
+첫 요청에서 필터링 + 라운드 로빈까지 끝난 결과를 스냅샷으로 저장하고 ID를 발급한다.
+이후 같은 검색 조건 + snapshot_id 요청은 저장된 리스트에서 O(page_size)로 슬라이스한다.
+
+환경 변수
+    SNAPSHOT_TTL        초 단위 TTL (기본 600)
+    SNAPSHOT_MAX_ITEMS  전체 스냅샷에 보관할 최대 공고 수 (기본 50000) - 스냅샷과 함께 보관하는 역색인도
+                        공고 수 단위 크기(KeywordIndex.size)로 센다
+"""
+
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+DEFAULT_TTL = 600
+DEFAULT_MAX_ITEMS = 50_000
+
+
+@dataclass
+class Snapshot:
+    """필터링 + 라운드 로빈이 끝난 검색 결과"""
+    id: str
+    query: tuple          # 검색 조건 (다른 조건으로 재사용 방지)
+    matched: list
+    excluded: list
+    created_at: float
+    sources: dict = field(default_factory=dict)   # 사이트별 크롤링 상태 (ok / error / late)
+    refreshed_at: float | None = None              # 공고 저장소 갱신 시각 (저장소를 거친 경우)
+    index: object | None = None                    # 크롤링 결과 역색인 (허용 키워드/지역만 바꿔 재분류)
+    size: int = 0                                  # 상한 계산용 크기 (저장할 때 한 번 계산)
+
+
+class SnapshotStore:
+    """TTL + 전체 공고 수 상한을 가진 스냅샷 저장소 (오래 안 쓴 것부터 제거)"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_items: int = DEFAULT_MAX_ITEMS):
+        self.ttl = ttl
+        self.max_items = max_items
+        self._data: OrderedDict[str, Snapshot] = OrderedDict()
+        self._total_items = 0
+        self._lock = threading.Lock()
+
+    def put(
+        self,
+        query: tuple,
+        matched: list,
+        excluded: list,
+        sources: dict | None = None,
+        refreshed_at: float | None = None,
+        index: object | None = None,
+    ) -> Snapshot:
+        """스냅샷 저장 후 반환 (상한을 넘는 단일 스냅샷은 저장하지 않고 반환만)"""
+        snapshot = Snapshot(
+            id=secrets.token_urlsafe(12),
+            query=query,
+            matched=matched,
+            excluded=excluded,
+            created_at=time.time(),
+            sources=sources or {},
+            refreshed_at=refreshed_at,
+            index=index,
+        )
+        # 역색인은 지역 비트셋이 나중에 추가되므로 저장 시점 크기로 고정 (제거할 때 같은 값을 뺌)
+        snapshot.size = len(matched) + len(excluded) + (getattr(index, "size", 0) if index is not None else 0)
+        if snapshot.size > self.max_items:
+            return snapshot
+
+        with self._lock:
+            self._evict_expired()
+            while self._data and self._total_items + snapshot.size > self.max_items:
+                _, old = self._data.popitem(last=False)
+                self._total_items -= old.size
+            self._data[snapshot.id] = snapshot
+            self._total_items += snapshot.size
+        return snapshot
+
+    def get(self, snapshot_id: str, query: tuple) -> Snapshot | None:
+        """스냅샷 조회 (만료됐거나 검색 조건이 다르면 None)"""
+        with self._lock:
+            snapshot = self._data.get(snapshot_id)
+            if snapshot is None:
+                return None
+            if snapshot.created_at + self.ttl < time.time():
+                del self._data[snapshot_id]
+                self._total_items -= snapshot.size
+                return None
+            if snapshot.query != query:
+                return None
+            self._data.move_to_end(snapshot_id)
+            return snapshot
+
+    def peek(self, snapshot_id: str) -> Snapshot | None:
+        """검색 조건과 관계없이 스냅샷 조회 (만료됐으면 None)"""
+        with self._lock:
+            snapshot = self._data.get(snapshot_id)
+            if snapshot is None or snapshot.created_at + self.ttl < time.time():
+                return None
+            return snapshot
+
+    def _evict_expired(self) -> None:
+        deadline = time.time() - self.ttl
+        # 삽입 순서와 만료 순서가 다를 수 있어(조회 시 move_to_end) 전체 확인
+        for sid in [sid for sid, s in self._data.items() if s.created_at < deadline]:
+            self._total_items -= self._data.pop(sid).size
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+snapshot_store = SnapshotStore(
+    ttl=float(os.environ.get("SNAPSHOT_TTL", DEFAULT_TTL)),
+    max_items=int(os.environ.get("SNAPSHOT_MAX_ITEMS", DEFAULT_MAX_ITEMS)),
+)
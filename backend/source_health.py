@@ -0,0 +1,202 @@
+"""사이트별 상태 추적 + 서킷 브레이커
+
+사이트 하나가 느려지거나 요청을 막기 시작하면(타임아웃, 429, 5xx) 모든 검색이 그 사이트를 기다리다 같은 이유로
+실패한다. 사이트마다 최근 호출 결과(성공 여부, 소요 시간) 윈도우를 두고
+
+    closed     평소 상태 - 최근 SOURCE_CB_MIN_CALLS번 이상 중 실패(오류 또는 SOURCE_CB_SLOW_MS 초과) 비율이
+               SOURCE_CB_FAILURE_RATE 이상이면 open
+    open       냉각 시간 동안 호출하지 않음 - 마지막으로 성공한 결과(last good)가 있으면 그것으로 응답
+    half_open  냉각 시간이 지나면 시험 호출을 HALF_OPEN_CALLS번까지 허용 (한 검색의 여러 페이지)
+               성공하면 closed, 실패하면 다시 open (냉각 시간은 연속으로 열릴 때마다 두 배, 최대 SOURCE_CB_MAX_COOLDOWN)
+
+호출 결과는 실제 사이트 요청(crawl_cache / async_engine의 fetch)마다 track()으로 기록하므로 캐시 hit은 세지 않는다.
+상태는 프로세스(Lambda 컨테이너)마다 따로 유지한다. Step Functions 경로는 API Lambda가 작업 결과로 기록하고
+열린 사이트는 작업 목록에서 빼므로 크롤러 Lambda를 호출하지 않는다.
+
+환경 변수
+    SOURCE_CB                 0이면 서킷 브레이커 끔 (기본 1, 상태 기록은 계속)
+    SOURCE_CB_WINDOW          사이트별 최근 호출 윈도우 크기 (기본 20)
+    SOURCE_CB_MIN_CALLS       판정에 필요한 최소 호출 수 (기본 5)
+    SOURCE_CB_FAILURE_RATE    open 기준 실패 비율 (기본 0.5)
+    SOURCE_CB_SLOW_MS         이보다 오래 걸린 성공도 실패로 셈 (기본 8000)
+    SOURCE_CB_COOLDOWN        첫 냉각 시간(초) (기본 30)
+    SOURCE_CB_MAX_COOLDOWN    최대 냉각 시간(초) (기본 300)
+    SOURCE_LAST_GOOD_MAX      last good 결과 최대 보관 수 (기본 256, 오래 안 쓴 것부터 제거)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+try:
+    from crawlers.saramin import JobPosting
+except ImportError:
+    from backend.crawlers.saramin import JobPosting
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+HALF_OPEN_CALLS = 5   # crawl_pages 최대값 - 시험 검색 하나의 모든 페이지 작업을 허용
+
+
+class CircuitBreaker:
+    """사이트 하나의 호출 결과 윈도우 + 서킷 상태"""
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_seconds: float = 8.0,
+        cooldown: float = 30.0,
+        max_cooldown: float = 300.0,
+    ):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_seconds = slow_seconds
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = CLOSED
+        self.trips = 0            # 연속으로 열린 횟수 (냉각 시간 배수)
+        self.opened_at = 0.0
+        self.probes = 0           # half_open에서 허용한 시험 호출 수
+        self.probed_at = 0.0
+        self._calls: deque[tuple[bool, float]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def _cooldown(self) -> float:
+        return min(self.max_cooldown, self.cooldown * 2 ** max(0, self.trips - 1))
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 (half_open 전환과 시험 호출 수 계산 포함)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self._cooldown():
+                    return False
+                self.state = HALF_OPEN
+                self.probes = 0
+            now = time.monotonic()
+            if self.probes >= HALF_OPEN_CALLS:
+                # 시험 호출이 결과를 남기지 않았으면 (캐시 hit, 버려진 작업) 냉각 시간 뒤 다시 시험
+                if now - self.probed_at < self._cooldown():
+                    return False
+                self.probes = 0
+            if self.probes == 0:
+                self.probed_at = now
+            self.probes += 1
+            return True
+
+    def record(self, ok: bool, seconds: float) -> None:
+        failed = not ok or seconds >= self.slow_seconds
+        with self._lock:
+            self._calls.append((not failed, seconds))
+            if self.state == HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self.state = CLOSED
+                    self.trips = 0
+                    self._calls.clear()
+                return
+            if self.state == CLOSED and len(self._calls) >= self.min_calls:
+                failures = sum(1 for success, _ in self._calls if not success)
+                if failures / len(self._calls) >= self.failure_rate:
+                    self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.trips += 1
+        self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._lock:
+            calls = list(self._calls)
+            state = self.state
+            remaining = self._cooldown() - (time.monotonic() - self.opened_at) if state == OPEN else 0.0
+        latencies = sorted(seconds for _, seconds in calls)
+        return {
+            "state": state,
+            "calls": len(calls),
+            "failure_rate": round(sum(1 for ok, _ in calls if not ok) / len(calls), 3) if calls else 0.0,
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+            "p90_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))] * 1000, 1) if latencies else None,
+            "trips": self.trips,
+            "retry_in_s": round(max(0.0, remaining), 1),
+        }
+
+
+class SourceHealth:
+    """사이트별 서킷 브레이커 + 마지막으로 성공한 결과"""
+
+    def __init__(self, enabled: bool = True, last_good_max: int = 256, **breaker_options):
+        self.enabled = enabled
+        self.last_good_max = last_good_max
+        self._breaker_options = breaker_options
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._last_good: OrderedDict[tuple, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def breaker(self, source: str) -> CircuitBreaker:
+        breaker = self._breakers.get(source)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(source, CircuitBreaker(**self._breaker_options))
+        return breaker
+
+    def allow(self, source: str) -> bool:
+        """source를 호출해도 되는지 (꺼져 있으면 항상 True)"""
+        return not self.enabled or self.breaker(source).allow()
+
+    def record(self, source: str, ok: bool, seconds: float) -> None:
+        self.breaker(source).record(ok, seconds)
+
+    @contextmanager
+    def track(self, source: str):
+        """블록(사이트 요청)의 성공 여부와 소요 시간 기록 - 취소(CancelledError)는 기록하지 않음"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record(source, False, time.perf_counter() - start)
+            raise
+        self.record(source, True, time.perf_counter() - start)
+
+    def remember(self, key: tuple, postings: list[JobPosting]) -> None:
+        """성공한 결과 보관 (key는 호출하는 쪽에서 사이트/검색어/페이지 등으로 구성)"""
+        with self._lock:
+            self._last_good[key] = tuple(postings)
+            self._last_good.move_to_end(key)
+            while len(self._last_good) > self.last_good_max:
+                self._last_good.popitem(last=False)
+
+    def last_good(self, key: tuple) -> list[JobPosting] | None:
+        with self._lock:
+            postings = self._last_good.get(key)
+            if postings is None:
+                return None
+            self._last_good.move_to_end(key)
+        return list(postings)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "sources": {name: breaker.stats() for name, breaker in sorted(self._breakers.items())},
+            "last_good": len(self._last_good),
+        }
+
+
+source_health = SourceHealth(
+    enabled=os.environ.get("SOURCE_CB", "1") != "0",
+    last_good_max=int(os.environ.get("SOURCE_LAST_GOOD_MAX", 256)),
+    window=int(os.environ.get("SOURCE_CB_WINDOW", 20)),
+    min_calls=int(os.environ.get("SOURCE_CB_MIN_CALLS", 5)),
+    failure_rate=float(os.environ.get("SOURCE_CB_FAILURE_RATE", 0.5)),
+    slow_seconds=float(os.environ.get("SOURCE_CB_SLOW_MS", 8000)) / 1000,
+    cooldown=float(os.environ.get("SOURCE_CB_COOLDOWN", 30)),
+    max_cooldown=float(os.environ.get("SOURCE_CB_MAX_COOLDOWN", 300)),
+)
@@ -0,0 +1,179 @@
+"""/api/jobs 부하 테스트 드라이버
+
+동시 사용자(--users)가 --requests개의 get_jobs 요청을 나눠 보내고 p50/p95/p99 응답 시간, 초당 요청 수,
+상태 코드와 사이트별 상태(ok/late/error) 분포를 출력한다.
+
+기본은 한 프로세스 안에서 실행한다. 모의 사이트 서버(bench.mock_sites)를 빈 포트에 띄우고 크롤러 요청을
+그쪽으로 보낸 뒤(transport.upstream) API 앱을 httpx ASGITransport로 호출한다. 크롤링 경로를 측정하도록
+크롤링 캐시/공고 저장소를 끄고(--cached면 유지) 요청마다 검색 키워드를 바꾼다(--distinct-keywords 0이면 고정).
+--api를 주면 이미 떠 있는 API 서버(예: CRAWL_UPSTREAM=http://127.0.0.1:9000 uvicorn backend.main:app)로 보낸다.
+
+실행
+    python -m bench.load --users 20 --requests 200 --latency-ms 300 --jitter-ms 150
+    python -m bench.load --api http://127.0.0.1:8000 --users 50 --requests 1000 --json load.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+from bench import mock_sites
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """정렬된 목록의 q 분위 (nearest-rank)"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_mock_server(config: mock_sites.MockConfig):
+    """모의 사이트 서버를 백그라운드 스레드에서 시작하고 (서버, 주소) 반환"""
+    import uvicorn
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        mock_sites.create_app(config), host="127.0.0.1", port=port, log_level="warning",
+    ))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("모의 사이트 서버 시작 실패")
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def _in_process_app(upstream: str, cached: bool):
+    """크롤러가 upstream으로 요청하는 API 앱 (캐시는 import 전에 환경 변수로 끔)"""
+    if not cached:
+        os.environ["CRAWL_CACHE_BACKEND"] = "off"
+        os.environ["POSTING_STORE"] = "off"
+    from backend.crawlers.transport import transport
+    from backend.main import app
+
+    transport.configure("live", upstream=upstream)
+    return app
+
+
+async def run_load(client: httpx.AsyncClient, args, categories: list[str]) -> dict:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    sources: Counter = Counter()
+    counter = iter(range(args.requests))
+
+    async def _user():
+        for i in counter:
+            params = {
+                "category": categories[i % len(categories)],
+                "crawl_pages": args.crawl_pages,
+                "page_size": args.page_size,
+            }
+            if args.distinct_keywords:
+                params["keyword"] = f"kw{i % args.distinct_keywords}"
+            if args.deadline_ms:
+                params["deadline_ms"] = args.deadline_ms
+            start = time.perf_counter()
+            try:
+                resp = await client.get("/api/jobs", params=params)
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            statuses[resp.status_code] += 1
+            if resp.status_code == 200:
+                for name, status in resp.json().get("sources", {}).items():
+                    sources[f"{name}:{status}"] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_user() for _ in range(args.users)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "requests": args.requests,
+        "users": args.users,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1) if ordered else 0.0,
+        "status": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+        "sources": dict(sorted(sources.items())),
+    }
+
+
+async def _main(args) -> dict:
+    from backend.filter_engine import load_categories
+
+    categories = args.categories.split(",") if args.categories else list(load_categories())
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    if args.api:
+        async with httpx.AsyncClient(base_url=args.api, timeout=timeout, limits=limits) as client:
+            return await run_load(client, args, categories)
+
+    server, upstream = start_mock_server(mock_sites.config_from_args(args))
+    try:
+        app = _in_process_app(upstream, args.cached)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://api", timeout=timeout) as client:
+            report = await run_load(client, args, categories)
+        async with httpx.AsyncClient(base_url=upstream) as client:
+            report["upstream"] = (await client.get("/_stats")).json()
+        return report
+    finally:
+        server.should_exit = True
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Job Finder /api/jobs 부하 테스트")
+    parser.add_argument("--api", help="API 서버 주소 (없으면 모의 사이트 서버와 함께 프로세스 안에서 실행)")
+    parser.add_argument("--users", type=int, default=10, help="동시 사용자 수")
+    parser.add_argument("--requests", type=int, default=100, help="전체 요청 수")
+    parser.add_argument("--categories", help="직군 ID (쉼표 구분, 없으면 전체 순환)")
+    parser.add_argument("--crawl-pages", type=int, default=1)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--deadline-ms", type=int, help="요청별 응답 시간 예산")
+    parser.add_argument("--distinct-keywords", type=int, default=1_000_000,
+                        help="서로 다른 검색 키워드 수 (0이면 직군명 - 스냅샷/사전 계산 결과 재사용)")
+    parser.add_argument("--cached", action="store_true", help="크롤링 캐시/공고 저장소 유지 (프로세스 안 실행)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃(초)")
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    mock_sites.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_main(args))
+
+    print(f"requests {report['requests']}  users {report['users']}  elapsed {report['elapsed_s']:.2f}s  "
+          f"{report['rps']:.1f} req/s")
+    print(f"latency  p50 {report['p50_ms']:.1f} ms  p95 {report['p95_ms']:.1f} ms  "
+          f"p99 {report['p99_ms']:.1f} ms  max {report['max_ms']:.1f} ms")
+    print(f"status   {report['status']}")
+    print(f"sources  {report['sources']}")
+    if "upstream" in report:
+        print(f"upstream {report['upstream']}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
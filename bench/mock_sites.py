@@ -0,0 +1,259 @@
+"""부하 테스트용 모의 채용 사이트 서버 (ASGI)
+
+7개 사이트의 검색 응답을 흉내 낸다. saramin/incruit/linkedin은 HTML, wanted/remember/rallit/jumpit은 JSON을
+각 크롤러 parse_page()가 읽는 형태로 만든다. 공고 내용은 bench.synthetic 합성 공고이고 (사이트, 키워드, 페이지)가
+같으면 응답도 같다. 크롤러는 CRAWL_UPSTREAM=<이 서버 주소>로 요청을 이쪽으로 보낸다 (crawlers/transport.py).
+
+    GET|POST /{원래 호스트}/{경로}   사이트 응답 (예: /www.saramin.co.kr/zf_user/search/recruit?...)
+    GET      /_stats                사이트별 요청/오류(500)/제한(429) 수
+
+설정 (MockConfig, 명령행 인자)
+    results     페이지당 공고 수
+    pages       사이트별 결과가 있는 페이지 수 (넘으면 빈 페이지 - 크롤러의 마지막 페이지 처리)
+    latency_ms  응답 지연, jitter_ms만큼 균등 분포로 흔들림
+    error_rate  500 응답 비율
+    rate        사이트별 초당 허용 요청 수 (넘으면 429, 0이면 제한 없음)
+
+실행
+    python -m bench.mock_sites --port 9000 --results 40 --latency-ms 300 --jitter-ms 150 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from html import escape
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from backend.crawlers.rate_limit import TokenBucket
+
+from bench.synthetic import make_postings
+
+
+@dataclass
+class MockConfig:
+    results: int = 20
+    pages: int = 5
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error_rate: float = 0.0
+    rate: float = 0
+    seed: int = 0
+
+
+def _postings(site: str, keyword: str, page: int, config: MockConfig):
+    """(사이트, 키워드, 페이지)별로 고정된 합성 공고 - 제목 앞에 검색 키워드를 붙임"""
+    if page < 1 or page > config.pages:
+        return []
+    seed = zlib.crc32(f"{config.seed}|{site}|{keyword}|{page}".encode())
+    postings = make_postings(config.results, seed=seed)
+    base = page * 100_000
+    return [
+        (base + i, f"{keyword} {p.title}".strip(), p)
+        for i, p in enumerate(postings)
+    ]
+
+
+def _saramin(keyword: str, params: dict, body: dict, config: MockConfig) -> str:
+    items = []
+    for job_id, title, p in _postings("saramin", keyword, int(params.get("recruitPage", 1)), config):
+        conditions = "".join(f"<span>{escape(c)}</span>" for c in p.conditions)
+        sectors = ", ".join(f'<a href="#">{escape(k)}</a>' for k in p.keywords)
+        items.append(
+            f'<div class="item_recruit" value="{job_id}">'
+            f'<div class="area_corp"><strong class="corp_name"><a href="#">{escape(p.company)}</a></strong></div>'
+            f'<div class="area_job"><h2 class="job_tit">'
+            f'<a href="/zf_user/jobs/relay/view?rec_idx={job_id}">{escape(title)}</a></h2>'
+            f'<div class="job_condition">{conditions}</div>'
+            f'<div class="job_sector">{sectors} <span class="job_day">등록일 25/10/15</span></div>'
+            f"</div></div>"
+        )
+    return f'<html><body><div id="recruit_info_list"><div class="content">{"".join(items)}</div></div></body></html>'
+
+
+def _incruit(keyword: str, params: dict, body: dict, config: MockConfig) -> str:
+    items = []
+    for job_id, title, p in _postings("incruit", keyword, int(params.get("page", 1)), config):
+        conditions = "".join(f"<span>{escape(c)}</span>" for c in p.conditions)
+        items.append(
+            f'<li class="c_col"><div class="cell_first"><div class="cl_top"><a href="#">{escape(p.company)}</a></div></div>'
+            f'<div class="cell_mid"><div class="cl_top">'
+            f'<a href="https://job.incruit.com/jobdb_info/jobpost.asp?job={job_id}">{escape(title)}</a></div>'
+            f'<div class="cl_md">{conditions}</div></div></li>'
+        )
+    return f'<html><body><ul class="c_row">{"".join(items)}</ul></body></html>'
+
+
+def _linkedin(keyword: str, params: dict, body: dict, config: MockConfig) -> str:
+    page = int(params.get("start", 0)) // 25 + 1
+    items = []
+    for job_id, title, p in _postings("linkedin", keyword, page, config):
+        location = p.conditions[0] if p.conditions else ""
+        items.append(
+            f'<li><div class="base-card"><a href="https://kr.linkedin.com/jobs/view/job-{job_id}"></a>'
+            f'<h3 class="base-search-card__title">{escape(title)}</h3>'
+            f'<h4 class="base-search-card__subtitle">{escape(p.company)}</h4>'
+            f'<span class="job-search-card__location">{escape(location)}</span></div></li>'
+        )
+    return f'<html><body><ul class="jobs-search__results-list">{"".join(items)}</ul></body></html>'
+
+
+def _wanted(keyword: str, params: dict, body: dict, config: MockConfig) -> str:
+    # 원티드 API는 검색어를 받지 않는다 (크롤러가 제목으로 거름)
+    limit = int(params.get("limit", 20))
+    page = int(params.get("offset", 0)) // max(1, limit) + 1
+    data = [
+        {
+            "id": job_id,
+            "position": p.title,
+            "company": {"name": p.company},
+            "address": {"location": (p.conditions or [""])[0], "district": ""},
+            "annual_from": 0,
+            "annual_to": 5,
+            "skill_tags": [{"title": k} for k in p.keywords],
+        }
+        for job_id, _, p in _postings("wanted", params.get("tag_type_ids", ""), page, config)
+    ]
+    return json.dumps({"data": data, "links": {}}, ensure_ascii=False)
+
+
+def _remember(keyword: str, params: dict, body: dict, config: MockConfig) -> str:
+    keyword = " ".join(body.get("search", {}).get("keywords", []))
+    data = [
+        {
+            "id": job_id,
+            "title": title,
+            "organization": {"name": p.company},
+            "normalized_address": {"level1": "서울", "level2": "강남구"},
+            "min_experience": 1,
+            "max_experience": 5,
+            "qualifications": " / ".join(p.keywords),
+            "job_description": "",
+        }
+        for job_id, title, p in _postings("remember", keyword, int(body.get("page", 1)), config)
+    ]
+    return json.dumps({"data": data, "meta": {}}, ensure_ascii=False)
+
+
+def _rallit(keyword: str, params: dict, body: dict, config: MockConfig) -> str:
+    items = [
+        {
+            "id": job_id,
+            "title": title,
+            "companyName": p.company,
+            "addressRegion": "SEOUL",
+            "jobSkillKeywords": list(p.keywords),
+            "url": f"https://www.rallit.com/positions/{job_id}",
+            "jobLevel": "JUNIOR",
+        }
+        for job_id, title, p in _postings("rallit", keyword, int(params.get("pageNumber", 1)), config)
+    ]
+    return json.dumps({"data": {"items": items}}, ensure_ascii=False)
+
+
+def _jumpit(keyword: str, params: dict, body: dict, config: MockConfig) -> str:
+    page = int(params.get("page", 1))
+    positions = [
+        {
+            "id": job_id,
+            "title": title,
+            "companyName": p.company,
+            "locations": list(p.conditions[:1]),
+            "minCareer": 0,
+            "maxCareer": 5,
+            "techStacks": list(p.keywords),
+        }
+        for job_id, title, p in _postings("jumpit", keyword, page, config)
+    ]
+    return json.dumps({"result": {"page": page, "positions": positions}}, ensure_ascii=False)
+
+
+# 원래 호스트 → (사이트, 검색어 쿼리 파라미터, 렌더러, 미디어 타입)
+SITES = {
+    "www.saramin.co.kr": ("saramin", "searchword", _saramin, "text/html"),
+    "search.incruit.com": ("incruit", "kw", _incruit, "text/html"),
+    "www.linkedin.com": ("linkedin", "keywords", _linkedin, "text/html"),
+    "www.wanted.co.kr": ("wanted", None, _wanted, "application/json"),
+    "career-api.rememberapp.co.kr": ("remember", None, _remember, "application/json"),
+    "b2c-api.rallit.com": ("rallit", "keyword", _rallit, "application/json"),
+    "jumpit-api.saramin.co.kr": ("jumpit", "keyword", _jumpit, "application/json"),
+}
+
+
+def create_app(config: MockConfig | None = None) -> FastAPI:
+    config = config or MockConfig()
+    app = FastAPI(title="Job Finder mock sites")
+    counts: dict[str, Counter] = {site: Counter() for site, *_ in SITES.values()}
+    buckets = {site: TokenBucket(config.rate, config.rate) for site, *_ in SITES.values()} if config.rate else {}
+    rng = random.Random(config.seed)
+
+    @app.get("/_stats")
+    def stats():
+        return {site: dict(counter) for site, counter in counts.items()}
+
+    @app.api_route("/{host}/{path:path}", methods=["GET", "POST"])
+    async def site(host: str, path: str, request: Request):
+        if host not in SITES:
+            return JSONResponse({"error": f"알 수 없는 사이트: {host}"}, status_code=404)
+        name, keyword_param, render, media_type = SITES[host]
+        counter = counts[name]
+        counter["requests"] += 1
+
+        bucket = buckets.get(name)
+        if bucket is not None and bucket.reserve() > 0:
+            bucket.refund()
+            counter["throttled"] += 1
+            return Response(status_code=429, headers={"Retry-After": "1"})
+
+        delay = config.latency_ms + (rng.uniform(-config.jitter_ms, config.jitter_ms) if config.jitter_ms else 0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if config.error_rate and rng.random() < config.error_rate:
+            counter["errors"] += 1
+            return Response(status_code=500)
+
+        params = dict(request.query_params)
+        body = await request.json() if request.method == "POST" else {}
+        keyword = params.get(keyword_param, "") if keyword_param else ""
+        return Response(render(keyword, params, body, config), media_type=media_type)
+
+    return app
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """MockConfig 명령행 인자 (bench.load도 사용)"""
+    defaults = MockConfig()
+    parser.add_argument("--results", type=int, default=defaults.results, help="페이지당 공고 수")
+    parser.add_argument("--pages", type=int, default=defaults.pages, help="결과가 있는 페이지 수")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms, help="응답 지연 흔들림 폭")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="500 응답 비율 (0 ~ 1)")
+    parser.add_argument("--rate", type=float, default=defaults.rate, help="사이트별 초당 허용 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def config_from_args(args) -> MockConfig:
+    return MockConfig(
+        results=args.results, pages=args.pages, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate=args.rate, seed=args.seed,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Job Finder 모의 채용 사이트 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""HTML 파서 백엔드 벤치마크 (저장된 샘플 페이지 사용, 네트워크 불필요)
+
+실행: python -m bench.parse_bench [반복 횟수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from backend.crawlers import html_parser, incruit, jobkorea, linkedin, saramin
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+PARSERS = {
+    "saramin": lambda html: saramin.parse_page(html, ""),
+    "incruit": lambda html: incruit.parse_page(html, ""),
+    "linkedin": lambda html: linkedin.parse_page(html, ""),
+    "jobkorea": jobkorea._parse_page,
+}
+
+
+def bench(repeat: int = 50) -> dict:
+    """{사이트: {백엔드: 페이지당 ms}} - 백엔드 간 결과가 다르면 AssertionError"""
+    report = {}
+    default_backend = html_parser.BACKEND
+    try:
+        for site, parse in PARSERS.items():
+            html = (FIXTURES / f"{site}.html").read_text(encoding="utf-8")
+            expected = None
+            report[site] = {}
+            for backend in html_parser.BACKENDS:
+                html_parser.BACKEND = backend
+                postings = parse(html)
+                if expected is None:
+                    expected = postings
+                assert postings == expected, f"{site}: {backend} 파싱 결과가 다름"
+
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    parse(html)
+                report[site][backend] = (time.perf_counter() - start) / repeat * 1000
+    finally:
+        html_parser.BACKEND = default_backend
+    return report
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    backends = list(html_parser.BACKENDS)
+    print(f"{'site':<10}" + "".join(f"{b:>14}" for b in backends) + f"{'speedup':>10}")
+    for site, times in bench(repeat).items():
+        row = f"{site:<10}" + "".join(f"{times[b]:>11.2f} ms" for b in backends)
+        if "bs4" in times and len(times) > 1:
+            fastest = min(times.values())
+            row += f"{times['bs4'] / fastest:>9.1f}x"
+        print(row)
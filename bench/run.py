@@ -0,0 +1,252 @@
+"""오프라인 성능 벤치마크 (네트워크 불필요)
+
+단계
+    parse      bench/fixtures 의 사이트별 저장 응답 파싱 (7개 사이트)
+    decode     합성 공고 N개 JSON → JobPosting (크롤링 캐시/사전 계산/Step Functions 결과 복원, peak mem = 공고 N개 메모리)
+    dedup      합성 공고 N개 사이트 간 중복 병합
+    filter     합성 공고 N개 × 11개 직군 filter_postings
+    refilter   제목 필터를 모두 통과하는 공고 N개의 역색인에서 허용 키워드/지역만 바꿔 재분류
+    round_robin  main._round_robin
+    serialize  main._to_dict + responses.dumps (orjson이 있으면 orjson), fields=title,link,source 투영
+    compress   직렬화한 응답 gzip 압축
+    crawl      저장 응답으로 만든 카세트를 재생(CRAWL_TRANSPORT=replay)하며 6개 사이트 × 3페이지 크롤링 경로
+               (crawl_plan → crawl_handler → 파싱 → 결과 포장/풀기), 지연 0ms / 50±20ms
+
+실행
+    python -m bench.run                              # 기본 크기 100, 1k, 10k, 100k
+    python -m bench.run --sizes 100,1000 --json out.json
+    python -m bench.run --baseline base.json --max-regression 1.5   # 느려지면 exit 1
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tempfile
+import tracemalloc
+from dataclasses import asdict, replace
+from pathlib import Path
+
+from backend import crawl_handler
+from backend.crawl_cache import crawl_cache
+from backend.crawlers import incruit, jobkorea, jumpit, linkedin, rallit, remember, saramin, wanted
+from backend.dedup import dedupe
+from backend.filter_engine import FilterResult, filter_postings, load_categories
+from backend.crawlers.transport import Cassette, request_key, transport
+from backend.keyword_index import KeywordIndex
+from backend.main import _round_robin, _run_plan_threads, _to_dict
+from backend.responses import dumps, gzip_compress
+
+from bench.synthetic import make_postings
+
+FIXTURES = Path(__file__).parent / "fixtures"
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+
+PARSERS = {
+    "saramin": ("saramin.html", lambda body: saramin.parse_page(body, "")),
+    "incruit": ("incruit.html", lambda body: incruit.parse_page(body, "")),
+    "linkedin": ("linkedin.html", lambda body: linkedin.parse_page(body, "")),
+    "jobkorea": ("jobkorea.html", lambda body: jobkorea.parse_page(body, "")),
+    "wanted": ("wanted.json", lambda body: wanted.parse_page(body, "")),
+    "remember": ("remember.json", lambda body: remember.parse_page(body, "")),
+    "rallit": ("rallit.json", lambda body: rallit.parse_page(body, "")),
+    "jumpit": ("jumpit.json", lambda body: jumpit.parse_page(body, "")),
+}
+
+
+def measure(fn, repeat: int) -> dict:
+    """best-of-repeat 실행 시간(ms), tracemalloc 기준 최대 메모리와 반환값이 차지하는 메모리(KiB)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        result = fn()
+        kept, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return {"ms": round(best * 1000, 3), "peak_kib": round(peak / 1024, 1), "kept_kib": round(kept / 1024, 1)}
+
+
+def _repeat_for(size: int, repeat: int) -> int:
+    # 큰 입력은 반복 횟수를 줄여 전체 실행 시간을 제한
+    return max(1, repeat if size <= 10_000 else 1)
+
+
+def bench_parse(repeat: int) -> dict:
+    report = {}
+    for site, (fixture, parse) in PARSERS.items():
+        body = (FIXTURES / fixture).read_text(encoding="utf-8")
+        report[f"parse/{site}"] = measure(lambda: parse(body), repeat * 10)
+    return report
+
+
+def bench_decode(postings: list, size: int, repeat: int) -> dict:
+    payload = json.dumps([asdict(p) for p in postings], ensure_ascii=False)
+    return {
+        f"decode/{size}": measure(
+            lambda: [saramin.JobPosting(**item) for item in json.loads(payload)], _repeat_for(size, repeat),
+        ),
+    }
+
+
+def bench_dedup(postings: list, size: int, repeat: int) -> dict:
+    return {f"dedup/{size}": measure(lambda: dedupe(postings), _repeat_for(size, repeat))}
+
+
+def bench_filter(postings: list, size: int, repeat: int) -> dict:
+    categories = list(load_categories())
+
+    def _all_categories():
+        for category_id in categories:
+            filter_postings(postings, category_id)
+
+    # 사용자 지정 키워드(핵심 키워드만 선택)
+    core_only = load_categories()["frontend"]["core_keywords"]
+    return {
+        f"filter/all_categories/{size}": measure(_all_categories, _repeat_for(size, repeat)),
+        f"filter/custom_keywords/{size}": measure(
+            lambda: filter_postings(postings, "frontend", location="서울", allowed_keywords=core_only),
+            _repeat_for(size, repeat),
+        ),
+    }
+
+
+def bench_refilter(postings: list, size: int, repeat: int) -> dict:
+    # 모든 공고가 frontend 제목 필터를 통과하도록 해 N개 전체를 재분류
+    index = KeywordIndex([replace(p, title=f"프론트엔드 {p.title}") for p in postings], "frontend")
+    core_only = load_categories()["frontend"]["core_keywords"]
+
+    def _refilter():
+        result = index.filter("서울", core_only)
+        return result.matched_count, result.excluded_count
+
+    return {f"refilter/{size}": measure(_refilter, _repeat_for(size, repeat) * 10)}
+
+
+def _filter_results(postings: list, seed: int = 0) -> list[FilterResult]:
+    rng = random.Random(seed)
+    return [
+        FilterResult(posting=p, matched=rng.random() < 0.6, matched_keywords=p.keywords, excluded_keywords=())
+        for p in postings
+    ]
+
+
+def bench_round_robin(results: list, size: int, repeat: int) -> dict:
+    matched = [r for r in results if r.matched]
+    return {
+        f"round_robin/{size}": measure(lambda: _round_robin(matched, len(results)), _repeat_for(size, repeat)),
+    }
+
+
+def bench_serialize(results: list, size: int, repeat: int) -> dict:
+    projection = ("title", "link", "source")
+    body = dumps([_to_dict(r) for r in results])
+    return {
+        f"serialize/{size}": measure(lambda: dumps([_to_dict(r) for r in results]), _repeat_for(size, repeat)),
+        f"serialize/fields/{size}": measure(
+            lambda: dumps([_to_dict(r, projection) for r in results]), _repeat_for(size, repeat),
+        ),
+        f"compress/gzip/{size}": measure(lambda: gzip_compress(body), _repeat_for(size, repeat)),
+    }
+
+
+CRAWL_PAGES = 3
+
+
+def _fixture_cassette(path: str, keyword: str) -> Cassette:
+    """crawl_handler 크롤러의 1 ~ CRAWL_PAGES 페이지 요청에 사이트별 저장 응답을 녹화한 카세트"""
+    cassette = Cassette(path)
+    for name, crawler in crawl_handler.CRAWLERS.items():
+        body = (FIXTURES / PARSERS[name][0]).read_text(encoding="utf-8")
+        for page in range(1, CRAWL_PAGES + 1):
+            cassette.put(request_key(crawler.page_request(keyword, page)), body)
+    return cassette
+
+
+def bench_crawl(repeat: int) -> dict:
+    keyword = "백엔드"
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cassette = _fixture_cassette(f"{tmp}/bench.jsonl.gz", keyword)
+
+        def _crawl():
+            crawl_cache.clear()
+            return _run_plan_threads(crawl_handler.crawl_plan(keyword, None, CRAWL_PAGES))
+
+        try:
+            for latency, jitter in ((0, 0), (50, 20)):
+                transport.configure("replay", cassette, latency_ms=latency, jitter_ms=jitter, seed=0)
+                report[f"crawl/replay/{latency}ms"] = measure(_crawl, repeat)
+        finally:
+            transport.configure("live")
+            crawl_cache.clear()
+    return report
+
+
+def run(sizes: list[int], repeat: int = 3) -> dict:
+    report = bench_parse(repeat)
+    report.update(bench_crawl(repeat))
+    for size in sizes:
+        postings = make_postings(size)
+        results = _filter_results(postings)
+        report.update(bench_decode(postings, size, repeat))
+        report.update(bench_dedup(postings, size, repeat))
+        report.update(bench_filter(postings, size, repeat))
+        report.update(bench_refilter(postings, size, repeat))
+        report.update(bench_round_robin(results, size, repeat))
+        report.update(bench_serialize(results, size, repeat))
+    return report
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list[str]:
+    """baseline 대비 max_regression배 이상 느려진 항목"""
+    regressions = []
+    for name, current in report.items():
+        base = baseline.get(name)
+        # 1ms 미만 항목은 측정 노이즈가 커서 제외
+        if not base or base["ms"] < 1:
+            continue
+        ratio = current["ms"] / base["ms"]
+        if ratio > max_regression:
+            regressions.append(f"{name}: {base['ms']:.2f}ms → {current['ms']:.2f}ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Job Finder 오프라인 벤치마크")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="합성 공고 수 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (best-of)")
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=1.5, help="허용 배율 (기본 1.5)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    report = run(sizes, args.repeat)
+
+    print(f"{'benchmark':<36}{'time':>14}{'peak mem':>16}{'kept mem':>16}")
+    for name, r in report.items():
+        print(f"{name:<36}{r['ms']:>11.3f} ms{r['peak_kib']:>12.1f} KiB{r['kept_kib']:>12.1f} KiB")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.max_regression)
+        if regressions:
+            print("\n성능 저하:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
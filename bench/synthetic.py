@@ -0,0 +1,62 @@
+"""벤치마크용 합성 공고 생성기
+
+job_categories.json 의 11개 직군 키워드(제목/핵심/보조)와 사이트 공통 태그, 범위 밖 기술을
+섞어 실제 크롤링 결과와 비슷한 분포의 JobPosting 목록을 만든다. seed가 같으면 결과도 같다.
+"""
+
+import random
+
+from backend.crawlers.saramin import JobPosting
+from backend.filter_engine import load_categories
+
+SOURCES = ["saramin", "wanted", "incruit", "linkedin", "remember", "rallit", "jumpit"]
+# 사이트별 비중 (사람인/점핏 결과가 많은 편)
+SOURCE_WEIGHTS = [30, 10, 20, 3, 15, 7, 15]
+
+COMPANIES = [
+    "(주)블루웨이브", "주식회사 코드랩", "넥스트스텝(주)", "한빛소프트웨어", "㈜모아데이터",
+    "스튜디오 오름", "Acme Korea", "(주)웹앤모바일", "테크노브릿지", "그린클라우드 주식회사",
+]
+CONDITIONS = [
+    ["서울 강남구", "경력 2~5년", "대졸↑", "정규직"],
+    ["서울 마포구", "신입", "학력무관", "계약직"],
+    ["경기 성남시", "경력무관", "초대졸↑", "정규직"],
+    ["Seoul, South Korea"],
+    ["부산 해운대구", "경력 3년↑"],
+    ["인천 연수구", "신입 · 경력", "정규직"],
+]
+# 직군과 무관한 키워드 (제외 판정 유발)
+NOISE_KEYWORDS = [
+    "웹개발", "서버개발", "정규직", "SI", "Excel", "PowerPoint", "영업", "CS", "Unity", "C#",
+    "SAP", "PLC", "AutoCAD", "마케팅", "회계", "Tableau", "Hadoop", "Spark", "MATLAB", "Salesforce",
+]
+
+
+def make_postings(n: int, seed: int = 0) -> list[JobPosting]:
+    """직군 11개에 고르게 분포한 합성 공고 n개"""
+    rng = random.Random(seed)
+    categories = list(load_categories().values())
+
+    postings = []
+    for i in range(n):
+        cat = categories[i % len(categories)]
+        title_kw = rng.choice(cat.get("title_keywords", [cat["name"]]))
+        # 일부는 제목 필터에서 걸러지도록 직군명이 없는 제목
+        title = f"{title_kw} 채용 ({i})" if rng.random() < 0.85 else f"사무직 채용 ({i})"
+
+        pool = cat["core_keywords"] + cat["auxiliary_keywords"]
+        keywords = rng.sample(pool, min(len(pool), rng.randint(0, 6)))
+        # 약 30%는 범위 밖 키워드 포함
+        if rng.random() < 0.3:
+            keywords += rng.sample(NOISE_KEYWORDS, rng.randint(1, 3))
+
+        source = rng.choices(SOURCES, SOURCE_WEIGHTS)[0]
+        postings.append(JobPosting(
+            company=rng.choice(COMPANIES),
+            title=title,
+            link=f"https://example.com/{source}/{i}",
+            conditions=list(rng.choice(CONDITIONS)),
+            keywords=keywords,
+            source=source,
+        ))
+    return postings